@@ -1,19 +1,19 @@
 import sys
 import os
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+from typing import List, Literal, Optional, Dict, Any
 import base64
 from io import BytesIO
 import re
+import json
 
 # Add the 'src' directory to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "src")))
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import Body, FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, ValidationError
 import asyncio
 import matplotlib.pyplot as plt
 from PIL import Image
@@ -24,7 +24,15 @@ from src.infrastructure.config.settings import setup_environment
 setup_environment()
 
 # Import the database initializer
-from src.infrastructure.persistence.database import init_db, get_db_connection
+from src.infrastructure.persistence.database import init_db, migrate_db, run_read
+from src.infrastructure.external_services.scraping.browser_pool import close_browser_pool
+from src.infrastructure.external_services.scraping.naver_blog_http import close_http_client
+from src.infrastructure.external_services.naver_search.naver_api_client import close_naver_http_client
+from src.infrastructure.external_services.naver_search.trend_store import get_trend_store
+from src.infrastructure.cache.blog_content_cache import get_blog_content_cache
+from src.infrastructure.llm_client import get_llm_client_stats, get_llm_response_cache
+from src.infrastructure.dynamic_scorer import get_lexicon_journal, close_lexicon_journal, get_phrase_score_stats
+from src.infrastructure.okt_tagger import get_okt_tagger
 
 # Import configurations and utilities
 from src.infrastructure.config.loader import (
@@ -46,7 +54,20 @@ from src.application.core.constants import (
 )
 
 # Import services and agents
-from src.application.services.festival_service import get_festival_details_by_title
+from src.application.services.festival_service import (
+    get_festival_details_by_title,
+    get_festivals_by_titles,
+)
+from src.application.services.festival_catalog import aget_festival_catalog, get_festival_catalog
+from src.application.services.spatial_index import get_spatial_index
+from src.application.services.job_manager import JobQueueFull, get_job_manager
+from src.application.services.precompute_service import (
+    PRECOMPUTE_INTERVAL_SECONDS,
+    PRECOMPUTE_RANKING_TTL_SECONDS,
+    PRECOMPUTE_REVIEW_SUMMARY_TTL_SECONDS,
+    PRECOMPUTE_SENTIMENT_TTL_SECONDS,
+    get_precompute_service,
+)
 from src.application.agents.precaution_agent import PrecautionAgent
 from src.application.supervisors.db_search_supervisor import db_search_graph
 from src.application.supervisors.course_validation_supervisor import (
@@ -61,7 +82,8 @@ from src.application.use_cases.ranking_use_case import RankingUseCase
 from src.application.use_cases.rendering_use_case import RenderingUseCase
 from src.application.services.course_service import get_course_details_by_title
 from src.application.services.facility_service import get_facility_details_by_title
-from src.infrastructure.reporting.wordclouds import create_sentiment_wordclouds
+from src.infrastructure.reporting.chart_renderer import close_chart_renderer, get_chart_renderer
+from src.infrastructure.reporting.wordclouds import aspect_word_frequencies, top_words
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -119,8 +141,14 @@ analysis_use_case = AnalysisUseCase(
 sentiment_analysis_use_case = SentimentAnalysisUseCase(
     naver_supervisor=naver_supervisor, script_dir=script_dir
 )
-ranking_use_case = RankingUseCase(naver_supervisor=naver_supervisor)
+precompute_service = get_precompute_service()
+ranking_use_case = RankingUseCase(
+    naver_supervisor=naver_supervisor, precompute=precompute_service
+)
 rendering_use_case = RenderingUseCase(df_split=DF_SPLIT, df_camera=DF_CAMERA)
+job_manager = get_job_manager()
+# In-server precompute scheduler (only when PRECOMPUTE_INTERVAL_SECONDS > 0)
+precompute_task: Optional[asyncio.Task] = None
 
 
 # Pydantic Models for Request/Response
@@ -152,11 +180,42 @@ class CourseValidationRequest(BaseModel):
     duration: str
 
 
+# How sentiment charts are returned:
+# - png: base64 PNG images plus the chart data
+# - data: chart data only (no matplotlib/WordCloud rendering; the frontend draws the charts)
+# - none: neither
+ChartMode = Literal["data", "png", "none"]
+CHART_IMAGE_FIELDS = (
+    "donut_chart",
+    "satisfaction_chart",
+    "wordcloud_positive",
+    "wordcloud_negative",
+    "absolute_chart",
+    "outlier_chart",
+)
+
+
+class SentimentJobRequest(BaseModel):
+    festival_name: str
+    num_reviews: int = Field(10, ge=1, le=50)
+    charts: ChartMode = "png"
+
+
+class ImagesJobRequest(BaseModel):
+    festival_name: str
+    num_blogs: int = Field(5, ge=1, le=20)
+
+
+class RenderJobRequest(BaseModel):
+    festival_name: str
+
+
 class NearbySearchRequest(BaseModel):
     latitude: float
     longitude: float
     radius: float
     current_festival_id: Optional[str] = None
+    top_k: Optional[int] = None
 
 
 class SentimentChartResponse(BaseModel):
@@ -171,6 +230,10 @@ class SentimentChartResponse(BaseModel):
     satisfaction_data: Optional[Dict[str, Any]] = None
     absolute_data: Optional[Dict[str, Any]] = None
     outlier_data: Optional[Dict[str, Any]] = None
+    # Word -> weight for rendering the wordclouds on the frontend
+    wordcloud_positive_data: Optional[Dict[str, float]] = None
+    wordcloud_negative_data: Optional[Dict[str, float]] = None
+
 
 
 class SentimentAnalysisResponse(BaseModel):
@@ -194,6 +257,9 @@ class SentimentAnalysisResponse(BaseModel):
 def fig_to_base64(fig):
     if fig is None:
         return None
+    if isinstance(fig, bytes):
+        # Already rendered PNG (ChartRenderer)
+        return base64.b64encode(fig).decode("utf-8")
     buf = BytesIO()
     if isinstance(fig, plt.Figure):
         fig.savefig(buf, format="png", bbox_inches="tight")
@@ -217,6 +283,10 @@ def fig_to_base64(fig):
 @app.on_event("startup")
 async def startup_event():
     """Initialize database on startup"""
+    global precompute_task
+    # Fork the chart rendering processes first, while this is still the only thread
+    # (before the lexicon journal flusher, executor threads, browsers and the JVM exist)
+    get_chart_renderer().start()
     # Auto-detect sibling database directory
     parent_dir = os.path.dirname(script_dir)
     default_database_path = os.path.join(parent_dir, "tour_agent_database")
@@ -225,15 +295,65 @@ async def startup_event():
     db_path = os.path.join(DATABASE_PATH, "tour.db")
     if not os.path.exists(db_path):
         init_db()
+    else:
+        # Existing databases only get the pending schema migrations (indexes, R*Tree)
+        migrate_db()
+    # Build the in-memory search indexes up front so the first requests are already warm
+    get_festival_catalog()
+    get_spatial_index()
+    # Start syncing learned lexicon entries (including other workers') right away
+    get_lexicon_journal()
+    await job_manager.start()
+    if PRECOMPUTE_INTERVAL_SECONDS > 0:
+        precompute_task = asyncio.create_task(
+            precompute_service.run_forever(PRECOMPUTE_INTERVAL_SECONDS)
+        )
+        print(f"[Precompute] 일괄 사전 계산 스케줄러 시작 ({PRECOMPUTE_INTERVAL_SECONDS:.0f}초 간격)")
     print(f"✅ FestMoment API Server Started (Database: {DATABASE_PATH})")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop background jobs, release the shared scraping browser and HTTP clients, and flush learned lexicon entries"""
+    if precompute_task is not None:
+        precompute_task.cancel()
+        await asyncio.gather(precompute_task, return_exceptions=True)
+    await job_manager.stop()
+    await close_browser_pool()
+    await close_http_client()
+    await close_naver_http_client()
+    await asyncio.to_thread(close_lexicon_journal)
+    await asyncio.to_thread(precompute_service.store.close)
+    await asyncio.to_thread(close_chart_renderer)
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
     return {"status": "ok", "service": "FestMoment API", "version": "1.0.0"}
 
 
+@app.get("/api/stats")
+async def get_stats():
+    """Runtime statistics for the shared LLM clients and caches"""
+
+    def collect():
+        return {
+            "llm_clients": get_llm_client_stats(),
+            "llm_response_cache": get_llm_response_cache().stats(),
+            "blog_content_cache": get_blog_content_cache().stats(),
+            "trend_store": get_trend_store().stats(),
+            "lexicon_journal": get_lexicon_journal().stats(),
+            "okt_tagger": get_okt_tagger().stats(),
+            "phrase_scores": get_phrase_score_stats(),
+            "jobs": job_manager.stats(),
+            "precompute": precompute_service.stats(),
+            "chart_renderer": get_chart_renderer().stats(),
+        }
+
+    return await asyncio.to_thread(collect)
+
+
 @app.get("/api/config/areas")
 async def get_areas():
     """Get all available areas"""
@@ -284,35 +404,15 @@ async def get_small_categories(
 async def search_festivals(request: SearchRequest):
     """Search festivals with filters"""
     try:
-        # Use db_search_graph
-        state = {
-            "search_type": "festival_search",
-            "area": request.area,
-            "sigungu": request.sigungu,
-            "main_cat": request.main_cat,
-            "medium_cat": request.medium_cat,
-            "small_cat": request.small_cat,
-            "results": None,
-        }
-
-        result_state = db_search_graph.invoke(state)
-        results = result_state.get("results", [])
-
-        # Filter by status if needed
-        if request.status != "전체":
-            today = datetime.now().strftime("%Y%m%d")
-            filtered = []
-            for title, image, start_date, end_date in results:
-                if request.status == "축제 진행중":
-                    if start_date and end_date and start_date <= today <= end_date:
-                        filtered.append((title, image, start_date, end_date))
-                elif request.status == "진행 예정":
-                    if start_date and start_date > today:
-                        filtered.append((title, image, start_date, end_date))
-                elif request.status == "종료된 축제":
-                    if end_date and end_date < today:
-                        filtered.append((title, image, start_date, end_date))
-            results = filtered
+        # Filtered results come pre-sorted from the in-memory catalog index
+        results = (await aget_festival_catalog()).search(
+            area=request.area,
+            sigungu=request.sigungu,
+            main_cat=request.main_cat,
+            medium_cat=request.medium_cat,
+            small_cat=request.small_cat,
+            status=request.status,
+        )
 
         # Pagination
         total = len(results)
@@ -345,7 +445,7 @@ async def search_festivals(request: SearchRequest):
 async def get_festival_details(festival_name: str):
     """Get detailed information for a specific festival"""
     try:
-        details = get_festival_details_by_title(festival_name)
+        details = await run_read(get_festival_details_by_title, festival_name)
         if not details:
             raise HTTPException(status_code=404, detail="Festival not found")
 
@@ -368,7 +468,7 @@ async def get_festival_details(festival_name: str):
 async def get_course_details(course_title: str):
     """Get detailed information for a specific course"""
     try:
-        details = get_course_details_by_title(course_title)
+        details = await run_read(get_course_details_by_title, course_title)
         if not details:
             raise HTTPException(status_code=404, detail="Course not found")
         return {"details": details}
@@ -382,7 +482,7 @@ async def get_course_details(course_title: str):
 async def get_facility_details(facility_title: str):
     """Get detailed information for a specific facility"""
     try:
-        details = get_facility_details_by_title(facility_title)
+        details = await run_read(get_facility_details_by_title, facility_title)
         if not details:
             raise HTTPException(status_code=404, detail="Facility not found")
         return {"details": details}
@@ -428,120 +528,195 @@ async def get_festival_trend(festival_name: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get(
-    "/api/festivals/{festival_name}/sentiment", response_model=SentimentAnalysisResponse
-)
-async def get_sentiment_analysis(
-    festival_name: str, num_reviews: int = Query(10, ge=1, le=50)
-):
-    """Get sentiment analysis for a festival"""
-    try:
-        result = await sentiment_analysis_use_case.analyze_sentiment(
-            festival_name, num_reviews
-        )
+async def run_sentiment_analysis(
+    festival_name: str, num_reviews: int, progress=None, charts: ChartMode = "png"
+) -> SentimentAnalysisResponse:
+    on_blog = None
+    if progress:
+        # Blog analysis is most of the work; rendering and summaries take the rest
+        def on_blog(event):
+            done = event["provisional"]["blog_count"]
+            progress(0.9 * done / num_reviews, desc=f"블로그 분석 중 ({done}/{num_reviews})")
 
-        # --- Wordcloud Masking Logic ---
-        mask_path = None
-        info = FESTIVAL_INFO_LOOKUP.get(festival_name)
-
-        print(f"[WordCloud] Festival: {festival_name}")
-        print(f"[WordCloud] Info found: {info is not None}")
+    result = await sentiment_analysis_use_case.analyze_sentiment(
+        festival_name, num_reviews, on_blog=on_blog
+    )
+    if progress:
+        progress(0.9, desc="차트 및 요약 생성 중")
+    return await build_sentiment_response(festival_name, result, charts=charts)
+
+
+def select_chart_mode(response: dict, charts: ChartMode) -> dict:
+    """Reduce a charts=png sentiment response (dict) to the requested chart mode"""
+    if charts == "png":
+        return response
+    response = dict(response)
+    if charts == "none":
+        response["charts"] = SentimentChartResponse().model_dump()
+    else:
+        response["charts"] = {
+            **response["charts"],
+            **{field: None for field in CHART_IMAGE_FIELDS},
+        }
+    return response
 
-        if info:
-            print(f"[WordCloud] Info keys: {list(info.keys())}")
-            eventstartdate = info.get("eventstartdate")
-            print(f"[WordCloud] eventstartdate: {eventstartdate}")
 
-            if eventstartdate:
-                try:
-                    start_date_str = str(eventstartdate)
-                    print(f"[WordCloud] start_date_str: {start_date_str}")
-                    month = int(start_date_str[4:6])
-                    print(f"[WordCloud] Month: {month}")
-
-                    if 3 <= month <= 5:
-                        mask_filename = "mask_spring.png"
-                    elif 6 <= month <= 8:
-                        mask_filename = "mask_summer.png"
-                    elif 9 <= month <= 11:
-                        mask_filename = "mask_fall.png"
-                    else: # 12, 1, 2
-                        mask_filename = "mask_winter.png"
-
-                    print(f"[WordCloud] Selected mask: {mask_filename}")
-                    potential_path = os.path.join(DATABASE_PATH, "assets", "seasons", mask_filename)
-                    print(f"[WordCloud] Checking path: {potential_path}")
-
-                    if os.path.exists(potential_path):
-                        mask_path = potential_path
-                        print(f"[WordCloud] ✓ Using mask: {mask_path}")
-                    else:
-                        print(f"[WordCloud] ✗ Mask not found at: {potential_path}")
-
-                except (ValueError, IndexError) as e:
-                    print(f"[WordCloud] Error parsing date: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    mask_path = None
-            else:
-                print(f"[WordCloud] No eventstartdate in info")
+async def get_precomputed_sentiment(
+    festival_name: str, num_reviews: int, charts: ChartMode = "png", progress=None
+) -> dict:
+    """Serve a sentiment analysis from the precomputed results, computing it only when missing or stale"""
+    if charts != "png":
+        # A fresh png result carries the chart data as well; serve it without the images
+        cached = await precompute_service.get_fresh(
+            "sentiment", festival_name, {"num_reviews": num_reviews, "charts": "png"}
+        )
+        if cached is not None:
+            return select_chart_mode(cached, charts)
+    response = await precompute_service.get_or_compute(
+        "sentiment",
+        festival_name,
+        {"num_reviews": num_reviews, "charts": "png" if charts == "png" else "data"},
+        progress=progress,
+    )
+    return select_chart_mode(response, charts)
+
+
+def get_wordcloud_mask_path(festival_name: str) -> Optional[str]:
+    """Pick the seasonal wordcloud mask from the festival's start month"""
+    mask_path = None
+    info = FESTIVAL_INFO_LOOKUP.get(festival_name)
+
+    print(f"[WordCloud] Festival: {festival_name}")
+    print(f"[WordCloud] Info found: {info is not None}")
+
+    if info:
+        print(f"[WordCloud] Info keys: {list(info.keys())}")
+        eventstartdate = info.get("eventstartdate")
+        print(f"[WordCloud] eventstartdate: {eventstartdate}")
+
+        if eventstartdate:
+            try:
+                start_date_str = str(eventstartdate)
+                print(f"[WordCloud] start_date_str: {start_date_str}")
+                month = int(start_date_str[4:6])
+                print(f"[WordCloud] Month: {month}")
+
+                if 3 <= month <= 5:
+                    mask_filename = "mask_spring.png"
+                elif 6 <= month <= 8:
+                    mask_filename = "mask_summer.png"
+                elif 9 <= month <= 11:
+                    mask_filename = "mask_fall.png"
+                else: # 12, 1, 2
+                    mask_filename = "mask_winter.png"
+
+                print(f"[WordCloud] Selected mask: {mask_filename}")
+                potential_path = os.path.join(DATABASE_PATH, "assets", "seasons", mask_filename)
+                print(f"[WordCloud] Checking path: {potential_path}")
+
+                if os.path.exists(potential_path):
+                    mask_path = potential_path
+                    print(f"[WordCloud] ✓ Using mask: {mask_path}")
+                else:
+                    print(f"[WordCloud] ✗ Mask not found at: {potential_path}")
+
+            except (ValueError, IndexError) as e:
+                print(f"[WordCloud] Error parsing date: {e}")
+                import traceback
+                traceback.print_exc()
+                mask_path = None
         else:
-            print(f"[WordCloud] Festival not found in FESTIVAL_INFO_LOOKUP")
-
-        print(f"[WordCloud] Calling create_sentiment_wordclouds with mask_path: {mask_path}")
-        pos_wordcloud, neg_wordcloud = create_sentiment_wordclouds(
-            result["all_aspect_sentiment_pairs"], festival_name, mask_path=mask_path
+            print(f"[WordCloud] No eventstartdate in info")
+    else:
+        print(f"[WordCloud] Festival not found in FESTIVAL_INFO_LOOKUP")
+    return mask_path
+
+
+async def build_sentiment_response(
+    festival_name: str, result: dict, charts: ChartMode = "png"
+) -> SentimentAnalysisResponse:
+    """Build the response for a sentiment analysis result; chart images are rendered only for charts="png" """
+    chart_response = SentimentChartResponse()
+    if charts != "none":
+        positive_words, negative_words = aspect_word_frequencies(
+            result["all_aspect_sentiment_pairs"], festival_name
+        )
+        chart_response = SentimentChartResponse(
+            # Add chart data for frontend rendering
+            donut_data=result.get("donut_data"),
+            satisfaction_data=result.get("satisfaction_data"),
+            absolute_data=result.get("absolute_data"),
+            outlier_data=result.get("outlier_data"),
+            wordcloud_positive_data=top_words(positive_words),
+            wordcloud_negative_data=top_words(negative_words),
         )
-        print(f"[WordCloud] Wordclouds generated successfully")
 
-        # Extract counts from the summary text
-        summary_text = result.get("overall_summary_text", "")
-        pos_match = re.search(r"긍정 문장 수: (\d+)", summary_text)
-        neg_match = re.search(r"부정 문장 수: (\d+)", summary_text)
-
-        positive_count = int(pos_match.group(1)) if pos_match else 0
-        negative_count = int(neg_match.group(1)) if neg_match else 0
-
-        # Convert full DataFrame to list of dicts for the response
-        blog_results = []
-        if "blog_df" in result and not result["blog_df"].empty:
-            # Replace NaN with None for JSON compatibility
-            df_cleaned = result["blog_df"].replace({float('nan'): None})
-            blog_results = df_cleaned.to_dict(orient="records")
-
-        # Create outlier description like archive_gradio
-        outlier_description = None
-        if result.get("total_score_count") and result.get("outlier_count") is not None:
-            outlier_description = f"총 **{result['total_score_count']}**개의 감성 점수 중 **{result['outlier_count']}**개의 이상치가 발견되었습니다."
-
-        return SentimentAnalysisResponse(
-            summary=result.get("distribution_description", "요약 정보 없음"),
-            positive_count=positive_count,
-            negative_count=negative_count,
-            neutral_count=0,  # Neutral count is not explicitly calculated in the use case
-            charts=SentimentChartResponse(
-                donut_chart=fig_to_base64(result.get("overall_chart")),
-                satisfaction_chart=fig_to_base64(result.get("distribution_chart")),
-                wordcloud_positive=fig_to_base64(pos_wordcloud),
-                wordcloud_negative=fig_to_base64(neg_wordcloud),
-                absolute_chart=fig_to_base64(result.get("absolute_chart")),
-                outlier_chart=fig_to_base64(result.get("outlier_chart")),
-                # Add chart data for frontend rendering
-                donut_data=result.get("donut_data"),
-                satisfaction_data=result.get("satisfaction_data"),
-                absolute_data=result.get("absolute_data"),
-                outlier_data=result.get("outlier_data"),
+    if charts == "png":
+        mask_path = get_wordcloud_mask_path(festival_name)
+        print(f"[WordCloud] Rendering sentiment wordclouds with mask_path: {mask_path}")
+        (pos_wordcloud, neg_wordcloud), chart_pngs = await asyncio.gather(
+            get_chart_renderer().render_wordclouds(
+                result["all_aspect_sentiment_pairs"], festival_name, mask_path=mask_path
             ),
-            blog_results=blog_results,
-            blog_list_csv_path=result.get("blog_list_csv_path"),
-            positive_keywords=result.get("positive_keywords_html"),
-            negative_summary=result.get("neg_summary_text"),
-            outlier_description=outlier_description,
-            total_score_count=result.get("total_score_count"),
-            outlier_count=result.get("outlier_count"),
-            blog_judgments_list=result.get("blog_judgments_list"),
-            overall_summary_text=result.get("overall_summary_text"),
+            sentiment_analysis_use_case.render_charts(festival_name, result),
         )
+        print(f"[WordCloud] Wordclouds generated successfully")
+        chart_response.donut_chart = fig_to_base64(chart_pngs["overall_chart"])
+        chart_response.satisfaction_chart = fig_to_base64(chart_pngs["distribution_chart"])
+        chart_response.wordcloud_positive = fig_to_base64(pos_wordcloud)
+        chart_response.wordcloud_negative = fig_to_base64(neg_wordcloud)
+        chart_response.absolute_chart = fig_to_base64(chart_pngs["absolute_chart"])
+        chart_response.outlier_chart = fig_to_base64(chart_pngs["outlier_chart"])
+
+    # Extract counts from the summary text
+    summary_text = result.get("overall_summary_text", "")
+    pos_match = re.search(r"긍정 문장 수: (\d+)", summary_text)
+    neg_match = re.search(r"부정 문장 수: (\d+)", summary_text)
+
+    positive_count = int(pos_match.group(1)) if pos_match else 0
+    negative_count = int(neg_match.group(1)) if neg_match else 0
+
+    # Convert full DataFrame to list of dicts for the response
+    blog_results = []
+    if "blog_df" in result and not result["blog_df"].empty:
+        # Replace NaN with None for JSON compatibility
+        df_cleaned = result["blog_df"].replace({float('nan'): None})
+        blog_results = df_cleaned.to_dict(orient="records")
+
+    # Create outlier description like archive_gradio
+    outlier_description = None
+    if result.get("total_score_count") and result.get("outlier_count") is not None:
+        outlier_description = f"총 **{result['total_score_count']}**개의 감성 점수 중 **{result['outlier_count']}**개의 이상치가 발견되었습니다."
+
+    return SentimentAnalysisResponse(
+        summary=result.get("distribution_description", "요약 정보 없음"),
+        positive_count=positive_count,
+        negative_count=negative_count,
+        neutral_count=0,  # Neutral count is not explicitly calculated in the use case
+        charts=chart_response,
+        blog_results=blog_results,
+        blog_list_csv_path=result.get("blog_list_csv_path"),
+        positive_keywords=result.get("positive_keywords_html"),
+        negative_summary=result.get("neg_summary_text"),
+        outlier_description=outlier_description,
+        total_score_count=result.get("total_score_count"),
+        outlier_count=result.get("outlier_count"),
+        blog_judgments_list=result.get("blog_judgments_list"),
+        overall_summary_text=result.get("overall_summary_text"),
+    )
+
+
+@app.get(
+    "/api/festivals/{festival_name}/sentiment", response_model=SentimentAnalysisResponse
+)
+async def get_sentiment_analysis(
+    festival_name: str,
+    num_reviews: int = Query(10, ge=1, le=50),
+    charts: ChartMode = Query("png", description="png: images + chart data, data: chart data only, none: no charts"),
+):
+    """Get sentiment analysis for a festival (served from the precomputed results while fresh)"""
+    try:
+        return await get_precomputed_sentiment(festival_name, num_reviews, charts)
     except Exception as e:
         import traceback
 
@@ -549,18 +724,96 @@ async def get_sentiment_analysis(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# Interval for SSE keep-alive comments while the analysis is between events
+SSE_HEARTBEAT_SECONDS = float(os.getenv("SSE_HEARTBEAT_SECONDS", "15"))
+
+
+def _sse_event(event: str, data) -> str:
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+@app.get("/api/festivals/{festival_name}/sentiment/stream")
+async def stream_sentiment_analysis(
+    festival_name: str,
+    num_reviews: int = Query(10, ge=1, le=50),
+    charts: ChartMode = Query("png", description="png: images + chart data, data: chart data only, none: no charts"),
+):
+    """
+    Stream sentiment analysis for a festival as server-sent events:
+    - `start`: accepted request
+    - `blog`: one per analyzed blog (judgments, summary row, provisional counts)
+    - `charts`: rendered charts and/or chart data, once all blogs are analyzed (not sent for charts=none)
+    - `summary`: final counts and LLM summaries (same fields as the non-streaming endpoint)
+    - `error` / `done`: end of stream
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def run():
+        try:
+            result = await sentiment_analysis_use_case.analyze_sentiment(
+                festival_name,
+                num_reviews,
+                on_blog=lambda event: queue.put_nowait(("blog", event)),
+            )
+            response = await build_sentiment_response(festival_name, result, charts=charts)
+            if charts != "none":
+                queue.put_nowait(("charts", response.charts.model_dump()))
+            queue.put_nowait(("summary", response.model_dump(exclude={"charts"})))
+            queue.put_nowait(("done", {}))
+        except Exception as e:
+            import traceback
+
+            traceback.print_exc()
+            queue.put_nowait(("error", {"detail": str(e)}))
+        finally:
+            queue.put_nowait(None)
+
+    async def events():
+        task = asyncio.create_task(run())
+        try:
+            yield _sse_event(
+                "start",
+                {"festival_name": festival_name, "num_reviews": num_reviews, "charts": charts},
+            )
+            while True:
+                try:
+                    item = await asyncio.wait_for(queue.get(), SSE_HEARTBEAT_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if item is None:
+                    break
+                yield _sse_event(*item)
+        finally:
+            # Client went away: stop the analysis instead of finishing it for nobody
+            if not task.done():
+                task.cancel()
+                await asyncio.gather(task, return_exceptions=True)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def run_image_scrape(festival_name: str, num_blogs: int) -> dict:
+    local_image_paths, _ = await analysis_use_case.scrape_festival_images(
+        festival_name, num_blogs
+    )
+    # Convert local paths to server-relative URLs
+    server_urls = [
+        f"/api/temp_img/{os.path.basename(p)}" for p in local_image_paths
+    ]
+    return {"image_urls": server_urls}
+
+
 @app.get("/api/festivals/{festival_name}/images")
 async def scrape_images(festival_name: str, num_blogs: int = Query(5, ge=1, le=20)):
     """Scrape images from Naver blogs for a festival"""
     try:
-        local_image_paths, _ = await analysis_use_case.scrape_festival_images(
-            festival_name, num_blogs
-        )
-        # Convert local paths to server-relative URLs
-        server_urls = [
-            f"/api/temp_img/{os.path.basename(p)}" for p in local_image_paths
-        ]
-        return {"image_urls": server_urls}
+        return await run_image_scrape(festival_name, num_blogs)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -588,12 +841,11 @@ async def get_wordcloud(festival_name: str, num_reviews: int = Query(20, ge=1, l
 async def get_review_summary(
     festival_name: str, num_reviews: int = Query(5, ge=1, le=50)
 ):
-    """Get an AI-generated summary of Naver blog reviews"""
+    """Get an AI-generated summary of Naver blog reviews (served from the precomputed results while fresh)"""
     try:
-        summary, _ = await naver_supervisor.get_review_summary_and_tips(
-            festival_name, num_reviews=num_reviews
+        return await precompute_service.get_or_compute(
+            "review_summary", festival_name, {"num_reviews": num_reviews}
         )
-        return {"summary": summary}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -636,39 +888,26 @@ async def get_precautions(festival_name: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def run_festival_ranking(request: RankingRequest, progress=None) -> dict:
+    # Fetch full festival details from database for all festival names in one query
+    festivals_data = await run_read(get_festivals_by_titles, request.festivals)
+
+    if not festivals_data:
+        raise HTTPException(
+            status_code=404, detail="선택한 축제를 찾을 수 없습니다"
+        )
+
+    ranked_festivals, analysis = await ranking_use_case.rank_festivals(
+        festivals_data, request.num_reviews, request.top_n, progress=progress
+    )
+    return {"ranked_festivals": ranked_festivals, "analysis": analysis}
+
+
 @app.post("/api/festivals/ranking")
 async def rank_festivals(request: RankingRequest):
     """Rank selected festivals based on sentiment and trend analysis"""
     try:
-        # Fetch full festival details from database for each festival name
-        conn = get_db_connection()
-        cursor = conn.cursor()
-
-        festivals_data = []
-        for festival_name in request.festivals:
-            cursor.execute(
-                """
-                SELECT * FROM festivals WHERE title = ?
-            """,
-                (festival_name,),
-            )
-            row = cursor.fetchone()
-            if row:
-                # Convert sqlite3.Row to dict
-                festival_dict = {key: row[key] for key in row.keys()}
-                festivals_data.append(festival_dict)
-
-        conn.close()
-
-        if not festivals_data:
-            raise HTTPException(
-                status_code=404, detail="선택한 축제를 찾을 수 없습니다"
-            )
-
-        ranked_festivals, analysis = await ranking_use_case.rank_festivals(
-            festivals_data, request.num_reviews, request.top_n
-        )
-        return {"ranked_festivals": ranked_festivals, "analysis": analysis}
+        return await run_festival_ranking(request)
     except Exception as e:
         import traceback
 
@@ -677,56 +916,61 @@ async def rank_festivals(request: RankingRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/festivals/{festival_name}/render")
-async def render_festival_image(festival_name: str):
-    """Generate AI-rendered image for a festival"""
-    try:
-        print(f"[Rendering] Requested for: '{festival_name}'")
+async def run_festival_rendering(festival_name: str, progress=None) -> dict:
+    print(f"[Rendering] Requested for: '{festival_name}'")
 
-        # 1. Get festival details
-        details = get_festival_details_by_title(festival_name)
-        if not details:
-            raise HTTPException(status_code=404, detail="Festival not found")
-
-        # 2. Call the rendering use case
-        generated_paths = await rendering_use_case.generate_festival_renderings(details)
-        
-        # 3. Process representative image
-        representative_image = None
-        rep_path = generated_paths.get("representative")
-        if rep_path and os.path.exists(rep_path):
-            representative_image = {
-                "image_base64": fig_to_base64(rep_path),
-                "prompt": f"AI-generated representative rendering of the '{festival_name}' festival."
-            }
-            print(f"[Rendering] Success! Representative image generated at {rep_path}")
-
-        # 4. Process conditional images
-        conditional_images = []
-        cond_paths = generated_paths.get("conditional", [])
-        for i, cond_path in enumerate(cond_paths):
-            if cond_path and os.path.exists(cond_path):
-                # Extract condition name from filename, e.g., "조건_1_야간_취식_aerial.png" -> "야간_취식"
-                filename = os.path.basename(cond_path)
-                parts = filename.split('_')
-                prompt_info = "conditional scene"
-                if len(parts) > 2:
-                    prompt_info = " ".join(parts[2:-1]) # Get the parts between index and angle
-
-                conditional_images.append({
-                    "image_base64": fig_to_base64(cond_path),
-                    "prompt": f"Conditional rendering for '{prompt_info}' at the '{festival_name}' festival."
-                })
-                print(f"[Rendering] Success! Conditional image {i+1} generated at {cond_path}")
-
-        if not representative_image and not conditional_images:
-             raise HTTPException(status_code=500, detail="Failed to generate any images.")
+    # 1. Get festival details
+    details = await run_read(get_festival_details_by_title, festival_name)
+    if not details:
+        raise HTTPException(status_code=404, detail="Festival not found")
 
-        return {
-            "representative_image": representative_image,
-            "conditional_images": conditional_images
+    # 2. Call the rendering use case
+    generated_paths = await rendering_use_case.generate_festival_renderings(
+        details, progress=progress
+    )
+    
+    # 3. Process representative image
+    representative_image = None
+    rep_path = generated_paths.get("representative")
+    if rep_path and os.path.exists(rep_path):
+        representative_image = {
+            "image_base64": fig_to_base64(rep_path),
+            "prompt": f"AI-generated representative rendering of the '{festival_name}' festival."
         }
+        print(f"[Rendering] Success! Representative image generated at {rep_path}")
+
+    # 4. Process conditional images
+    conditional_images = []
+    cond_paths = generated_paths.get("conditional", [])
+    for i, cond_path in enumerate(cond_paths):
+        if cond_path and os.path.exists(cond_path):
+            # Extract condition name from filename, e.g., "조건_1_야간_취식_aerial.png" -> "야간_취식"
+            filename = os.path.basename(cond_path)
+            parts = filename.split('_')
+            prompt_info = "conditional scene"
+            if len(parts) > 2:
+                prompt_info = " ".join(parts[2:-1]) # Get the parts between index and angle
+
+            conditional_images.append({
+                "image_base64": fig_to_base64(cond_path),
+                "prompt": f"Conditional rendering for '{prompt_info}' at the '{festival_name}' festival."
+            })
+            print(f"[Rendering] Success! Conditional image {i+1} generated at {cond_path}")
+
+    if not representative_image and not conditional_images:
+        raise HTTPException(status_code=500, detail="Failed to generate any images.")
+
+    return {
+        "representative_image": representative_image,
+        "conditional_images": conditional_images
+    }
+
 
+@app.post("/api/festivals/{festival_name}/render")
+async def render_festival_image(festival_name: str):
+    """Generate AI-rendered image for a festival"""
+    try:
+        return await run_festival_rendering(festival_name)
     except Exception as e:
         print(f"[Rendering] ERROR: {str(e)}")
         import traceback
@@ -734,19 +978,23 @@ async def render_festival_image(festival_name: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def run_course_validation(request: CourseValidationRequest) -> dict:
+    state = {
+        "course": request.course,
+        "duration": request.duration,
+        "validation_result": "",
+    }
+
+    result_state = course_validation_graph.invoke(state)
+
+    return {"validation_result": result_state.get("validation_result", "")}
+
+
 @app.post("/api/course/validate")
 async def validate_course(request: CourseValidationRequest):
     """Validate and optimize a travel course"""
     try:
-        state = {
-            "course": request.course,
-            "duration": request.duration,
-            "validation_result": "",
-        }
-
-        result_state = course_validation_graph.invoke(state)
-
-        return {"validation_result": result_state.get("validation_result", "")}
+        return run_course_validation(request)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -761,12 +1009,14 @@ async def search_nearby(request: NearbySearchRequest):
             "longitude": request.longitude,
             "radius": request.radius,
             "current_festival_id": request.current_festival_id,
+            "top_k": request.top_k,
             "recommended_facilities": None,
             "recommended_courses": None,
             "recommended_festivals": None,
         }
 
-        result_state = db_search_graph.invoke(state)
+        # Off the event loop: the spatial index may be rebuilt when tour.db was reloaded
+        result_state = await asyncio.to_thread(db_search_graph.invoke, state)
 
         return {
             "facilities": result_state.get("recommended_facilities", []),
@@ -777,6 +1027,155 @@ async def search_nearby(request: NearbySearchRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+# --- Precomputed results -----------------------------------------------------
+# Sentiment analyses, ranking component scores and review summaries are computed
+# offline for every festival in tour.db (`python api_server.py precompute`) and served
+# from tour.db while fresh; a missing or stale entry is computed on demand and stored.
+
+
+async def _precompute_sentiment(festival_name: str, params: dict, progress):
+    response = await run_sentiment_analysis(
+        festival_name,
+        params["num_reviews"],
+        progress=progress,
+        charts=params.get("charts", "png"),
+    )
+    return response.model_dump()
+
+
+async def _precompute_review_summary(festival_name: str, params: dict, progress):
+    summary, _ = await naver_supervisor.get_review_summary_and_tips(
+        festival_name, num_reviews=params["num_reviews"]
+    )
+    return {"summary": summary}
+
+
+async def _precompute_ranking_components(festival_name: str, params: dict, progress):
+    return await ranking_use_case.compute_festival_components(
+        festival_name, params["num_reviews"]
+    )
+
+
+# Defaults match the endpoints' default query parameters, so the common request hits the batch results
+precompute_service.register(
+    "sentiment",
+    _precompute_sentiment,
+    PRECOMPUTE_SENTIMENT_TTL_SECONDS,
+    # png results also serve charts=data/none requests
+    {"num_reviews": 10, "charts": "png"},
+)
+precompute_service.register(
+    "ranking_components",
+    _precompute_ranking_components,
+    PRECOMPUTE_RANKING_TTL_SECONDS,
+    {"num_reviews": 10},
+)
+precompute_service.register(
+    "review_summary",
+    _precompute_review_summary,
+    PRECOMPUTE_REVIEW_SUMMARY_TTL_SECONDS,
+    {"num_reviews": 5},
+)
+
+
+# --- Background jobs ---------------------------------------------------------
+# Long-running analyses can be submitted as jobs: the request returns a job ID at once,
+# a bounded worker pool runs the work, and the status/result endpoints serve it later.
+
+
+async def _sentiment_job(request: SentimentJobRequest, progress):
+    return await get_precomputed_sentiment(
+        request.festival_name, request.num_reviews, request.charts, progress=progress
+    )
+
+
+async def _images_job(request: ImagesJobRequest, progress):
+    return await run_image_scrape(request.festival_name, request.num_blogs)
+
+
+async def _ranking_job(request: RankingRequest, progress):
+    return await run_festival_ranking(request, progress=progress)
+
+
+async def _render_job(request: RenderJobRequest, progress):
+    return await run_festival_rendering(request.festival_name, progress=progress)
+
+
+async def _course_validation_job(request: CourseValidationRequest, progress):
+    # The validation graph is synchronous; keep it off the event loop
+    return await asyncio.to_thread(run_course_validation, request)
+
+
+# kind -> (request model, handler)
+JOB_KINDS = {
+    "sentiment": (SentimentJobRequest, _sentiment_job),
+    "images": (ImagesJobRequest, _images_job),
+    "ranking": (RankingRequest, _ranking_job),
+    "render": (RenderJobRequest, _render_job),
+    "course-validation": (CourseValidationRequest, _course_validation_job),
+}
+
+
+def _register_job_kind(kind: str, model, handler):
+    async def run(params: dict, progress):
+        return await handler(model(**params), progress)
+
+    job_manager.register(kind, run)
+
+
+for _kind, (_model, _handler) in JOB_KINDS.items():
+    _register_job_kind(_kind, _model, _handler)
+
+
+@app.post("/api/jobs/{kind}", status_code=202)
+async def submit_job(kind: str, params: Dict[str, Any] = Body(default_factory=dict)):
+    """Submit a long-running analysis as a background job and return its job ID"""
+    if kind not in JOB_KINDS:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown job kind '{kind}'. Available: {', '.join(JOB_KINDS)}",
+        )
+    model, _ = JOB_KINDS[kind]
+    try:
+        request = model(**params)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=json.loads(e.json()))
+
+    try:
+        job = await job_manager.submit(kind, request.model_dump())
+    except JobQueueFull as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    job["status_url"] = f"/api/jobs/{job['job_id']}"
+    job["result_url"] = f"/api/jobs/{job['job_id']}/result"
+    return job
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job_status(job_id: str):
+    """Get the status and progress of a background job"""
+    job = await job_manager.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+@app.get("/api/jobs/{job_id}/result")
+async def get_job_result(job_id: str):
+    """Get the result of a finished job (same shape as the synchronous endpoint's response)"""
+    job = await job_manager.get(job_id, include_result=True)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job["status"] == "failed":
+        raise HTTPException(status_code=500, detail=job["error"])
+    if job["status"] != "succeeded":
+        raise HTTPException(
+            status_code=409,
+            detail=f"Job is not finished yet (status: {job['status']}, progress: {job['progress']:.0%})",
+        )
+    return job["result"]
+
+
 @app.get("/api/assets/{asset_type}/{filename}")
 async def get_asset(asset_type: str, filename: str):
     """Serve local asset files (icons, images)"""
@@ -816,7 +1215,56 @@ def get_local_best_image_path(festival_name: str) -> Optional[str]:
     return None
 
 
+async def run_precompute_cli(kinds: Optional[List[str]], limit: Optional[int], force: bool, every: float):
+    """Run the catalog-wide precompute once (or every `every` seconds) outside the API server"""
+    get_chart_renderer().start()
+    migrate_db()
+    get_lexicon_journal()
+    try:
+        if every > 0:
+            await precompute_service.run_forever(every, kinds=kinds, limit=limit, force=force)
+        else:
+            await precompute_service.run(kinds=kinds, limit=limit, force=force)
+    finally:
+        await close_browser_pool()
+        await close_http_client()
+        await close_naver_http_client()
+        await asyncio.to_thread(close_lexicon_journal)
+        await asyncio.to_thread(precompute_service.store.close)
+        await asyncio.to_thread(close_chart_renderer)
+
+
 if __name__ == "__main__":
-    import uvicorn
+    import argparse
+
+    parser = argparse.ArgumentParser(description="FestMoment API server")
+    subcommands = parser.add_subparsers(dest="command")
+    serve_parser = subcommands.add_parser("serve", help="Run the API server (default)")
+    serve_parser.add_argument("--host", default="0.0.0.0")
+    serve_parser.add_argument("--port", type=int, default=8000)
+    precompute_parser = subcommands.add_parser(
+        "precompute", help="Precompute sentiment, ranking and review-summary results for every festival"
+    )
+    precompute_parser.add_argument(
+        "--kinds",
+        nargs="+",
+        choices=precompute_service.kinds,
+        help="Result kinds to precompute (default: all)",
+    )
+    precompute_parser.add_argument("--limit", type=int, help="Only the first N festivals (by title)")
+    precompute_parser.add_argument("--force", action="store_true", help="Recompute results that are still fresh")
+    precompute_parser.add_argument(
+        "--every", type=float, default=0, help="Repeat every N seconds instead of running once"
+    )
+    args = parser.parse_args()
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    if args.command == "precompute":
+        asyncio.run(run_precompute_cli(args.kinds, args.limit, args.force, args.every))
+    else:
+        import uvicorn
+
+        uvicorn.run(
+            app,
+            host=getattr(args, "host", "0.0.0.0"),
+            port=getattr(args, "port", 8000),
+        )
@@ -1,12 +1,16 @@
 from src.application.core.state import LLMGraphState
 from src.infrastructure.llm_client import get_llm_client
 
-def agent_content_validator(state: LLMGraphState):
+async def agent_content_validator(state: LLMGraphState):
     if state["log_details"]:
         print(
             f"\n--- [Agent 0: Content Validator] 블로그 관련성 검증 시작: {state['title']} ---"
         )
 
+    if state.get("relevance_checked"):
+        # Already screened by the batched relevance classifier before entering the graph
+        return {"is_relevant": bool(state.get("is_relevant"))}
+
     keyword = state["keyword"]
     title = state["title"]
     text = state["original_text"]
@@ -27,7 +31,7 @@ def agent_content_validator(state: LLMGraphState):
 [출력]
 위 조건들을 모두 고려했을 때, 이 게시물이 사용자가 찾는 '{keyword}'에 대한 '진짜 후기'가 맞다면 '예'를, 그렇지 않다면 '아니오'를 반환해주세요. '예' 또는 '아니오'로만 대답해야 합니다."""
 
-        response = llm.invoke(prompt)
+        response = await llm.ainvoke(prompt)
         answer = response.content.strip()
 
         if "예" in answer:
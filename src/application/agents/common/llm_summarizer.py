@@ -4,7 +4,7 @@ from src.infrastructure.llm_client import get_llm_client
 import re
 import ast
 
-def agent_llm_summarizer(state: LLMGraphState):
+async def agent_llm_summarizer(state: LLMGraphState):
     if state["log_details"]:
         print("\n--- [Agent 1: LLM Aspect Extractor] 주체-감성 쌍 추출 및 요약 시작 ---")
 
@@ -60,7 +60,7 @@ def agent_llm_summarizer(state: LLMGraphState):
     summary = ""
     aspect_pairs = []
     try:
-        response = llm.invoke(user_prompt)
+        response = await llm.ainvoke(user_prompt)
         raw_content = response.content.strip()
 
         # LLM 출력에서 요약과 주체-감성 쌍 부분을 분리
@@ -0,0 +1,131 @@
+import json
+import os
+import re
+from typing import List, Optional, Sequence, Tuple
+
+from src.infrastructure.llm_client import get_llm_client
+
+# 한 번의 LLM 호출로 판별할 블로그 수 (검색 결과 한 페이지 분량)
+RELEVANCE_BATCH_SIZE = int(os.getenv("RELEVANCE_BATCH_SIZE", "20"))
+# 판별에 사용할 본문 앞부분 길이
+RELEVANCE_TEXT_CHARS = 2000
+
+
+def _build_batch_prompt(
+    keyword: str, candidates: Sequence[Tuple[str, str]], require_substance: bool = True
+) -> str:
+    blocks = []
+    for i, (title, text) in enumerate(candidates, start=1):
+        blocks.append(
+            f"[블로그 {i}]\n- **제목:** {title}\n- **본문 (일부):** {text[:RELEVANCE_TEXT_CHARS]}..."
+        )
+    candidates_str = "\n\n".join(blocks)
+    substance_condition = (
+        "\n4.  **충분한 내용:** 게시물 본문이 너무 짧거나 내용이 부실하여 실제 경험을 파악하기 어려운 경우, 관련성이 낮다고 판단합니다."
+        if require_substance
+        else ""
+    )
+
+    return f"""당신은 블로그 게시물의 주제를 정확하게 판별하는 전문가입니다.
+사용자는 '{keyword}' 축제에 대한 '진짜 후기'를 찾고 있습니다.
+아래의 조건에 따라 주어진 블로그 {len(candidates)}개 각각이 검색 의도에 부합하는지 판별해주세요.
+
+[판별 조건]
+1.  **주제 일치:** 게시물의 '주된 내용'이 '{keyword}' 축제에 대한 경험이나 후기여야 합니다. 단순히 언급만 되거나 부수적인 내용이면 안 됩니다.
+2.  **유사 행사 제외:** '{keyword}'와 이름이 비슷한 다른 행사(예: '세계 {keyword}')에 대한 후기는 아닌지 확인해야 합니다.
+3.  **다른 주제 제외:** 게시물의 주된 내용이 '{keyword}' 축제가 아닌, 특정 장소(카페, 식당), 제품, 서비스 등에 대한 비교나 추천이 아닌지 확인해야 합니다. (예: '{keyword} 기념 카페 A, B 비교 후기'){substance_condition}
+
+[판별할 블로그 목록]
+{candidates_str}
+
+[출력]
+각 블로그마다 번호와 판별 결과를 담은 JSON 배열만 출력해주세요. 다른 설명은 절대 추가하지 마세요.
+'{keyword}' 축제에 대한 '진짜 후기'가 맞으면 "relevant"를 true로, 아니면 false로 표시합니다.
+형식: [{{"index": 1, "relevant": true}}, {{"index": 2, "relevant": false}}, ...]"""
+
+
+def _parse_verdicts(raw: str, count: int) -> List[Optional[bool]]:
+    """
+    LLM 응답에서 JSON 판정 배열을 읽어 후보 순서대로 True/False를 반환합니다.
+    판정을 찾지 못한 후보는 None으로 남깁니다.
+    """
+    verdicts: List[Optional[bool]] = [None] * count
+    match = re.search(r"\[.*\]", raw, re.DOTALL)
+    if not match:
+        return verdicts
+    try:
+        items = json.loads(match.group(0))
+    except json.JSONDecodeError:
+        return verdicts
+
+    for position, item in enumerate(items):
+        if isinstance(item, bool):
+            index, relevant = position + 1, item
+        elif isinstance(item, dict):
+            index, relevant = item.get("index"), item.get("relevant")
+        else:
+            continue
+        if isinstance(index, int) and 1 <= index <= count and isinstance(relevant, bool):
+            verdicts[index - 1] = relevant
+    return verdicts
+
+
+async def _classify_batch(
+    llm, keyword: str, candidates: Sequence[Tuple[str, str]], require_substance: bool = True
+) -> List[Optional[bool]]:
+    count = len(candidates)
+    try:
+        # Only cache an answer with a verdict for every candidate, so a malformed batch is asked again
+        response = await llm.ainvoke(
+            _build_batch_prompt(keyword, candidates, require_substance),
+            cache_if=lambda raw: None not in _parse_verdicts(raw.strip(), count),
+        )
+        return _parse_verdicts(response.content.strip(), count)
+    except Exception as e:
+        print(f"DEBUG: Batched relevance check failed for '{keyword}': {e}")
+        return [None] * len(candidates)
+
+
+async def classify_relevance(
+    keyword: str, candidates: Sequence[Tuple[str, str]], require_substance: bool = True
+) -> List[bool]:
+    """
+    (제목, 본문) 후보들이 '{keyword}' 축제의 실제 후기인지 한꺼번에 판별합니다.
+    RELEVANCE_BATCH_SIZE 개씩 하나의 프롬프트로 묶어 JSON 판정 배열을 받고,
+    응답에서 빠진 후보만 한 번 더 묶어서 (캐시를 거치지 않고) 다시 묻습니다. 그래도 판정이 없으면 관련 없는 것으로 처리합니다.
+
+    require_substance=False면 '충분한 내용' 조건을 빼고 판별합니다. 감성 분석은 짧은 후기도
+    분석 대상으로 삼던 그래프 내용 검증기(agent_content_validator)의 조건을 그대로 씁니다.
+    """
+    if not candidates:
+        return []
+
+    llm = get_llm_client()
+    verdicts: List[Optional[bool]] = []
+    for offset in range(0, len(candidates), RELEVANCE_BATCH_SIZE):
+        verdicts.extend(
+            await _classify_batch(
+                llm, keyword, candidates[offset : offset + RELEVANCE_BATCH_SIZE], require_substance
+            )
+        )
+
+    missing = [i for i, verdict in enumerate(verdicts) if verdict is None]
+    if missing:
+        print(f"DEBUG: Re-checking {len(missing)} blogs without a relevance verdict.")
+        # A whole malformed batch re-numbers to the identical prompt, so the retry must not be served from the cache
+        retry_llm = get_llm_client(cache=False)
+        for offset in range(0, len(missing), RELEVANCE_BATCH_SIZE):
+            chunk = missing[offset : offset + RELEVANCE_BATCH_SIZE]
+            retried = await _classify_batch(
+                retry_llm, keyword, [candidates[i] for i in chunk], require_substance
+            )
+            for i, verdict in zip(chunk, retried):
+                verdicts[i] = verdict
+
+    results = [bool(verdict) for verdict in verdicts]
+    for (title, _), relevant in zip(candidates, results):
+        if relevant:
+            print(f"DEBUG: Validation successful for '{title}'. It's a relevant review.")
+        else:
+            print(f"DEBUG: Validation failed for '{title}'. Not a relevant review.")
+    return results
@@ -1,12 +1,12 @@
 from src.application.core.state import LLMGraphState
-from src.infrastructure.dynamic_scorer import SimpleScorer
+from src.infrastructure.dynamic_scorer import get_simple_scorer
 
-def agent_rule_scorer_on_summary(state: LLMGraphState):
+async def agent_rule_scorer_on_summary(state: LLMGraphState):
     if state["log_details"]:
         print("\n--- [Agent 2: Rule Scorer] 요약 기반 점수 계산 시작 ---")
 
     summary = state["llm_summary"]
-    scorer = SimpleScorer()
+    scorer = get_simple_scorer()
     sentences = [s for s in summary.split("\n") if s.strip()]
 
     final_judgments = []
@@ -16,6 +16,8 @@ def agent_rule_scorer_on_summary(state: LLMGraphState):
     def is_inconsistent(is_pos, is_neg, score):
         return (is_pos and score < 0.0) or (is_neg and score > 0.0)
 
+    # 1) 헤더 문장으로 문맥(긍정/부정)을 정하고 채점할 문장을 모읍니다.
+    scored_items = []
     for sentence in sentences:
         if sentence.strip() == "- 긍정적인 점:":
             is_positive_context = True
@@ -31,24 +33,32 @@ def agent_rule_scorer_on_summary(state: LLMGraphState):
             if state["log_details"]:
                 print(f"   [필터링] 헤더 문장 제외: {sentence}")
             continue
+        scored_items.append((sentence, is_positive_context, is_negative_context))
 
-        score = scorer.score_sentence(
-            sentence,
-            is_positive_context=is_positive_context,
-            is_negative_context=is_negative_context,
-        )
+    # 2) 요약 전체의 미등록 표현을 한 번에 추론하고 모든 문장을 채점합니다.
+    scores = await scorer.ascore_sentences(scored_items)
+
+    # 3) 문맥과 맞지 않는 문장은 한꺼번에 다시 채점합니다.
+    inconsistent = [
+        i
+        for i, ((_, is_pos, is_neg), score) in enumerate(zip(scored_items, scores))
+        if is_inconsistent(is_pos, is_neg, score)
+    ]
+    recalculated = {}
+    if inconsistent:
+        rescored = await scorer.ascore_sentences([scored_items[i] for i in inconsistent])
+        recalculated = dict(zip(inconsistent, rescored))
+
+    for i, (sentence, is_positive_context, is_negative_context) in enumerate(scored_items):
+        score = scores[i]
 
-        if is_inconsistent(is_positive_context, is_negative_context, score):
+        if i in recalculated:
             if state["log_details"]:
                 print(
                     f"   [불일치 감지] 1차: {'긍정' if is_positive_context else '부정'} 문맥의 문장이 {score:.2f} 점수. 재계산 시도."
                 )
 
-            recalculated_score = scorer.score_sentence(
-                sentence,
-                is_positive_context=is_positive_context,
-                is_negative_context=is_negative_context,
-            )
+            recalculated_score = recalculated[i]
 
             if is_inconsistent(
                 is_positive_context, is_negative_context, recalculated_score
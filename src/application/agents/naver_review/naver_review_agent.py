@@ -1,15 +1,32 @@
 import os
+import asyncio
 import requests
 import re
 from dotenv import load_dotenv
 from src.infrastructure.external_services.naver_search.naver_review_api import (
     search_naver_blog,
 )
-from playwright.async_api import async_playwright  # Original scraper used playwright
+from src.infrastructure.external_services.scraping.browser_pool import get_browser_pool
+from src.infrastructure.external_services.scraping.naver_blog_http import (
+    fetch_blog_content,
+    is_content_image,
+)
 from src.infrastructure.llm_client import get_llm_client  # Added LLM client import
+from src.infrastructure.cache.blog_content_cache import get_blog_content_cache
+from src.infrastructure.cache.single_flight import SingleFlight
+from src.application.agents.common.relevance_classifier import classify_relevance
 
 load_dotenv()
 
+# 블로그 스크래핑 방식: auto(HTTP 우선, 실패 시 Playwright) | http | playwright
+BLOG_SCRAPER_MODE = os.getenv("BLOG_SCRAPER_MODE", "auto").lower()
+
+# 어떤 경로로 본문을 가져왔는지 집계 (cache / http / playwright)
+SCRAPE_SOURCE_COUNTS = {"cache": 0, "http": 0, "playwright": 0}
+
+# 같은 축제/파라미터로 동시에 들어온 리뷰 수집·요약 요청을 하나로 합침
+_in_flight = SingleFlight()
+
 
 class NaverReviewAgent:
     def __init__(self):
@@ -24,6 +41,20 @@ class NaverReviewAgent:
 
     async def get_review_summary_and_tips(
         self, festival_name, num_reviews=5, return_full_text=False, return_meta=False
+    ):
+        """
+        축제 후기 블로그를 모아 LLM 요약을 반환합니다 (return_full_text=True면 요약 대신 본문 목록).
+        같은 (축제, 파라미터)로 동시에 들어온 호출은 하나의 검색/스크래핑/요약을 함께 기다립니다.
+        """
+        return await _in_flight.share(
+            ("review_summary", festival_name, num_reviews, return_full_text, return_meta),
+            lambda: self._collect_review_summary_and_tips(
+                festival_name, num_reviews, return_full_text, return_meta
+            ),
+        )
+
+    async def _collect_review_summary_and_tips(
+        self, festival_name, num_reviews, return_full_text, return_meta
     ):
         # Preprocess festival_name to remove leading year
         processed_festival_name = self._remove_leading_year(festival_name)
@@ -45,14 +76,25 @@ class NaverReviewAgent:
             len(reviews_with_content) < num_reviews
             and start_index < max_results_to_scan
         ):
-            blog_results_meta = search_naver_blog(
+            blog_results_meta = await search_naver_blog(
                 search_query, display=display_count, start=start_index
             )
 
             if not blog_results_meta:
                 break
 
-            for review_meta in blog_results_meta:
+            # Scrape the page concurrently and judge relevance for the whole page in one LLM call
+            screened = await self._scrape_and_classify(
+                processed_festival_name,
+                blog_results_meta,
+                accept=lambda text, _: (
+                    text
+                    and "본문 내용을 찾을 수 없습니다" not in text
+                    and "페이지에 접근하는 중 오류" not in text
+                ),
+            )
+
+            for review_meta, screen in zip(blog_results_meta, screened):
                 if len(reviews_with_content) >= num_reviews:
                     break
 
@@ -63,23 +105,10 @@ class NaverReviewAgent:
                     should_stop_fetching = True  # Set flag
                     break  # Break from inner for loop
 
-                link = review_meta.get("link")
-                if link and "blog.naver.com" in link:
-                    text_content, _ = await self._scrape_blog_content(link)
-                    if (
-                        text_content
-                        and "본문 내용을 찾을 수 없습니다" not in text_content
-                        and "페이지에 접근하는 중 오류" not in text_content
-                    ):
-                        # --- 여기 들여쓰기를 수정했습니다 ---
-                        is_relevant = await self._is_relevant_review(
-                            processed_festival_name,
-                            review_meta.get("title", ""),
-                            text_content,
-                        )
-                        # --- 여기까지 ---
-
-                        if is_relevant:
+                if screen is not None:
+                    text_content = screen["text"]
+                    if screen["accepted"]:
+                        if screen["is_relevant"]:
                             print(
                                 f"DEBUG: Scraped content for '{review_meta.get('title')}': {text_content[:200]}..."
                             )
@@ -127,15 +156,53 @@ class NaverReviewAgent:
         return llm_generated_summary, llm_generated_summary
 
     async def _scrape_blog_content(self, url: str) -> tuple[str, list[str]]:
+        """
+        주어진 URL의 블로그 본문 텍스트와 이미지 URL들을 반환합니다.
+        공유 디스크 캐시에 있으면 그대로 사용하고, 없을 때만 스크래핑한 뒤 성공한 결과를 캐시에 저장합니다.
+        """
+        cache = get_blog_content_cache()
+        cached = await asyncio.to_thread(cache.get, url)
+        if cached is not None:
+            SCRAPE_SOURCE_COUNTS["cache"] += 1
+            return cached
+
+        # Static HTTP fetch of the PostView page first; a browser render only when that fails
+        source = None
+        scraped = None
+        if BLOG_SCRAPER_MODE in ("auto", "http"):
+            scraped = await fetch_blog_content(url)
+            if scraped is not None:
+                source = "http"
+        if scraped is None and BLOG_SCRAPER_MODE in ("auto", "playwright"):
+            scraped = await self._render_blog_content(url)
+            source = "playwright"
+        if scraped is None:
+            return "본문 내용을 찾을 수 없습니다. (지원되지 않는 블로그 구조일 수 있습니다)", []
+
+        text_content, image_urls = scraped
+        if self._is_scraped_content(text_content):
+            SCRAPE_SOURCE_COUNTS[source] += 1
+            await asyncio.to_thread(cache.put, url, text_content, image_urls, source)
+        return text_content, image_urls
+
+    @staticmethod
+    def _is_scraped_content(text_content: str) -> bool:
+        """스크래핑 결과가 오류 메시지가 아닌 실제 본문인지 확인합니다."""
+        return bool(
+            text_content
+            and "본문 내용을 찾을 수 없습니다" not in text_content
+            and "페이지에 접근하는 중 오류" not in text_content
+        )
+
+    async def _render_blog_content(self, url: str) -> tuple[str, list[str]]:
         """
         Playwright를 사용하여 주어진 URL의 블로그 본문 텍스트와 이미지 URL들을 스크래핑합니다.
         """
         text_content = ""
         image_urls = []
         try:
-            async with async_playwright() as p:
-                browser = await p.chromium.launch(headless=True)
-                page = await browser.new_page()
+            # Pages come from the shared browser pool instead of a per-URL Chromium launch
+            async with get_browser_pool().page(url) as page:
                 await page.goto(url, wait_until="domcontentloaded", timeout=20000)
 
                 main_frame = page
@@ -172,20 +239,8 @@ class NaverReviewAgent:
 
                                     src = lazy_src or data_src or regular_src
 
-                                    if src and src.startswith("http"):
-                                        # Filter out emoticons/stickers
-                                        if (
-                                            "storep-phinf.pstatic.net" in src
-                                            and "ogq_" in src
-                                        ):
-                                            continue
-                                        # Filter out map images
-                                        if (
-                                            "simg.pstatic.net" in src
-                                            and "static.map" in src
-                                        ):
-                                            continue
-
+                                    # Emoticons/stickers and map images are filtered out
+                                    if is_content_image(src):
                                         # 썸네일 파라미터(?type=...)를 포함하여 원본 이미지 URL 확보
                                         cleaned_src = src
                                         if cleaned_src not in image_urls:
@@ -194,8 +249,6 @@ class NaverReviewAgent:
                     except Exception:
                         continue
 
-                await browser.close()
-
                 if not text_content.strip():
                     return (
                         "본문 내용을 찾을 수 없습니다. (지원되지 않는 블로그 구조일 수 있습니다)",
@@ -210,38 +263,56 @@ class NaverReviewAgent:
     async def _is_relevant_review(
         self, festival_name: str, blog_title: str, blog_content: str
     ) -> bool:
-        prompt = f"""당신은 블로그 게시물의 주제를 정확하게 판별하는 전문가입니다.
-사용자는 '{festival_name}' 축제에 대한 '진짜 후기'를 찾고 있습니다.
-아래의 조건에 따라 주어진 블로그 제목과 본문이 검색 의도에 부합하는지 판별해주세요.
-
-[판별 조건]
-1.  **주제 일치:** 게시물의 '주된 내용'이 '{festival_name}' 축제에 대한 경험이나 후기여야 합니다. 단순히 언급만 되거나 부수적인 내용이면 안 됩니다.
-2.  **유사 행사 제외:** '{festival_name}'와 이름이 비슷한 다른 행사(예: '세계 {festival_name}')에 대한 후기는 아닌지 확인해야 합니다.
-3.  **다른 주제 제외:** 게시물의 주된 내용이 '{festival_name}' 축제가 아닌, 특정 장소(카페, 식당), 제품, 서비스 등에 대한 비교나 추천이 아닌지 확인해야 합니다. (예: '{festival_name} 기념 카페 A, B 비교 후기')
-4.  **충분한 내용:** 게시물 본문이 너무 짧거나 내용이 부실하여 실제 경험을 파악하기 어려운 경우, 관련성이 낮다고 판단합니다.
-
-[판별할 정보]
--   **제목:** {blog_title}
--   **본문 (일부):** {blog_content[:2000]}...
-
-[출력]
-위 조건들을 모두 고려했을 때, 이 게시물이 사용자가 찾는 '{festival_name}' 축제에 대한 '진짜 후기'가 맞다면 '예'를, 그렇지 않다면 '아니오'를 반환해주세요. '예' 또는 '아니오'로만 대답해야 합니다."""
-        try:
-            response = await self.llm.ainvoke(prompt)
-            answer = response.content.strip()
-            if "예" in answer:
-                print(
-                    f"DEBUG: Validation successful for '{blog_title}'. It's a relevant review."
-                )
-                return True
-            else:
-                print(
-                    f"DEBUG: Validation failed for '{blog_title}'. Not a relevant review."
-                )
-                return False
-        except Exception as e:
-            print(f"DEBUG: LLM validation failed for '{blog_title}': {e}")
-            return False  # Assume not relevant if validation fails
+        verdicts = await classify_relevance(festival_name, [(blog_title, blog_content)])
+        return verdicts[0]
+
+    async def _scrape_and_classify(
+        self, festival_name: str, blog_metas: list, accept=None, require_substance: bool = True
+    ) -> list:
+        """
+        검색 결과 한 페이지의 네이버 블로그를 동시에 스크래핑하고, 관련성은 한 번의 LLM 호출로 판별합니다.
+        blog_metas와 같은 순서로 결과를 반환합니다:
+        - 네이버 블로그 링크가 아니면 None
+        - 그 외에는 {"text", "image_urls", "accepted", "is_relevant"}
+          (accept(text, image_urls)를 통과한 본문만 관련성 판별 대상이 됩니다)
+        require_substance는 classify_relevance()에 그대로 전달합니다.
+        """
+        accept = accept or (lambda text, _: self._is_scraped_content(text))
+        positions = [
+            i
+            for i, meta in enumerate(blog_metas)
+            if meta.get("link") and "blog.naver.com" in meta["link"]
+        ]
+        scraped = await asyncio.gather(
+            *(self._scrape_blog_content(blog_metas[i]["link"]) for i in positions),
+            return_exceptions=True,
+        )
+
+        screened = [None] * len(blog_metas)
+        for i, result in zip(positions, scraped):
+            if isinstance(result, Exception):
+                print(f"DEBUG: Scraping failed for {blog_metas[i]['link']}: {result}")
+                result = (f"페이지에 접근하는 중 오류가 발생했습니다: {result}", [])
+            text_content, image_urls = result
+            screened[i] = {
+                "text": text_content,
+                "image_urls": image_urls,
+                "accepted": bool(accept(text_content, image_urls)),
+                "is_relevant": False,
+            }
+
+        to_classify = [i for i in positions if screened[i]["accepted"]]
+        verdicts = await classify_relevance(
+            festival_name,
+            [
+                (re.sub(r"<[^>]+>", "", blog_metas[i].get("title", "")).strip(), screened[i]["text"])
+                for i in to_classify
+            ],
+            require_substance=require_substance,
+        )
+        for i, verdict in zip(to_classify, verdicts):
+            screened[i]["is_relevant"] = verdict
+        return screened
 
     async def get_sentiment_for_text(self, text: str):
         # This function was not part of the original NaverReviewSupervisor
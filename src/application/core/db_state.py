@@ -15,6 +15,7 @@ class DBSearchState(TypedDict):
     longitude: float | None
     radius: float | None
     current_festival_id: str | None
+    top_k: int | None  # 유형별 최대 결과 수 (None이면 전체)
     
     # Results
     results: List[Dict[str, Any]] | None
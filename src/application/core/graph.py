@@ -36,5 +36,5 @@ def create_llm_workflow():
 
     return llm_workflow.compile()
 
-# 워크플로우 그래프 인스턴스 생성
+# 워크플로우 그래프 인스턴스 생성 (노드가 모두 비동기이므로 app_llm_graph.ainvoke(...)로 실행합니다)
 app_llm_graph = create_llm_workflow()
@@ -6,6 +6,7 @@ class LLMGraphState(TypedDict):
     title: str  # 블로그 제목 추가
     log_details: bool
     is_relevant: bool  # 관련성 여부 플래그
+    relevance_checked: bool  # 호출 전에 (일괄) 관련성 판별을 마쳤으면 True → 검증 노드는 is_relevant를 그대로 사용
     llm_summary: str
     final_judgments: List[Dict]
     feedback_message: str | None
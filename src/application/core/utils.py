@@ -2,6 +2,7 @@
 import pandas as pd
 import re
 import math
+import numpy as np
 from datetime import datetime
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
@@ -65,21 +66,38 @@ def save_df_to_csv(df: pd.DataFrame, base_name: str, keyword: str) -> str:
         print(f"CSV 저장 중 오류 ({keyword}): {e}")
         return None
 
+def _negative_feedback_prompt(sentences: list):
+    unique_sentences = sorted(list(set(filter(None, sentences))), key=len, reverse=True) # None 값 제거
+    if not unique_sentences: return None # 빈 리스트 처리
+
+    negative_feedback_str = "\n- ".join(unique_sentences[:50])
+    return f'''[수집된 부정적인 의견]\n- {negative_feedback_str}\n\n[요청] 위 의견들을 종합하여 주요 불만 사항을 1., 2., 3. ... 형식의 목록으로 요약해주세요. 만약 의견이 없다면 '특별한 불만 사항 없음'이라고 답해주세요.'''
+
 def summarize_negative_feedback(sentences: list) -> str:
     if not sentences: return ""
     try:
         llm = get_llm_client(model="gemini-2.5-pro") # 모델명 확인
-        unique_sentences = sorted(list(set(filter(None, sentences))), key=len, reverse=True) # None 값 제거
-        if not unique_sentences: return "" # 빈 리스트 처리
-
-        negative_feedback_str = "\n- ".join(unique_sentences[:50])
-        prompt = f'''[수집된 부정적인 의견]\n- {negative_feedback_str}\n\n[요청] 위 의견들을 종합하여 주요 불만 사항을 1., 2., 3. ... 형식의 목록으로 요약해주세요. 만약 의견이 없다면 '특별한 불만 사항 없음'이라고 답해주세요.'''
+        prompt = _negative_feedback_prompt(sentences)
+        if prompt is None: return ""
         response = llm.invoke(prompt)
         return response.content.strip()
     except Exception as e:
         print(f"부정적 의견 요약 중 오류 발생: {e}")
         return "부정적 의견을 요약하는 데 실패했습니다."
 
+async def asummarize_negative_feedback(sentences: list) -> str:
+    """summarize_negative_feedback의 비동기 버전 (이벤트 루프를 막지 않습니다)."""
+    if not sentences: return ""
+    try:
+        llm = get_llm_client(model="gemini-2.5-pro")
+        prompt = _negative_feedback_prompt(sentences)
+        if prompt is None: return ""
+        response = await llm.ainvoke(prompt)
+        return response.content.strip()
+    except Exception as e:
+        print(f"부정적 의견 요약 중 오류 발생: {e}")
+        return "부정적 의견을 요약하는 데 실패했습니다."
+
 def create_driver():
     """웹 드라이버 생성"""
     try:
@@ -114,3 +132,19 @@ def haversine(lon1, lat1, lon2, lat2):
     c = 2 * math.asin(math.sqrt(a))
     r = 6371000 # Radius of earth in meters
     return c * r
+
+
+def haversine_np(lon1, lat1, lon2, lat2):
+    """
+    haversine의 NumPy 벡터화 버전입니다.
+    기준점(lon1, lat1)에서 좌표 배열(lon2, lat2)까지의 거리를 미터 단위 배열로 반환합니다.
+    """
+    lon1, lat1 = np.radians(float(lon1)), np.radians(float(lat1))
+    lon2, lat2 = np.radians(np.asarray(lon2, dtype=float)), np.radians(np.asarray(lat2, dtype=float))
+
+    dlon = lon2 - lon1
+    dlat = lat2 - lat1
+    a = np.sin(dlat/2)**2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon/2)**2
+    c = 2 * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+    r = 6371000 # Radius of earth in meters
+    return c * r
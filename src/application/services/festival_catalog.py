@@ -0,0 +1,196 @@
+import threading
+from datetime import datetime
+from itertools import product
+from typing import Dict, List, Optional, Tuple
+
+from src.application.core.constants import AREA_CODE_MAP, SIGUNGU_CODE_MAP, NO_IMAGE_URL
+from src.infrastructure.config.loader import TITLE_TO_CAT_NAMES
+from src.infrastructure.persistence.database import (
+    DataVersionWatch,
+    get_data_versions,
+    get_db_connection,
+    run_read,
+)
+
+ALL = "전체"
+
+STATUS_ONGOING = "축제 진행중"
+STATUS_UPCOMING = "진행 예정"
+STATUS_ENDED = "종료된 축제"
+EVENT_STATUSES = (STATUS_ONGOING, STATUS_UPCOMING, STATUS_ENDED)
+
+# (title, image, start_date, end_date) - the tuple shape the search API already returns
+FestivalEntry = Tuple[str, str, Optional[str], Optional[str]]
+
+
+def _date_str(value) -> Optional[str]:
+    if value is None or value == "":
+        return None
+    return str(value).split(".")[0]
+
+
+def _event_statuses(start_date, end_date, today: str) -> List[str]:
+    """Returns every status bucket the festival falls into as of `today` (YYYYMMDD)."""
+    start, end = _date_str(start_date), _date_str(end_date)
+    statuses = []
+    if start and end and start <= today <= end:
+        statuses.append(STATUS_ONGOING)
+    if start and start > today:
+        statuses.append(STATUS_UPCOMING)
+    if end and end < today:
+        statuses.append(STATUS_ENDED)
+    return statuses
+
+
+class FestivalCatalogIndex:
+    """
+    Immutable, pre-sorted index over the festivals table.
+
+    Every festival is registered under each combination of its filter values and the
+    wildcard (None), so any filtered search is a single dict lookup that returns an
+    already title-sorted tuple.
+    """
+
+    def __init__(self, rows, title_to_cat_names: Dict[str, tuple], today: str, data_versions: Optional[dict] = None):
+        self.today = today
+        # tour.db data versions the rows were read at (see DataVersionWatch)
+        self.data_versions = data_versions or {}
+
+        entries = []
+        for title, firstimage, start_date, end_date, areacode, sigungucode in rows:
+            entries.append(
+                (
+                    (title, firstimage or NO_IMAGE_URL, start_date, end_date),
+                    areacode,
+                    sigungucode,
+                )
+            )
+        # Stable sort by title, matching the previous sorted(results, key=title) behaviour
+        entries.sort(key=lambda e: e[0][0] or "")
+
+        buckets: Dict[tuple, List[FestivalEntry]] = {}
+        for festival, areacode, sigungucode in entries:
+            title, _, start_date, end_date = festival
+
+            location_keys = [(None, None)]
+            if areacode is not None:
+                location_keys.append((areacode, None))
+                if sigungucode is not None:
+                    location_keys.append((areacode, sigungucode))
+
+            category_keys = [(None, None, None)]
+            cat_names = title_to_cat_names.get(title)
+            if cat_names:
+                category_keys = list(
+                    product((None, cat_names[0]), (None, cat_names[1]), (None, cat_names[2]))
+                )
+
+            status_keys = [None] + _event_statuses(start_date, end_date, today)
+
+            for location, category, status in product(location_keys, category_keys, status_keys):
+                buckets.setdefault(location + category + (status,), []).append(festival)
+
+        self._buckets: Dict[tuple, Tuple[FestivalEntry, ...]] = {
+            key: tuple(festivals) for key, festivals in buckets.items()
+        }
+        self.size = len(entries)
+
+    @staticmethod
+    def _resolve_location(area: Optional[str], sigungu: Optional[str]) -> tuple:
+        if not area or area == ALL:
+            return None, None
+        area_code = AREA_CODE_MAP.get(area)
+        if not area_code:
+            return None, None
+        sigungu_code = None
+        if sigungu and sigungu != ALL:
+            sigungu_code = SIGUNGU_CODE_MAP.get(area, {}).get(sigungu) or None
+        return area_code, sigungu_code
+
+    def search(
+        self,
+        area: Optional[str] = ALL,
+        sigungu: Optional[str] = ALL,
+        main_cat: Optional[str] = ALL,
+        medium_cat: Optional[str] = ALL,
+        small_cat: Optional[str] = ALL,
+        status: Optional[str] = ALL,
+    ) -> Tuple[FestivalEntry, ...]:
+        """필터 조건에 맞는 축제 목록을 제목순으로 정렬된 튜플로 반환합니다."""
+        if status and status != ALL and status not in EVENT_STATUSES:
+            return ()
+
+        def _cat(value):
+            return None if not value or value == ALL else value
+
+        key = self._resolve_location(area, sigungu) + (
+            _cat(main_cat),
+            _cat(medium_cat),
+            _cat(small_cat),
+            _cat(status),
+        )
+        return self._buckets.get(key, ())
+
+
+def _today() -> str:
+    return datetime.now().strftime("%Y%m%d")
+
+
+def build_festival_catalog(today: Optional[str] = None) -> FestivalCatalogIndex:
+    today = today or _today()
+    # Read the version first: a load landing mid-build then shows up as a newer version and triggers a rebuild
+    data_versions = get_data_versions(("festivals",))
+    conn = get_db_connection()
+    try:
+        rows = conn.execute(
+            "SELECT title, firstimage, eventstartdate, eventenddate, areacode, sigungucode FROM festivals"
+        ).fetchall()
+    finally:
+        conn.close()
+    index = FestivalCatalogIndex(
+        [tuple(row) for row in rows], TITLE_TO_CAT_NAMES, today, data_versions
+    )
+    print(f"[Catalog] Festival catalog index built ({index.size} festivals, {today}).")
+    return index
+
+
+_catalog: Optional[FestivalCatalogIndex] = None
+_catalog_lock = threading.Lock()
+_data_versions = DataVersionWatch(("festivals",))
+
+
+def get_festival_catalog() -> FestivalCatalogIndex:
+    """
+    공유 카탈로그 인덱스를 반환합니다.
+    진행 상태 버킷은 날짜에 따라 달라지므로 날짜가 바뀌면, 그리고 (다른 프로세스의 적재를 포함해)
+    festivals의 데이터 버전이 바뀐 것을 확인하면 새 인덱스로 교체합니다.
+    DB를 읽을 수 있으므로 async 코드에서는 aget_festival_catalog()를 사용합니다.
+    """
+    global _catalog
+    today = _today()
+    catalog = _catalog
+    if catalog is not None and catalog.today == today and not _data_versions.changed_since(catalog.data_versions):
+        return catalog
+    with _catalog_lock:
+        # Rebuild only if no other thread has already replaced the catalog we found stale
+        if _catalog is catalog or _catalog.today != today:
+            _catalog = build_festival_catalog(today)
+        return _catalog
+
+
+async def aget_festival_catalog() -> FestivalCatalogIndex:
+    """
+    get_festival_catalog()의 async 버전. 인덱스를 다시 만들거나 데이터 버전을 확인할 때만
+    읽기 스레드 풀에서 실행하므로, 테이블 전체를 읽는 재생성이 이벤트 루프를 막지 않습니다.
+    """
+    catalog = _catalog
+    if catalog is not None and catalog.today == _today() and not _data_versions.due():
+        return catalog
+    return await run_read(get_festival_catalog)
+
+
+def invalidate_festival_catalog():
+    """DB 내용이 갱신되었을 때 다음 조회에서 인덱스를 다시 만들도록 합니다."""
+    global _catalog
+    with _catalog_lock:
+        _catalog = None
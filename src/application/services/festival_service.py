@@ -1,15 +1,20 @@
-from src.infrastructure.persistence.database import get_db_connection
+from typing import Any, Dict, List
+
+from src.infrastructure.persistence.database import fetch_one, fetch_all
 
 def get_festival_details_by_title(festival_name: str):
     """Fetches all details for a given festival by its title."""
     if not festival_name:
         return None
-    conn = get_db_connection()
-    try:
-        # The connection object already has row_factory set to sqlite3.Row
-        cursor = conn.cursor()
-        cursor.execute("SELECT * FROM festivals WHERE title = ?", (festival_name,))
-        festival = cursor.fetchone()
-        return dict(festival) if festival else None
-    finally:
-        conn.close()
+    return fetch_one("SELECT * FROM festivals WHERE title = ?", (festival_name,))
+
+def get_festivals_by_titles(titles: List[str]) -> List[Dict[str, Any]]:
+    """Fetches festival rows for the given titles, in the order requested (missing titles are skipped)."""
+    if not titles:
+        return []
+    placeholders = ", ".join("?" for _ in titles)
+    rows = fetch_all(f"SELECT * FROM festivals WHERE title IN ({placeholders})", tuple(titles))
+    by_title = {}
+    for row in rows:
+        by_title.setdefault(row["title"], row)
+    return [by_title[title] for title in titles if title in by_title]
@@ -0,0 +1,197 @@
+import asyncio
+import os
+import threading
+import time
+import traceback
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from src.infrastructure.persistence.job_store import JobStore
+
+# 동시에 실행할 백그라운드 작업 수와 대기열 길이
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_QUEUE_MAX = int(os.getenv("JOB_QUEUE_MAX", "100"))
+# 진행률을 저장소에 기록하는 최소 간격 (같은 프로세스의 조회는 항상 최신 값을 봅니다)
+JOB_PROGRESS_WRITE_INTERVAL_SECONDS = 0.5
+
+
+class JobQueueFull(Exception):
+    """대기열이 가득 차서 작업을 받을 수 없을 때 발생합니다."""
+
+
+class JobProgress:
+    """
+    작업 진행률 훅. Gradio의 gr.Progress와 같은 모양이라 use case의 progress 인자로 그대로 넘길 수 있습니다.
+    - progress(0.3, desc="...") : 진행률(0~1)과 설명을 기록
+    - progress.tqdm(iterable, total=..., desc="...") : 항목을 하나 끝낼 때마다 진행률을 올림
+    """
+
+    def __init__(self, manager: "JobManager", job_id: str):
+        self.manager = manager
+        self.job_id = job_id
+
+    def __call__(self, fraction: float, desc: Optional[str] = None):
+        self.manager._report(self.job_id, fraction, desc)
+
+    def tqdm(self, iterable, total: Optional[int] = None, desc: Optional[str] = None):
+        if total is None:
+            total = len(iterable) if hasattr(iterable, "__len__") else None
+        self(0.0, desc)
+        for done, item in enumerate(iterable, start=1):
+            yield item
+            # The caller has finished with the item (e.g. awaited the task) when it asks for the next one
+            if total:
+                self(done / total, desc)
+
+
+JobHandler = Callable[[dict, JobProgress], Awaitable]
+
+
+class JobManager:
+    """
+    오래 걸리는 분석(감성 분석, 랭킹, 렌더링 등)을 요청과 분리해 실행하는 백그라운드 작업 관리자.
+
+    - submit()은 작업을 저장소에 기록하고 대기열에 넣은 뒤 바로 작업 ID를 돌려줍니다.
+    - 서버 이벤트 루프의 워커 JOB_WORKERS 개가 대기열에서 작업을 꺼내 실행하므로 동시에 실행되는 작업 수가 제한됩니다.
+    - 진행률, 결과, 오류는 JobStore에 저장되어 나중에(다른 워커 프로세스에서도) 조회할 수 있습니다.
+    """
+
+    def __init__(self, store: Optional[JobStore] = None, workers: int = JOB_WORKERS, max_queued: int = JOB_QUEUE_MAX):
+        self._store = store
+        self.workers = max(1, workers)
+        self.max_queued = max_queued
+        self._handlers: Dict[str, JobHandler] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks = []
+        # Latest progress of the jobs running in this process: job_id -> (fraction, desc)
+        self._live: Dict[str, Tuple[float, Optional[str]]] = {}
+        self._last_write: Dict[str, float] = {}
+
+    @property
+    def store(self) -> JobStore:
+        if self._store is None:
+            self._store = JobStore()
+        return self._store
+
+    def register(self, kind: str, handler: JobHandler):
+        """작업 종류와 실행 함수(handler(params, progress) -> JSON으로 저장할 수 있는 결과)를 등록합니다."""
+        self._handlers[kind] = handler
+
+    @property
+    def kinds(self):
+        return tuple(self._handlers)
+
+    async def start(self):
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queued)
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(), name=f"job-worker-{i}") for i in range(self.workers)
+        ]
+        orphaned = await asyncio.to_thread(self.store.recover_interrupted)
+        if orphaned:
+            print(f"[Jobs] 이전 실행에서 중단된 작업 {len(orphaned)}개를 실패로 표시했습니다.")
+        print(f"[Jobs] 백그라운드 작업 워커 {self.workers}개 시작")
+
+    async def stop(self):
+        """워커를 멈춥니다. 실행 중이던 작업과 대기 중인 작업은 실패로 기록됩니다."""
+        if self._queue is None:
+            return
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        while not self._queue.empty():
+            job_id, _, _ = self._queue.get_nowait()
+            await asyncio.to_thread(self.store.fail, job_id, "서버 종료로 작업이 취소되었습니다.")
+        self._queue = None
+        self._worker_tasks = []
+
+    async def submit(self, kind: str, params: dict) -> dict:
+        if kind not in self._handlers:
+            raise ValueError(f"알 수 없는 작업 종류입니다: {kind}")
+        if self._queue is None:
+            raise RuntimeError("작업 관리자가 시작되지 않았습니다.")
+        if self._queue.full():
+            raise JobQueueFull(f"대기 중인 작업이 너무 많습니다 (최대 {self.max_queued}개).")
+
+        job_id = await asyncio.to_thread(self.store.create, kind, params)
+        try:
+            self._queue.put_nowait((job_id, kind, params))
+        except asyncio.QueueFull:
+            await asyncio.to_thread(self.store.fail, job_id, "대기열이 가득 찼습니다.")
+            raise JobQueueFull(f"대기 중인 작업이 너무 많습니다 (최대 {self.max_queued}개).")
+        print(f"[Jobs] 작업 접수: {kind} ({job_id})")
+        return await self.get(job_id)
+
+    async def get(self, job_id: str, include_result: bool = False) -> Optional[dict]:
+        job = await asyncio.to_thread(self.store.get, job_id, include_result)
+        live = self._live.get(job_id)
+        if job is not None and live is not None:
+            job["progress"], desc = round(live[0], 4), live[1]
+            job["message"] = desc or job["message"]
+        return job
+
+    async def _worker(self):
+        while True:
+            job_id, kind, params = await self._queue.get()
+            try:
+                await self._run(job_id, kind, params)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str, kind: str, params: dict):
+        await asyncio.to_thread(self.store.mark_running, job_id)
+        self._live[job_id] = (0.0, None)
+        started = time.perf_counter()
+        try:
+            result = await self._handlers[kind](params, JobProgress(self, job_id))
+        except asyncio.CancelledError:
+            await asyncio.to_thread(self.store.fail, job_id, "서버 종료로 작업이 취소되었습니다.")
+            raise
+        except Exception as e:
+            traceback.print_exc()
+            # HTTPException-style errors carry the message in .detail
+            error = getattr(e, "detail", None) or str(e) or type(e).__name__
+            await asyncio.to_thread(self.store.fail, job_id, str(error))
+            print(f"[Jobs] 작업 실패: {kind} ({job_id}): {error}")
+        else:
+            await asyncio.to_thread(self.store.complete, job_id, result)
+            print(f"[Jobs] 작업 완료: {kind} ({job_id}, {time.perf_counter() - started:.1f}초)")
+        finally:
+            self._live.pop(job_id, None)
+            self._last_write.pop(job_id, None)
+
+    def _report(self, job_id: str, fraction: float, desc: Optional[str]):
+        fraction = min(max(float(fraction), 0.0), 1.0)
+        self._live[job_id] = (fraction, desc)
+        now = time.monotonic()
+        if now - self._last_write.get(job_id, 0.0) < JOB_PROGRESS_WRITE_INTERVAL_SECONDS:
+            return
+        self._last_write[job_id] = now
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Reported from a worker thread: write directly
+            self.store.update_progress(job_id, fraction, desc)
+        else:
+            loop.run_in_executor(None, self.store.update_progress, job_id, fraction, desc)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "running": len(self._live),
+            "by_status": self.store.stats(),
+        }
+
+
+_job_manager: Optional[JobManager] = None
+_job_manager_lock = threading.Lock()
+
+
+def get_job_manager() -> JobManager:
+    global _job_manager
+    if _job_manager is None:
+        with _job_manager_lock:
+            if _job_manager is None:
+                _job_manager = JobManager()
+    return _job_manager
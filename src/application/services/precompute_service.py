@@ -0,0 +1,242 @@
+import asyncio
+import os
+import threading
+import time
+import traceback
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from src.infrastructure.cache.single_flight import SingleFlight
+from src.infrastructure.persistence.database import fetch_all, fetch_one, run_read
+from src.infrastructure.persistence.precomputed_store import PrecomputedStore, params_key
+
+# 사전 계산 결과의 유효 기간 (종류별)
+PRECOMPUTE_SENTIMENT_TTL_SECONDS = float(os.getenv("PRECOMPUTE_SENTIMENT_TTL_SECONDS", str(24 * 3600)))
+PRECOMPUTE_RANKING_TTL_SECONDS = float(os.getenv("PRECOMPUTE_RANKING_TTL_SECONDS", str(24 * 3600)))
+PRECOMPUTE_REVIEW_SUMMARY_TTL_SECONDS = float(
+    os.getenv("PRECOMPUTE_REVIEW_SUMMARY_TTL_SECONDS", str(3 * 24 * 3600))
+)
+# 일괄 사전 계산에서 동시에 계산할 (종류, 축제) 수
+PRECOMPUTE_CONCURRENCY = int(os.getenv("PRECOMPUTE_CONCURRENCY", "2"))
+# 서버 안에서 일괄 사전 계산을 반복할 간격 (0이면 서버는 스케줄러를 돌리지 않고 CLI/cron에 맡김)
+PRECOMPUTE_INTERVAL_SECONDS = float(os.getenv("PRECOMPUTE_INTERVAL_SECONDS", "0"))
+
+# compute(festival title, params, progress) -> JSON-serializable result
+PrecomputeFunc = Callable[[str, dict, Optional[Callable]], Awaitable]
+
+
+def _festival_modifiedtime(festival_title: str) -> Optional[str]:
+    row = fetch_one("SELECT MAX(modifiedtime) AS modifiedtime FROM festivals WHERE title = ?", (festival_title,))
+    return _normalize_modifiedtime(row["modifiedtime"]) if row else None
+
+
+def _normalize_modifiedtime(value) -> Optional[str]:
+    # CSV loads may store modifiedtime as a float (20240101123000.0); compare as text
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+class PrecomputeService:
+    """
+    축제별 분석 결과(감성 분석, 랭킹 구성 점수, 리뷰 요약)를 미리 계산해 두고 꺼내 쓰는 서비스.
+
+    - register()로 종류마다 계산 함수(compute(축제명, params, progress))와 유효 기간, 일괄 계산에 쓸 기본 파라미터를 등록합니다.
+    - get_or_compute()는 저장된 결과가 신선하면 바로 반환하고, 없거나 오래됐으면 계산해서 저장한 뒤 반환합니다.
+      만료 시각이 지났거나 계산 이후 축제 데이터의 modifiedtime이 바뀌었으면 오래된 결과로 봅니다.
+    - run()은 tour.db의 모든 축제를 돌며 신선하지 않은 결과만 다시 계산합니다 (CLI와 스케줄러가 사용).
+    """
+
+    def __init__(self, store: Optional[PrecomputedStore] = None, concurrency: int = PRECOMPUTE_CONCURRENCY):
+        self._store = store
+        self.concurrency = max(1, concurrency)
+        # kind -> (compute, ttl_seconds, default params)
+        self._kinds: Dict[str, Tuple[PrecomputeFunc, float, dict]] = {}
+        self._in_flight = SingleFlight()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    @property
+    def store(self) -> PrecomputedStore:
+        if self._store is None:
+            self._store = PrecomputedStore()
+        return self._store
+
+    def register(self, kind: str, compute: PrecomputeFunc, ttl_seconds: float, default_params: Optional[dict] = None):
+        self._kinds[kind] = (compute, ttl_seconds, dict(default_params or {}))
+
+    @property
+    def kinds(self):
+        return tuple(self._kinds)
+
+    @staticmethod
+    def _is_fresh(entry: dict, modifiedtime: Optional[str], now: float) -> bool:
+        return entry["expires_at"] > now and entry["festival_modifiedtime"] == modifiedtime
+
+    def _params(self, kind: str, params: Optional[dict]) -> dict:
+        if kind not in self._kinds:
+            raise ValueError(f"알 수 없는 사전 계산 종류입니다: {kind}")
+        return params if params is not None else self._kinds[kind][2]
+
+    async def _lookup(self, kind: str, festival_title: str, params: dict):
+        entry, modifiedtime = await asyncio.gather(
+            run_read(self.store.get, kind, festival_title, params),
+            run_read(_festival_modifiedtime, festival_title),
+        )
+        fresh = entry is not None and self._is_fresh(entry, modifiedtime, time.time())
+        return entry, fresh, modifiedtime
+
+    async def get_fresh(self, kind: str, festival_title: str, params: Optional[dict] = None):
+        """신선한 사전 계산 결과가 있으면 반환하고, 없으면 계산하지 않고 None을 반환합니다."""
+        params = self._params(kind, params)
+        entry, fresh, _ = await self._lookup(kind, festival_title, params)
+        if not fresh:
+            return None
+        self.hits += 1
+        return entry["result"]
+
+    async def get_or_compute(
+        self, kind: str, festival_title: str, params: Optional[dict] = None, progress=None
+    ):
+        """
+        신선한 사전 계산 결과를 반환하고, 없거나 오래됐으면 계산해서 저장한 뒤 반환합니다.
+        progress(백그라운드 작업의 진행률 훅)는 새로 계산할 때만 계산 함수에 전달됩니다.
+        """
+        params = self._params(kind, params)
+        entry, fresh, modifiedtime = await self._lookup(kind, festival_title, params)
+        if fresh:
+            self.hits += 1
+            return entry["result"]
+        if entry is None:
+            self.misses += 1
+        else:
+            self.stale += 1
+        return await self._compute(kind, festival_title, params, modifiedtime, progress)
+
+    async def _compute(
+        self, kind: str, festival_title: str, params: dict, modifiedtime: Optional[str], progress=None
+    ):
+        compute, ttl_seconds, _ = self._kinds[kind]
+
+        async def run():
+            started = time.perf_counter()
+            result = await compute(festival_title, params, progress)
+            duration = time.perf_counter() - started
+            await asyncio.to_thread(
+                self.store.put, kind, festival_title, params, result, ttl_seconds, modifiedtime, duration
+            )
+            return result
+
+        # A request and the batch run asking for the same entry share one computation
+        return await self._in_flight.share((kind, festival_title, params_key(params)), run)
+
+    async def run(
+        self,
+        kinds: Optional[Iterable[str]] = None,
+        limit: Optional[int] = None,
+        force: bool = False,
+    ) -> dict:
+        """
+        tour.db의 모든 축제에 대해 등록된 종류(또는 kinds)의 결과를 기본 파라미터로 사전 계산합니다.
+        force=False면 아직 신선한 결과는 건너뜁니다. 실행 요약을 precompute_runs에 기록하고 반환합니다.
+        """
+        kinds = list(kinds or self._kinds)
+        unknown = [kind for kind in kinds if kind not in self._kinds]
+        if unknown:
+            raise ValueError(f"알 수 없는 사전 계산 종류입니다: {', '.join(unknown)}")
+
+        festivals = await run_read(
+            fetch_all,
+            "SELECT title, MAX(modifiedtime) AS modifiedtime FROM festivals "
+            "WHERE title IS NOT NULL AND title != '' GROUP BY title ORDER BY title",
+        )
+        if limit:
+            festivals = festivals[:limit]
+
+        now = time.time()
+        pending = []
+        fresh = 0
+        for kind in kinds:
+            stored = {} if force else await run_read(self.store.freshness, kind, self._kinds[kind][2])
+            for festival in festivals:
+                modifiedtime = _normalize_modifiedtime(festival["modifiedtime"])
+                entry = stored.get(festival["title"])
+                if entry is not None and self._is_fresh(entry, modifiedtime, now):
+                    fresh += 1
+                else:
+                    pending.append((kind, festival["title"], modifiedtime))
+
+        run_id = await asyncio.to_thread(self.store.start_run, kinds)
+        print(
+            f"[Precompute] 실행 #{run_id}: 축제 {len(festivals)}개, 종류 {', '.join(kinds)} "
+            f"- 계산 {len(pending)}건, 신선함 {fresh}건"
+        )
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        counts = {"computed": 0, "failed": 0}
+
+        async def compute_one(kind: str, festival_title: str, modifiedtime: Optional[str]):
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    await self._compute(kind, festival_title, self._kinds[kind][2], modifiedtime)
+                except Exception as e:
+                    counts["failed"] += 1
+                    traceback.print_exc()
+                    print(f"[Precompute] 실패: {kind} / {festival_title}: {e}")
+                    return
+                counts["computed"] += 1
+                done = counts["computed"] + counts["failed"]
+                print(
+                    f"[Precompute] ({done}/{len(pending)}) {kind} / {festival_title} "
+                    f"{time.perf_counter() - started:.1f}초"
+                )
+
+        try:
+            await asyncio.gather(*(compute_one(*item) for item in pending))
+        finally:
+            await asyncio.to_thread(
+                self.store.finish_run, run_id, len(festivals), counts["computed"], fresh, counts["failed"]
+            )
+
+        summary = {"run_id": run_id, "festivals": len(festivals), "fresh": fresh, **counts}
+        print(f"[Precompute] 실행 #{run_id} 완료: {summary}")
+        return summary
+
+    async def run_forever(self, interval_seconds: float, **kwargs):
+        """interval_seconds마다 run()을 반복합니다 (한 번의 실패가 스케줄러를 멈추지 않음)."""
+        while True:
+            try:
+                await self.run(**kwargs)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                traceback.print_exc()
+                print(f"[Precompute] 일괄 사전 계산 실패: {e}")
+            await asyncio.sleep(interval_seconds)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses + self.stale
+        return {
+            "kinds": list(self._kinds),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "stored": self.store.stats(),
+        }
+
+
+_precompute_service: Optional[PrecomputeService] = None
+_precompute_service_lock = threading.Lock()
+
+
+def get_precompute_service() -> PrecomputeService:
+    global _precompute_service
+    if _precompute_service is None:
+        with _precompute_service_lock:
+            if _precompute_service is None:
+                _precompute_service = PrecomputeService()
+    return _precompute_service
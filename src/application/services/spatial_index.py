@@ -0,0 +1,292 @@
+import math
+import os
+import threading
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from src.application.core.utils import haversine_np
+from src.infrastructure.persistence.database import (
+    DataVersionWatch,
+    fetch_all,
+    fetch_one,
+    get_data_versions,
+    get_db_connection,
+)
+
+# Grid cell size in degrees (~5.5km in latitude). Radius queries only touch the cells
+# overlapping the query's bounding box, so cost tracks local density, not catalog size.
+GRID_CELL_DEG = 0.05
+EARTH_RADIUS_M = 6371000
+# memory: 워커마다 메모리 격자 인덱스를 둠 (기본값)
+# rtree: 요청마다 tour.db의 R*Tree({table}_rtree, 마이그레이션 v3)로 후보를 찾음 (워커 메모리 절약, 항상 최신 데이터)
+SPATIAL_INDEX_BACKEND = os.getenv("SPATIAL_INDEX_BACKEND", "memory")
+
+
+def normalize_coordinates(mapx, mapy):
+    """
+    (mapx, mapy)를 (경도, 위도)로 변환합니다.
+    일부 데이터는 mapx/mapy가 뒤바뀌어 있으므로, 한국 좌표 범위를 기준으로 한 번만 교정합니다.
+    변환할 수 없는 좌표는 None을 반환합니다.
+    """
+    try:
+        lon, lat = float(mapx), float(mapy)
+    except (ValueError, TypeError):
+        return None
+    if not (math.isfinite(lon) and math.isfinite(lat)):
+        return None
+    if not (124 < lon < 132 and 33 < lat < 39):
+        if (124 < lat < 132 and 33 < lon < 39):
+            lon, lat = lat, lon
+    return lon, lat
+
+
+def bounding_box(lon: float, lat: float, radius: float):
+    """반경 radius(m) 원을 감싸는 (최소 경도, 최대 경도, 최소 위도, 최대 위도)."""
+    dlat = math.degrees(radius / EARTH_RADIUS_M)
+    max_abs_lat = min(abs(lat) + dlat, 89.9)
+    dlon = dlat / max(math.cos(math.radians(max_abs_lat)), 1e-6)
+    return lon - dlon, lon + dlon, lat - dlat, lat + dlat
+
+
+class PointSet:
+    """One table's rows with normalized coordinates and a uniform grid over them."""
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        kept, lons, lats = [], [], []
+        for row in rows:
+            coords = normalize_coordinates(row.get("mapx"), row.get("mapy"))
+            if coords is None:
+                continue
+            kept.append(row)
+            lons.append(coords[0])
+            lats.append(coords[1])
+
+        self.rows = kept
+        self.lon = np.asarray(lons, dtype=float)
+        self.lat = np.asarray(lats, dtype=float)
+
+        cells: Dict[tuple, List[int]] = {}
+        cell_x = np.floor(self.lon / GRID_CELL_DEG).astype(np.int64)
+        cell_y = np.floor(self.lat / GRID_CELL_DEG).astype(np.int64)
+        for i, key in enumerate(zip(cell_x.tolist(), cell_y.tolist())):
+            cells.setdefault(key, []).append(i)
+        self.cells = {key: np.asarray(idx, dtype=np.int64) for key, idx in cells.items()}
+
+    def __len__(self):
+        return len(self.rows)
+
+    def _candidates(self, lon: float, lat: float, radius: float) -> np.ndarray:
+        min_lon, max_lon, min_lat, max_lat = bounding_box(lon, lat, radius)
+        x0, x1 = math.floor(min_lon / GRID_CELL_DEG), math.floor(max_lon / GRID_CELL_DEG)
+        y0, y1 = math.floor(min_lat / GRID_CELL_DEG), math.floor(max_lat / GRID_CELL_DEG)
+
+        if (x1 - x0 + 1) * (y1 - y0 + 1) >= len(self.cells):
+            return np.arange(len(self.rows), dtype=np.int64)
+
+        parts = [
+            self.cells[(x, y)]
+            for x in range(x0, x1 + 1)
+            for y in range(y0, y1 + 1)
+            if (x, y) in self.cells
+        ]
+        if not parts:
+            return np.empty(0, dtype=np.int64)
+        # Keep table order so equal distances sort the same way the full scan did
+        return np.sort(np.concatenate(parts))
+
+    def within(self, lon: float, lat: float, radius: float):
+        """반경 안의 (행 인덱스 배열, 거리 배열)을 테이블 순서대로 반환합니다."""
+        if not self.rows:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=float)
+        candidates = self._candidates(lon, lat, radius)
+        if candidates.size == 0:
+            return candidates, np.empty(0, dtype=float)
+        distances = haversine_np(lon, lat, self.lon[candidates], self.lat[candidates])
+        mask = distances <= radius
+        return candidates[mask], distances[mask]
+
+
+def _sorted_by_distance(items: List[Dict[str, Any]], top_k: Optional[int]):
+    items = sorted(items, key=lambda x: x.get("distance", float("inf")))
+    return items[:top_k] if top_k else items
+
+
+class SpatialIndex:
+    """Facilities, course points and festivals indexed once for radius queries."""
+
+    def __init__(self, facilities, courses, festivals, data_versions: Optional[dict] = None):
+        # tour.db data versions the rows were read at (see DataVersionWatch)
+        self.data_versions = data_versions or {}
+        self.facilities = PointSet(facilities)
+        self.courses = PointSet(courses)
+        self.festivals = PointSet(festivals)
+
+    def search(
+        self,
+        latitude: float,
+        longitude: float,
+        radius: float,
+        current_festival_id: Optional[str] = None,
+        top_k: Optional[int] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        lon, lat, radius = float(longitude), float(latitude), float(radius)
+
+        facilities_recs = []
+        idx, dist = self.facilities.within(lon, lat, radius)
+        for i, distance in zip(idx.tolist(), dist.tolist()):
+            place_dict = dict(self.facilities.rows[i])
+            place_dict["distance"] = distance
+            facilities_recs.append(place_dict)
+
+        # Course points are grouped per contentid; the course distance is its closest point
+        courses_recs_grouped = {}
+        min_course_distances = {}
+        idx, dist = self.courses.within(lon, lat, radius)
+        for i, distance in zip(idx.tolist(), dist.tolist()):
+            course_dict = dict(self.courses.rows[i])
+            content_id = course_dict["contentid"]
+            if content_id not in min_course_distances or distance < min_course_distances[content_id]:
+                min_course_distances[content_id] = distance
+            if content_id not in courses_recs_grouped:
+                courses_recs_grouped[content_id] = {"main_info": course_dict, "sub_points": []}
+            courses_recs_grouped[content_id]["sub_points"].append(course_dict)
+
+        courses_recs = []
+        for content_id, course_group in courses_recs_grouped.items():
+            main_info_copy = course_group["main_info"].copy()
+            main_info_copy["sub_points"] = sorted(
+                course_group["sub_points"], key=lambda x: x.get("subnum", 0)
+            )
+            main_info_copy["distance"] = min_course_distances.get(content_id, float("inf"))
+            courses_recs.append(main_info_copy)
+
+        festivals_recs = []
+        idx, dist = self.festivals.within(lon, lat, radius)
+        for i, distance in zip(idx.tolist(), dist.tolist()):
+            festival_row = self.festivals.rows[i]
+            # Exclude the current festival from its own recommendation list
+            if current_festival_id and festival_row["contentid"] == current_festival_id:
+                continue
+            festival_dict = dict(festival_row)
+            festival_dict["distance"] = distance
+            festivals_recs.append(festival_dict)
+
+        return {
+            "facilities": _sorted_by_distance(facilities_recs, top_k),
+            "courses": _sorted_by_distance(courses_recs, top_k),
+            "festivals": _sorted_by_distance(festivals_recs, top_k),
+        }
+
+
+SPATIAL_TABLES = ("facilities", "courses", "festivals")
+
+
+class RTreeSpatialIndex:
+    """
+    tour.db의 R*Tree로 반경을 감싸는 사각형 안의 행만 읽어 와서, SpatialIndex와 같은 방식으로 거리를 계산합니다.
+    메모리에 테이블을 들고 있지 않으므로 워커가 많을 때 메모리를 아끼고, 다른 프로세스의 적재도 바로 반영됩니다.
+    """
+
+    def search(
+        self,
+        latitude: float,
+        longitude: float,
+        radius: float,
+        current_festival_id: Optional[str] = None,
+        top_k: Optional[int] = None,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        box = bounding_box(float(longitude), float(latitude), float(radius))
+        tables = {
+            # ORDER BY id keeps table order, so equal distances sort the same way as the in-memory index
+            table: fetch_all(
+                f"SELECT t.* FROM {table}_rtree r JOIN {table} t ON t.id = r.id "
+                "WHERE r.max_lon >= ? AND r.min_lon <= ? AND r.max_lat >= ? AND r.min_lat <= ? "
+                "ORDER BY t.id",
+                (box[0], box[1], box[2], box[3]),
+            )
+            for table in SPATIAL_TABLES
+        }
+        # The candidates are few, so indexing them per query is cheap
+        index = SpatialIndex(tables["facilities"], tables["courses"], tables["festivals"])
+        return index.search(latitude, longitude, radius, current_festival_id=current_festival_id, top_k=top_k)
+
+
+def _rtree_tables_exist() -> bool:
+    # Migration v3 is skipped on SQLite builds without the rtree module
+    placeholders = ", ".join("?" for _ in SPATIAL_TABLES)
+    row = fetch_one(
+        f"SELECT COUNT(*) AS count FROM sqlite_master WHERE type = 'table' AND name IN ({placeholders})",
+        tuple(f"{table}_rtree" for table in SPATIAL_TABLES),
+    )
+    return row["count"] == len(SPATIAL_TABLES)
+
+
+def build_spatial_index() -> SpatialIndex:
+    # Read the versions first: a load landing mid-build then shows up as a newer version and triggers a rebuild
+    data_versions = get_data_versions(SPATIAL_TABLES)
+    conn = get_db_connection()
+    try:
+        tables = {}
+        for table in SPATIAL_TABLES:
+            rows = conn.execute(
+                f"SELECT * FROM {table} WHERE mapx IS NOT NULL AND mapy IS NOT NULL"
+            ).fetchall()
+            tables[table] = [dict(row) for row in rows]
+    finally:
+        conn.close()
+    index = SpatialIndex(tables["facilities"], tables["courses"], tables["festivals"], data_versions)
+    print(
+        f"[SpatialIndex] Built (facilities: {len(index.facilities)}, "
+        f"course points: {len(index.courses)}, festivals: {len(index.festivals)})"
+    )
+    return index
+
+
+_spatial_index: Optional[SpatialIndex] = None
+_spatial_index_lock = threading.Lock()
+_data_versions = DataVersionWatch(SPATIAL_TABLES)
+_rtree_index: Optional[RTreeSpatialIndex] = None
+_rtree_checked = False
+
+
+def _get_rtree_index() -> Optional[RTreeSpatialIndex]:
+    global _rtree_index, _rtree_checked
+    if not _rtree_checked:
+        with _spatial_index_lock:
+            if not _rtree_checked:
+                if _rtree_tables_exist():
+                    _rtree_index = RTreeSpatialIndex()
+                    print("[SpatialIndex] Using the tour.db R*Tree for nearby search.")
+                else:
+                    print("[SpatialIndex] Warning: R*Tree tables not found, using the in-memory index.")
+                _rtree_checked = True
+    return _rtree_index
+
+
+def get_spatial_index():
+    """
+    공유 공간 인덱스를 반환합니다. 최초 호출 시 생성하고, 그 뒤에는 (다른 프로세스의 적재를 포함해)
+    facilities/courses/festivals의 데이터 버전이 바뀐 것을 확인하면 다시 만듭니다.
+    SPATIAL_INDEX_BACKEND=rtree이고 R*Tree 테이블이 있으면 대신 RTreeSpatialIndex를 반환합니다.
+    """
+    global _spatial_index
+    if SPATIAL_INDEX_BACKEND == "rtree":
+        rtree_index = _get_rtree_index()
+        if rtree_index is not None:
+            return rtree_index
+    index = _spatial_index
+    if index is not None and not _data_versions.changed_since(index.data_versions):
+        return index
+    with _spatial_index_lock:
+        # Rebuild only if no other thread has already replaced the index we found stale
+        if _spatial_index is index:
+            _spatial_index = build_spatial_index()
+        return _spatial_index
+
+
+def invalidate_spatial_index():
+    """DB 내용이 갱신되었을 때 다음 조회에서 인덱스를 다시 만들도록 합니다."""
+    global _spatial_index
+    with _spatial_index_lock:
+        _spatial_index = None
@@ -2,6 +2,7 @@ import traceback
 import re
 # src/application/use_cases/analysis_use_case.py
 
+import asyncio
 import os
 import shutil
 import requests
@@ -16,15 +17,21 @@ from matplotlib import font_manager
 from PIL import Image, ImageDraw, ImageFont
 import numpy as np
 from wordcloud import WordCloud
-from konlpy.tag import Okt
 
 # Custom Module Imports
 from src.infrastructure.external_services.naver_search.naver_review_api import (
-    get_naver_trend,
     search_naver_blog,
 )
+from src.infrastructure.external_services.naver_search.trend_store import (
+    get_trend_series,
+)
 from src.application.services.festival_service import get_festival_details_by_title
 from application.agents.naver_review.naver_review_agent import NaverReviewAgent
+from src.infrastructure.okt_tagger import get_okt_tagger
+from src.infrastructure.cache.single_flight import SingleFlight
+
+# 같은 축제/파라미터로 동시에 들어온 워드클라우드 요청을 하나로 합침
+_in_flight = SingleFlight()
 
 
 class AnalysisUseCase:
@@ -41,7 +48,7 @@ class AnalysisUseCase:
         self.title_to_cat_map = title_to_cat_map
         self.cat_to_icon_map = cat_to_icon_map
         self.script_dir = script_dir
-        self.okt = Okt()
+        self.tagger = get_okt_tagger()
 
         # Auto-detect database path for assets
         backend_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
@@ -71,7 +78,7 @@ class AnalysisUseCase:
         # --- 1. 1-Year Trend Graph ---
         today = datetime.today()
         start_date_yearly = today - timedelta(days=365)
-        trend_data_yearly = get_naver_trend(festival_name, start_date_yearly, today)
+        trend_data_yearly = await get_trend_series(festival_name, start_date_yearly, today)
 
         fig_trend_yearly, ax_yearly = plt.subplots(figsize=(10, 5))
         if trend_data_yearly:
@@ -117,7 +124,7 @@ class AnalysisUseCase:
                 if not is_future_event:
                     graph_start = center_date - timedelta(days=7)
                     graph_end = center_date + timedelta(days=7)
-                    trend_data_event = get_naver_trend(
+                    trend_data_event = await get_trend_series(
                         festival_name, graph_start, graph_end
                     )
 
@@ -133,7 +140,7 @@ class AnalysisUseCase:
                         if graph_end > today:
                             continue
 
-                        trend_data_event = get_naver_trend(
+                        trend_data_event = await get_trend_series(
                             festival_name, graph_start, graph_end
                         )
                         if trend_data_event:
@@ -195,10 +202,18 @@ class AnalysisUseCase:
         return trend_image_yearly, trend_image_event, "트렌드 그래프 생성 완료"
 
     async def generate_word_cloud(self, festival_name: str, num_reviews: int):
+        """같은 (축제, 리뷰 수)로 동시에 들어온 요청은 하나의 수집/분석 결과를 함께 받습니다."""
         if not festival_name:
             return None, "축제를 선택해주세요."
 
-        if WordCloud is None or self.okt is None or np is None:
+        return await _in_flight.share(
+            ("wordcloud", festival_name, num_reviews),
+            lambda: self._generate_word_cloud(festival_name, num_reviews),
+        )
+
+    async def _generate_word_cloud(self, festival_name: str, num_reviews: int):
+
+        if WordCloud is None or self.tagger is None or np is None:
             return (
                 None,
                 "`wordcloud`, `konlpy`, 또는 `numpy` 라이브러리가 설치되지 않았습니다.",
@@ -247,10 +262,11 @@ class AnalysisUseCase:
 
         wc_image = None
         if review_texts:
+            # All reviews go through the tagger in as few JVM calls as possible
             nouns = [
                 word
-                for text in review_texts
-                for word in self.okt.nouns(text)
+                for text_nouns in await asyncio.to_thread(self.tagger.nouns_many, review_texts)
+                for word in text_nouns
                 if len(word) > 1 and word not in stopwords
             ]
             counts = Counter(nouns)
@@ -303,33 +319,31 @@ class AnalysisUseCase:
                 found_blogs_with_images < target_blog_count
                 and start_index < max_results_to_scan
             ):
-                blog_reviews = search_naver_blog(
+                blog_reviews = await search_naver_blog(
                     f"{processed_festival_name} 후기", display=display_count, start=start_index
                 )
                 if not blog_reviews:
                     break
 
-                for review in blog_reviews:
+                # One relevance call for the whole page instead of one per blog
+                screened = await self.naver_supervisor._scrape_and_classify(
+                    processed_festival_name,
+                    blog_reviews,
+                    accept=lambda text, images: (
+                        text and "본문 내용을 찾을 수 없습니다" not in text and images
+                    ),
+                )
+
+                for review, screen in zip(blog_reviews, screened):
                     if found_blogs_with_images >= target_blog_count:
                         break
                     if consecutive_skips >= 3:
                         break
 
-                    link = review.get("link")
-                    if link and "blog.naver.com" in link:
-                        text_content, image_urls = (
-                            await self.naver_supervisor._scrape_blog_content(link)
-                        )
-                        if (
-                            text_content
-                            and "본문 내용을 찾을 수 없습니다" not in text_content
-                            and image_urls
-                        ):
-                            is_relevant = await self.naver_supervisor._is_relevant_review(
-                                processed_festival_name, review.get("title", ""), text_content
-                            )
-                            if is_relevant:
-                                all_image_urls.extend(image_urls)
+                    if screen is not None:
+                        if screen["accepted"]:
+                            if screen["is_relevant"]:
+                                all_image_urls.extend(screen["image_urls"])
                                 found_blogs_with_images += 1
                                 consecutive_skips = 0
                             else:
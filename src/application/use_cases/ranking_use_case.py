@@ -9,24 +9,28 @@ from datetime import datetime, timedelta
 # Custom Module Imports
 from application.agents.naver_review.naver_review_agent import NaverReviewAgent
 from src.infrastructure.external_services.naver_search.naver_review_api import (
-    get_naver_trend,
     search_naver_blog,
 )
+from src.infrastructure.external_services.naver_search.trend_store import (
+    get_trend_series,
+)
 from src.application.core.graph import app_llm_graph
 from src.infrastructure.llm_client import get_llm_client
 from src.application.core.constants import NO_IMAGE_URL
 
 
 class RankingUseCase:
-    def __init__(self, naver_supervisor: NaverReviewAgent):
+    def __init__(self, naver_supervisor: NaverReviewAgent, precompute=None):
         self.naver_supervisor = naver_supervisor
+        # PrecomputeService serving the "ranking_components" results (None computes them per request)
+        self.precompute = precompute
 
-    def _get_trend_score(self, keyword: str, days: int) -> float:
+    async def _get_trend_score(self, keyword: str, days: int) -> float:
         if not keyword:
             return 0.0
         today = datetime.today()
         start_date = today - timedelta(days=days)
-        trend_data = get_naver_trend(keyword, start_date, today)
+        trend_data = await get_trend_series(keyword, start_date, today)
         if not trend_data:
             return 0.0
         df = pd.DataFrame(trend_data)
@@ -41,7 +45,7 @@ class RankingUseCase:
             return 50.0, []
 
         search_keyword = f"{keyword} 후기"
-        api_results = search_naver_blog(
+        api_results = await search_naver_blog(
             search_keyword, display=num_reviews + 5
         )  # Add buffer
         if not api_results:
@@ -76,7 +80,7 @@ class RankingUseCase:
                 if len(content) > max_content_length:
                     content = content[:max_content_length]
 
-                final_state = app_llm_graph.invoke(
+                final_state = await app_llm_graph.ainvoke(
                     {
                         "original_text": content,
                         "keyword": keyword,
@@ -133,7 +137,7 @@ class RankingUseCase:
             return "키워드가 없어 트렌드 분석 불가"
         today = datetime.today()
         start_date = today - timedelta(days=90)
-        trend_data = get_naver_trend(keyword, start_date, today)
+        trend_data = await get_trend_series(keyword, start_date, today)
         if not trend_data:
             return "트렌드 데이터 없음"
         df = pd.DataFrame(trend_data)
@@ -421,8 +425,8 @@ class RankingUseCase:
                     sub_title = sub.get("subname", "")
                     if not sub_title:
                         continue
-                    q_trend_scores.append(self._get_trend_score(sub_title, days=90))
-                    y_trend_scores.append(self._get_trend_score(sub_title, days=365))
+                    q_trend_scores.append(await self._get_trend_score(sub_title, days=90))
+                    y_trend_scores.append(await self._get_trend_score(sub_title, days=365))
                     s_score, judgments = await self._get_sentiment_score(
                         sub_title, num_reviews
                     )
@@ -451,8 +455,8 @@ class RankingUseCase:
                 )
             else:
                 title = place.get("title", "")
-                quarterly_trend_score = self._get_trend_score(title, days=90)
-                yearly_trend_score = self._get_trend_score(title, days=365)
+                quarterly_trend_score = await self._get_trend_score(title, days=90)
+                yearly_trend_score = await self._get_trend_score(title, days=365)
                 sentiment_score, judgments = await self._get_sentiment_score(
                     title, num_reviews
                 )
@@ -565,6 +569,30 @@ class RankingUseCase:
 
         return score
 
+    async def compute_festival_components(self, title: str, num_reviews: int) -> dict:
+        """
+        축제 하나의 트렌드/감성 점수와 그 이유 요약을 계산합니다.
+        시간 점수는 오늘 날짜에 따라 바뀌므로 여기 포함하지 않고 순위 계산 때마다 구합니다.
+        """
+        quarterly_trend_score = await self._get_trend_score(title, days=90)
+        yearly_trend_score = await self._get_trend_score(title, days=365)
+        sentiment_score, judgments = await self._get_sentiment_score(
+            title, num_reviews
+        )
+
+        # Get reasons for scores
+        trend_reason, sentiment_reason = await asyncio.gather(
+            self._summarize_trend_reasons(title),
+            self._summarize_sentiment_reasons(judgments, title),
+        )
+        return {
+            "quarterly_trend_score": round(float(quarterly_trend_score), 2),
+            "yearly_trend_score": round(float(yearly_trend_score), 2),
+            "sentiment_score": round(float(sentiment_score), 2),
+            "trend_reason": trend_reason,
+            "sentiment_reason": sentiment_reason,
+        }
+
     async def rank_festivals(
         self, festivals_list: list, num_reviews: int, top_n: int, progress=None
     ):
@@ -580,24 +608,14 @@ class RankingUseCase:
             time_score = self._get_time_score(start_date, end_date)
             festival["time_score"] = round(time_score * 100, 2)
 
-            # 2. Calculate Trend and Sentiment Scores
-            quarterly_trend_score = self._get_trend_score(title, days=90)
-            yearly_trend_score = self._get_trend_score(title, days=365)
-            sentiment_score, judgments = await self._get_sentiment_score(
-                title, num_reviews
-            )
-
-            festival["quarterly_trend_score"] = round(quarterly_trend_score, 2)
-            festival["yearly_trend_score"] = round(yearly_trend_score, 2)
-            festival["sentiment_score"] = round(sentiment_score, 2)
-
-            # Get reasons for scores
-            trend_reason, sentiment_reason = await asyncio.gather(
-                self._summarize_trend_reasons(title),
-                self._summarize_sentiment_reasons(judgments, title),
-            )
-            festival["trend_reason"] = trend_reason
-            festival["sentiment_reason"] = sentiment_reason
+            # 2. Trend and Sentiment Scores (precomputed offline when available)
+            if self.precompute is not None:
+                components = await self.precompute.get_or_compute(
+                    "ranking_components", title, {"num_reviews": num_reviews}
+                )
+            else:
+                components = await self.compute_festival_components(title, num_reviews)
+            festival.update(components)
 
             # 3. Calculate Final Weighted Score
             w_time = 0.6
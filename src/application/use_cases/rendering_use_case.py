@@ -28,7 +28,7 @@ class RenderingUseCase:
         """
         # [참고] self.client는 gemini-pro-vision이므로 이미지 생성에 사용되지 않습니다.
         # _generate_image 함수는 노트북 코드를 따라 genai.GenerativeModel을 직접 사용합니다.
-        self.client = get_llm_client(model="gemini-pro-vision", temperature=0.8)
+        self.client = get_llm_client(model="gemini-pro-vision", temperature=0.8, cache=False)
 
         try:
             self.maps_api_key = get_google_maps_key()
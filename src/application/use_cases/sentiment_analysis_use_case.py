@@ -2,14 +2,14 @@
 
 import os
 import re
+import asyncio
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 from datetime import datetime
 import traceback
 
 import json
-from collections import Counter
+from collections import Counter, deque
 
 # Custom Module Imports
 from application.agents.naver_review.naver_review_agent import NaverReviewAgent
@@ -19,26 +19,64 @@ from src.infrastructure.external_services.naver_search.naver_review_api import (
 from src.application.core.graph import app_llm_graph
 from src.application.core.utils import (
     save_df_to_csv,
-    summarize_negative_feedback,
-)
-from src.infrastructure.reporting.charts import (
-    create_donut_chart,
-    create_stacked_bar_chart,
-    create_satisfaction_level_bar_chart,
-    create_absolute_score_line_chart,
-    create_outlier_boxplot,
+    asummarize_negative_feedback,
 )
+from src.infrastructure.reporting.chart_renderer import get_chart_renderer
 from src.infrastructure.reporting.wordclouds import create_sentiment_wordclouds
 from src.application.core.constants import CATEGORY_TO_ICON_MAP
 from src.infrastructure.llm_client import get_llm_client
 from src.domain.knowledge_base import knowledge_base
+from src.infrastructure.cache.single_flight import SingleFlight
+
+
+# 동시에 스크래핑/분석할 블로그 수
+SENTIMENT_PIPELINE_CONCURRENCY = int(os.getenv("SENTIMENT_PIPELINE_CONCURRENCY", "4"))
+
+# 같은 축제/리뷰 수로 동시에 들어온 감성 분석 요청을 하나로 합침
+_in_flight = SingleFlight()
+
+
+class _BlogEventFanout:
+    """
+    하나의 감성 분석에서 나온 블로그 이벤트를 그 분석을 함께 기다리는 모든 호출자의 on_blog로 전달합니다.
+    늦게 합류한 호출자에게는 이미 나온 이벤트를 먼저 재생합니다.
+    """
+
+    def __init__(self):
+        self.events = []
+        self.listeners = []
+
+    def publish(self, event: dict):
+        self.events.append(event)
+        for listener in list(self.listeners):
+            try:
+                listener(event)
+            except Exception as e:
+                print(f"블로그 이벤트 전달 중 오류: {e}")
+
+    def subscribe(self, listener):
+        for event in self.events:
+            listener(event)
+        self.listeners.append(listener)
+
+    def unsubscribe(self, listener):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
 
 
 class SentimentAnalysisUseCase:
-    def __init__(self, naver_supervisor: NaverReviewAgent, script_dir: str):
+    def __init__(
+        self,
+        naver_supervisor: NaverReviewAgent,
+        script_dir: str,
+        pipeline_concurrency: int = SENTIMENT_PIPELINE_CONCURRENCY,
+    ):
         self.naver_supervisor = naver_supervisor
         self.script_dir = script_dir
+        self.pipeline_concurrency = max(1, pipeline_concurrency)
         self.llm = get_llm_client(temperature=0.1)
+        # (festival_name, num_reviews) -> event fan-out of the analysis currently in flight
+        self._blog_fanouts = {}
 
     async def _generate_distribution_interpretation(self, counts: dict, total_sentences: int, boundaries: dict, avg_score: float) -> str:
         if total_sentences == 0:
@@ -137,6 +175,18 @@ class SentimentAnalysisUseCase:
         html += "</ul></div>"
         return html
 
+    @staticmethod
+    def _has_json_array(content: str) -> bool:
+        # Only cache keyword summaries that will parse; a malformed one would otherwise be served for the whole TTL
+        match = re.search(r"\[.*\]", content, re.DOTALL)
+        if not match:
+            return False
+        try:
+            json.loads(match.group())
+        except json.JSONDecodeError:
+            return False
+        return True
+
     async def _generate_positive_keywords_summary(
         self, aspect_sentiment_pairs: list
     ) -> list:
@@ -145,12 +195,7 @@ class SentimentAnalysisUseCase:
 
         # Filter for positive sentiment pairs
         positive_pairs = []
-        sentiment_dictionaries = {
-            **knowledge_base.adjectives,
-            **knowledge_base.adverbs,
-            **knowledge_base.sentiment_nouns,
-            **knowledge_base.idioms,
-        }
+        sentiment_dictionaries = knowledge_base.lexicon.sentiment_scores
         for aspect, sentiment in aspect_sentiment_pairs:
             if sentiment in sentiment_dictionaries:
                 scores = sentiment_dictionaries[sentiment]
@@ -192,7 +237,7 @@ class SentimentAnalysisUseCase:
         ]
         """
         try:
-            response = await self.llm.ainvoke(prompt)
+            response = await self.llm.ainvoke(prompt, cache_if=self._has_json_array)
             # Extract JSON from the response
             json_str_match = re.search(r"\[.*\]", response.content, re.DOTALL)
             if json_str_match:
@@ -265,105 +310,369 @@ class SentimentAnalysisUseCase:
         cleaned_name = re.sub(r"^\d{4}\s*년?\s*", "", festival_name).strip()
         return cleaned_name if cleaned_name else festival_name # Return original if only year was present or no change
 
-    async def analyze_sentiment(self, festival_name: str, num_reviews: int):
-        if not festival_name:
-            raise ValueError("축제를 선택해주세요.")
+    async def render_charts(self, festival_name: str, result: dict) -> dict:
+        """
+        analyze_sentiment() 결과의 chart_inputs로 차트를 그려 PNG 바이트로 반환합니다 (데이터가 없는 차트는 None).
+        분석과 분리되어 있어, 차트 데이터만 필요한 응답은 matplotlib 렌더링을 전혀 거치지 않습니다.
+        """
+        inputs = result["chart_inputs"]
+        renderer = get_chart_renderer()
+        pngs = await asyncio.gather(
+            renderer.render_chart(
+                "satisfaction", inputs["satisfaction_counts"], f"{festival_name} 상대적 만족도 분포"
+            ),
+            renderer.render_chart(
+                "absolute_scores", inputs["scores"], f"{festival_name} 절대 점수 분포"
+            ),
+            renderer.render_chart(
+                "outliers", inputs["scores"], f"{festival_name} 감성 점수 이상치"
+            ),
+            renderer.render_chart(
+                "donut", inputs["total_pos"], inputs["total_neg"], f"{festival_name} 전체 후기 요약"
+            ),
+        )
+        charts = dict(zip(("distribution_chart", "absolute_chart", "outlier_chart", "overall_chart"), pngs))
 
-        # Preprocess festival_name to remove leading year
-        processed_festival_name = self._remove_leading_year(festival_name)
-        print(f"Original festival name: {festival_name}, Processed: {processed_festival_name}")
+        # Save for debugging/legacy use
+        for key, prefix in (
+            ("distribution_chart", "dist_chart"),
+            ("absolute_chart", "abs_chart"),
+            ("outlier_chart", "outlier_chart"),
+        ):
+            if charts[key]:
+                self._save_chart_png(charts[key], f"{prefix}_{festival_name}.png")
+        return charts
 
-        search_keyword = f"{processed_festival_name} 후기"
+    def _save_chart_png(self, png: bytes, file_name: str):
+        path = os.path.join(self.script_dir, "temp_img", file_name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(png)
 
-        blog_results_list = []
-        blog_judgments_list = []
-        all_scores = []
-        all_negative_sentences = []
-        all_aspect_sentiment_pairs = []
-        total_pos, total_neg = 0, 0
+    def _summarize_blog(self, blog: dict, judgments: list, boundaries: dict) -> dict:
+        """
+        블로그 한 개의 문장 판정에 만족도 단계를 매기고(judgments의 각 항목에 satisfaction_level 기록),
+        블로그 요약 행과 집계에 필요한 값을 반환합니다.
+        """
+        satisfaction_levels = []
+        negative_sentences = []
+        pos_count = 0
+        neg_count = 0
+
+        for j in judgments:
+            level = self._map_score_to_level(j["score"], boundaries)
+            j["satisfaction_level"] = level
+            satisfaction_levels.append(level)
+
+            if j["final_verdict"] == "긍정":
+                pos_count += 1
+            else:
+                neg_count += 1
+                negative_sentences.append(j["sentence"])
+
+        avg_satisfaction = (
+            np.mean(satisfaction_levels) if satisfaction_levels else 3.0
+        )
+        pos_perc = (
+            (pos_count / (pos_count + neg_count) * 100)
+            if (pos_count + neg_count) > 0
+            else 0
+        )
+        neg_perc = (
+            (neg_count / (pos_count + neg_count) * 100)
+            if (pos_count + neg_count) > 0
+            else 0
+        )
+
+        row = {
+            "블로그 제목": blog["블로그 제목"],
+            "링크": blog["링크"],
+            "감성 빈도": len(judgments),
+            "감성 점수": f"{avg_satisfaction:.2f} / 5",
+            "긍정 문장 수": pos_count,
+            "부정 문장 수": neg_count,
+            "긍정 비율 (%)": f"{pos_perc:.1f}",
+            "부정 비율 (%)": f"{neg_perc:.1f}",
+            "긍/부정 문장 요약": "<br>---<br>".join(
+                [
+                    f"[{j['final_verdict']}({j['satisfaction_level']}점)] {j['sentence']}"
+                    for j in judgments
+                ]
+            ),
+            "만족도 점수": f"{avg_satisfaction:.2f} / 5",  # Keep for backwards compatibility
+        }
+        return {
+            "row": row,
+            "satisfaction_levels": satisfaction_levels,
+            "negative_sentences": negative_sentences,
+            "pos_count": pos_count,
+            "neg_count": neg_count,
+        }
 
+    @staticmethod
+    def _is_analyzable(content: str, _image_urls=None) -> bool:
+        return bool(content) and "오류" not in content and "찾을 수 없습니다" not in content
+
+    async def _analyze_blog(
+        self, blog_data: dict, processed_festival_name: str, page_screening, position: int
+    ):
+        """
+        블로그 한 개를 LLM 그래프로 분석합니다.
+        스크래핑과 관련성 판별은 페이지 단위 작업(page_screening)이 한꺼번에 처리하므로, 그 결과를 기다렸다가 사용합니다.
+        분석에 쓸 수 없는 블로그(본문 없음, 무관함, 판정 없음)는 None을 반환합니다.
+        """
+        screen = (await asyncio.shield(page_screening))[position]
+        if screen is None or not screen["accepted"] or not screen["is_relevant"]:
+            return None
+
+        content = screen["text"][:30000]
+
+        final_state = await app_llm_graph.ainvoke(
+            {
+                "original_text": content,
+                "keyword": processed_festival_name,
+                "title": re.sub(r"<[^>]+>", "", blog_data["title"]).strip(),
+                "log_details": True,
+                "is_relevant": True,
+                "relevance_checked": True,
+            },
+        )
+
+        if (
+            not final_state
+            or not final_state.get("is_relevant")
+            or not final_state.get("final_judgments")
+        ):
+            return None
+
+        return {
+            "judgments": final_state.get("final_judgments", []),
+            "aspect_pairs": final_state.get("aspect_sentiment_pairs", []),
+        }
+
+    async def _collect_blog_analyses(
+        self,
+        festival_name: str,
+        processed_festival_name: str,
+        search_keyword: str,
+        num_reviews: int,
+        on_collected=None,
+    ) -> list:
+        """
+        검색 결과 블로그를 최대 pipeline_concurrency 개까지 동시에 분석하고,
+        (blog_data, analysis) 목록을 검색 결과 순서대로 반환합니다.
+        on_collected(blog_data, analysis)가 주어지면 블로그 하나가 수집될 때마다 바로 호출합니다.
+
+        결과는 항상 검색 순서대로 반영하므로, 수집 결과와 중단 시점은 한 개씩 처리하던 때와 같습니다:
+        - num_reviews 개를 모으면 중단
+        - 분석할 수 없는 블로그마다 consecutive_skips 증가, 성공하면 0으로 초기화
+        - 검색 결과 페이지를 다 처리한 시점에 consecutive_skips >= 3 이면 중단
+        중단 시점에 남아 있는 작업은 취소합니다.
+        """
         start_index = 1
         max_results_to_scan = 100
         display_count = 20
         consecutive_skips = 0
 
-        while (
-            len(blog_results_list) < num_reviews and start_index < max_results_to_scan
-        ):
-            api_results = search_naver_blog(
+        collected = []
+        buffered = deque()  # (blog_data or None, is_page_end, page task, position) waiting to be started
+        in_flight = deque()  # (blog_data or None, is_page_end, task or None), in search order
+        page_tasks = []  # per-page scrape + batched relevance screening
+        search_exhausted = False
+
+        async def fetch_next_page():
+            nonlocal start_index, search_exhausted
+            if start_index >= max_results_to_scan:
+                search_exhausted = True
+                return
+            api_results = await search_naver_blog(
                 search_keyword, display=display_count, start=start_index
             )
+            start_index += display_count
             if not api_results:
-                break
-
+                search_exhausted = True
+                return
             candidate_blogs = [
                 item for item in api_results if "blog.naver.com" in item["link"]
             ]
-            for blog_data in candidate_blogs:
-                if len(blog_results_list) >= num_reviews:
-                    break
-                try:
-                    content, _ = await self.naver_supervisor._scrape_blog_content(
-                        blog_data["link"]
+            if not candidate_blogs:
+                # A page with no candidates still ends a page for the give-up check
+                buffered.append((None, True, None, None))
+                return
+            # Scrape the whole page at once and judge relevance in a single LLM call
+            page_task = asyncio.create_task(
+                self.naver_supervisor._scrape_and_classify(
+                    processed_festival_name,
+                    candidate_blogs,
+                    accept=self._is_analyzable,
+                    # Same criteria as the graph's content validator: short relevant posts stay in
+                    require_substance=False,
+                )
+            )
+            page_tasks.append(page_task)
+            for i, blog_data in enumerate(candidate_blogs):
+                buffered.append((blog_data, i == len(candidate_blogs) - 1, page_task, i))
+
+        try:
+            while len(collected) < num_reviews:
+                # Keep the window full so scraping/LLM work overlaps
+                while len(in_flight) < self.pipeline_concurrency:
+                    if not buffered:
+                        if search_exhausted:
+                            break
+                        await fetch_next_page()
+                        continue
+                    blog_data, is_page_end, page_task, position = buffered.popleft()
+                    task = (
+                        asyncio.create_task(
+                            self._analyze_blog(
+                                blog_data, processed_festival_name, page_task, position
+                            )
+                        )
+                        if blog_data is not None
+                        else None
                     )
-                    if (
-                        not content
-                        or "오류" in content
-                        or "찾을 수 없습니다" in content
-                    ):
+                    in_flight.append((blog_data, is_page_end, task))
+
+                if not in_flight:
+                    break
+
+                blog_data, is_page_end, task = in_flight.popleft()
+                if task is not None:
+                    try:
+                        analysis = await task
+                    except Exception as e:
+                        print(
+                            f"블로그 분석 중 오류 ({festival_name}, {blog_data.get('link', 'N/A')}): {e}"
+                        )
+                        traceback.print_exc()
                         consecutive_skips += 1
-                        continue
+                    else:
+                        if analysis is None:
+                            consecutive_skips += 1
+                        else:
+                            consecutive_skips = 0
+                            collected.append((blog_data, analysis))
+                            if on_collected is not None:
+                                on_collected(blog_data, analysis)
+
+                if len(collected) >= num_reviews:
+                    break
+                if is_page_end and consecutive_skips >= 3:
+                    break
+        finally:
+            # Enough reviews (or give-up): drop the speculative work still running
+            pending = [task for _, _, task in in_flight if task is not None]
+            pending += [task for task in page_tasks if not task.done()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
 
-                    content = content[:30000]
+        return collected
 
-                    final_state = app_llm_graph.invoke(
-                        {
-                            "original_text": content,
-                            "keyword": processed_festival_name,
-                            "title": re.sub(r"<[^>]+>", "", blog_data["title"]).strip(),
-                            "log_details": True,
-                        }
-                    )
+    async def analyze_sentiment(self, festival_name: str, num_reviews: int, on_blog=None):
+        """
+        축제 후기 블로그를 분석해 감성 분석 결과(요약, 차트, 블로그 목록)를 반환합니다.
+        on_blog(event)가 주어지면 블로그 하나의 분석이 끝날 때마다 그 블로그의 판정, 요약 행,
+        지금까지의 잠정 집계를 담은 dict로 호출합니다. 잠정 값의 만족도 단계는 그때까지 모인 점수 기준이며,
+        최종 결과에서는 전체 점수 기준으로 다시 계산됩니다.
 
-                    if (
-                        not final_state
-                        or not final_state.get("is_relevant")
-                        or not final_state.get("final_judgments")
-                    ):
-                        consecutive_skips += 1
-                        continue
+        같은 (축제, 리뷰 수)로 동시에 들어온 호출은 하나의 분석을 함께 기다리고 같은 결과를 받습니다.
+        """
+        if not festival_name:
+            raise ValueError("축제를 선택해주세요.")
 
-                    consecutive_skips = 0
-                    judgments = final_state.get("final_judgments", [])
-                    aspect_pairs = final_state.get("aspect_sentiment_pairs", [])
-                    blog_judgments_list.append(judgments)
-                    all_scores.extend([j["score"] for j in judgments])
-                    all_aspect_sentiment_pairs.extend(aspect_pairs)
-
-                    blog_results_list.append(
-                        {
-                            "블로그 제목": re.sub(
-                                r"<[^>]+>", "", blog_data["title"]
-                            ).strip(),
-                            "링크": blog_data["link"],
-                            "postdate": blog_data.get("postdate", ""),
-                            "judgments": judgments,
-                        }
-                    )
+        key = (festival_name, num_reviews)
+        fanout = self._blog_fanouts.get(key)
+        if fanout is None:
+            fanout = self._blog_fanouts[key] = _BlogEventFanout()
 
-                except Exception as e:
-                    print(
-                        f"블로그 분석 중 오류 ({festival_name}, {blog_data.get('link', 'N/A')}): {e}"
-                    )
-                    traceback.print_exc()
-                    consecutive_skips += 1
-                    continue
+        async def compute():
+            try:
+                return await self._analyze_sentiment(
+                    festival_name, num_reviews, on_blog=fanout.publish
+                )
+            finally:
+                if self._blog_fanouts.get(key) is fanout:
+                    del self._blog_fanouts[key]
 
-                if consecutive_skips >= 3:
-                    break
-            if len(blog_results_list) >= num_reviews or consecutive_skips >= 3:
-                break
-            start_index += display_count
+        if on_blog is not None:
+            fanout.subscribe(on_blog)
+        try:
+            return await _in_flight.share(("sentiment", festival_name, num_reviews), compute)
+        finally:
+            if on_blog is not None:
+                fanout.unsubscribe(on_blog)
+
+    async def _analyze_sentiment(self, festival_name: str, num_reviews: int, on_blog=None):
+
+        # Preprocess festival_name to remove leading year
+        processed_festival_name = self._remove_leading_year(festival_name)
+        print(f"Original festival name: {festival_name}, Processed: {processed_festival_name}")
+
+        search_keyword = f"{processed_festival_name} 후기"
+
+        blog_results_list = []
+        blog_judgments_list = []
+        all_scores = []
+        all_negative_sentences = []
+        all_aspect_sentiment_pairs = []
+        total_pos, total_neg = 0, 0
+        provisional_pos, provisional_neg = 0, 0
+
+        def add_blog(blog_data, analysis):
+            nonlocal provisional_pos, provisional_neg
+            judgments = analysis["judgments"]
+            blog_judgments_list.append(judgments)
+            all_scores.extend([j["score"] for j in judgments])
+            all_aspect_sentiment_pairs.extend(analysis["aspect_pairs"])
+
+            blog = {
+                "블로그 제목": re.sub(
+                    r"<[^>]+>", "", blog_data["title"]
+                ).strip(),
+                "링크": blog_data["link"],
+                "postdate": blog_data.get("postdate", ""),
+                "judgments": judgments,
+            }
+            blog_results_list.append(blog)
+
+            if on_blog is None:
+                return
+            # Score the copy against the scores so far; the final pass re-levels every judgment
+            provisional_judgments = [dict(j) for j in judgments]
+            summary = self._summarize_blog(
+                blog,
+                provisional_judgments,
+                self._calculate_satisfaction_boundaries(all_scores)["boundaries"],
+            )
+            provisional_pos += summary["pos_count"]
+            provisional_neg += summary["neg_count"]
+            on_blog(
+                {
+                    "index": len(blog_results_list) - 1,
+                    "title": blog["블로그 제목"],
+                    "link": blog["링크"],
+                    "postdate": blog["postdate"],
+                    "judgments": provisional_judgments,
+                    "summary_row": summary["row"],
+                    "provisional": {
+                        "blog_count": len(blog_results_list),
+                        "target_count": num_reviews,
+                        "positive_count": provisional_pos,
+                        "negative_count": provisional_neg,
+                        "sentence_count": len(all_scores),
+                    },
+                }
+            )
+
+        await self._collect_blog_analyses(
+            festival_name,
+            processed_festival_name,
+            search_keyword,
+            num_reviews,
+            on_collected=add_blog,
+        )
 
         if not blog_results_list:
             raise ValueError(
@@ -378,60 +687,12 @@ class SentimentAnalysisUseCase:
         all_satisfaction_levels = []
 
         for blog in blog_results_list:
-            judgments = blog["judgments"]
-            blog_satisfaction_levels = []
-
-            pos_count = 0
-            neg_count = 0
-
-            for j in judgments:
-                level = self._map_score_to_level(j["score"], boundaries)
-                j["satisfaction_level"] = level
-                blog_satisfaction_levels.append(level)
-                all_satisfaction_levels.append(level)
-
-                if j["final_verdict"] == "긍정":
-                    pos_count += 1
-                else:
-                    neg_count += 1
-                    all_negative_sentences.append(j["sentence"])
-
-            total_pos += pos_count
-            total_neg += neg_count
-
-            avg_satisfaction = (
-                np.mean(blog_satisfaction_levels) if blog_satisfaction_levels else 3.0
-            )
-            pos_perc = (
-                (pos_count / (pos_count + neg_count) * 100)
-                if (pos_count + neg_count) > 0
-                else 0
-            )
-            neg_perc = (
-                (neg_count / (pos_count + neg_count) * 100)
-                if (pos_count + neg_count) > 0
-                else 0
-            )
-
-            processed_blog_results.append(
-                {
-                    "블로그 제목": blog["블로그 제목"],
-                    "링크": blog["링크"],
-                    "감성 빈도": len(judgments),
-                    "감성 점수": f"{avg_satisfaction:.2f} / 5",
-                    "긍정 문장 수": pos_count,
-                    "부정 문장 수": neg_count,
-                    "긍정 비율 (%)": f"{pos_perc:.1f}",
-                    "부정 비율 (%)": f"{neg_perc:.1f}",
-                    "긍/부정 문장 요약": "<br>---<br>".join(
-                        [
-                            f"[{j['final_verdict']}({j['satisfaction_level']}점)] {j['sentence']}"
-                            for j in judgments
-                        ]
-                    ),
-                    "만족도 점수": f"{avg_satisfaction:.2f} / 5",  # Keep for backwards compatibility
-                }
-            )
+            summary = self._summarize_blog(blog, blog["judgments"], boundaries)
+            all_satisfaction_levels.extend(summary["satisfaction_levels"])
+            all_negative_sentences.extend(summary["negative_sentences"])
+            total_pos += summary["pos_count"]
+            total_neg += summary["neg_count"]
+            processed_blog_results.append(summary["row"])
 
         overall_avg_satisfaction = (
             np.mean(all_satisfaction_levels) if all_satisfaction_levels else 3.0
@@ -443,55 +704,12 @@ class SentimentAnalysisUseCase:
             [level_map.get(level, "보통") for level in all_satisfaction_levels]
         )
         
-        distribution_chart_fig = None
-        if all_satisfaction_levels:
-            fig = create_satisfaction_level_bar_chart(
-                satisfaction_counts, f"{festival_name} 상대적 만족도 분포"
-            )
-            if fig:
-                distribution_chart_fig = fig
-                # Save for debugging/legacy use if needed, but don't close
-                distribution_chart_path = os.path.join(
-                    self.script_dir, "temp_img", f"dist_chart_{festival_name}.png"
-                )
-                os.makedirs(os.path.dirname(distribution_chart_path), exist_ok=True)
-                fig.savefig(distribution_chart_path)
-                # plt.close(fig) # Removed to pass fig object
-
-        absolute_chart_fig = None
-        if all_scores:
-            fig = create_absolute_score_line_chart(
-                all_scores, f"{festival_name} 절대 점수 분포"
-            )
-            if fig:
-                absolute_chart_fig = fig
-                absolute_chart_path = os.path.join(
-                    self.script_dir, "temp_img", f"abs_chart_{festival_name}.png"
-                )
-                os.makedirs(os.path.dirname(absolute_chart_path), exist_ok=True)
-                fig.savefig(absolute_chart_path)
-                # plt.close(fig) # Removed to pass fig object
-
         distribution_description = await self._generate_distribution_interpretation(
             satisfaction_counts, len(all_satisfaction_levels), boundaries, overall_avg_satisfaction
         )
         # --- End New ---
 
-        outlier_chart_fig = None
-        if all_scores:
-            fig = create_outlier_boxplot(
-                all_scores, f"{festival_name} 감성 점수 이상치"
-            )
-            if fig:
-                outlier_chart_fig = fig
-                outlier_chart_path = os.path.join(
-                    self.script_dir, "temp_img", f"outlier_chart_{festival_name}.png"
-                )
-                os.makedirs(os.path.dirname(outlier_chart_path), exist_ok=True)
-                fig.savefig(outlier_chart_path)
-                # plt.close(fig) # Removed to pass fig object
-
-        neg_summary_text = summarize_negative_feedback(all_negative_sentences)
+        neg_summary_text = await asummarize_negative_feedback(all_negative_sentences)
         overall_summary_text = f"- **총 분석 블로그**: {len(blog_results_list)}개\n- **전체 평균 만족도**: {overall_avg_satisfaction:.2f} / 5.0 점\n- **긍정 문장 수**: {total_pos}개\n- **부정 문장 수**: {total_neg}개"
 
         summary_df = pd.DataFrame(
@@ -509,10 +727,6 @@ class SentimentAnalysisUseCase:
         blog_df = pd.DataFrame(processed_blog_results)
         blog_list_csv_path = save_df_to_csv(blog_df, "blog_list", festival_name)
 
-        overall_chart = create_donut_chart(
-            total_pos, total_neg, f"{festival_name} 전체 후기 요약"
-        )
-
         # Generate "What I liked" summary
         positive_keywords_data = await self._generate_positive_keywords_summary(
             all_aspect_sentiment_pairs
@@ -569,11 +783,14 @@ class SentimentAnalysisUseCase:
             "blog_df": blog_df,
             "blog_judgments_list": blog_judgments_list,
             "blog_list_csv_path": blog_list_csv_path,
-            "overall_chart": overall_chart,
-            "distribution_chart": distribution_chart_fig,
-            "absolute_chart": absolute_chart_fig,
+            # Inputs for render_charts(); PNG charts are only drawn for responses that ask for them
+            "chart_inputs": {
+                "satisfaction_counts": dict(satisfaction_counts),
+                "scores": all_scores,
+                "total_pos": total_pos,
+                "total_neg": total_neg,
+            },
             "distribution_description": distribution_description,
-            "outlier_chart": outlier_chart_fig,
             "total_score_count": len(all_scores),
             "outlier_count": len(outliers),
             "all_aspect_sentiment_pairs": all_aspect_sentiment_pairs,
@@ -1,63 +1,142 @@
 import os
+import pickle
+import threading
 import pandas as pd
 
+from src.domain.lexicon import SCORED_CATEGORIES, CompiledLexicon
+
+# 컴파일된 사전 스냅샷 파일 (CSV가 바뀌면 다시 만듭니다)
+LEXICON_SNAPSHOT_FILE = "lexicon_snapshot.pickle"
+LEXICON_SNAPSHOT_FORMAT = 1
+
+SCORE_COLUMNS = {"amplifiers": "multiplier", "downtoners": "multiplier"}
+
+
 class KnowledgeBase:
     def __init__(self, dic_path="dic"):
         # 상대 경로를 프로젝트 루트 기준으로 변경
         self.dic_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), dic_path)
+        self._update_lock = threading.Lock()
+        # on_change(words, version): called after learned entries produce a new snapshot
+        self._listeners = []
         self._load_dictionaries()
 
+    def _csv_path(self, name: str) -> str:
+        return os.path.join(self.dic_path, f"{name}.csv")
+
+    def _fingerprint(self) -> tuple:
+        stats = []
+        for name in SCORED_CATEGORIES + ("negators",):
+            try:
+                st = os.stat(self._csv_path(name))
+                stats.append((name, st.st_size, st.st_mtime_ns))
+            except FileNotFoundError:
+                stats.append((name, None, None))
+        return (LEXICON_SNAPSHOT_FORMAT, tuple(stats))
+
     def _load_dictionaries(self):
+        fingerprint = self._fingerprint()
+        snapshot_path = os.path.join(self.dic_path, LEXICON_SNAPSHOT_FILE)
+
+        try:
+            with open(snapshot_path, "rb") as f:
+                saved_fingerprint, lexicon = pickle.load(f)
+            if saved_fingerprint == fingerprint and isinstance(lexicon, CompiledLexicon):
+                self._lexicon = lexicon
+                return
+        except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError, AttributeError):
+            pass
+
+        self._lexicon = self._compile_from_csv()
+        try:
+            tmp_path = f"{snapshot_path}.tmp{os.getpid()}"
+            with open(tmp_path, "wb") as f:
+                pickle.dump((fingerprint, self._lexicon), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, snapshot_path)
+        except OSError as e:
+            print(f"사전 스냅샷 저장 실패 (다음 실행 때 다시 컴파일합니다): {e}")
+
+    def _compile_from_csv(self) -> CompiledLexicon:
         try:
             def _load_dict_list(file_path, score_col="score"):
-                df = pd.read_csv(file_path)
-                new_dict = {}
-                for _, row in df.iterrows():
-                    phrase = row["phrase"]
-                    score = row[score_col]
-                    if phrase not in new_dict:
-                        new_dict[phrase] = []
-                    new_dict[phrase].append(score)
-                return new_dict
-
-            self.idioms = _load_dict_list(os.path.join(self.dic_path, "idioms.csv"))
-            self.amplifiers = _load_dict_list(
-                os.path.join(self.dic_path, "amplifiers.csv"), score_col="multiplier"
-            )
-            self.downtoners = _load_dict_list(
-                os.path.join(self.dic_path, "downtoners.csv"), score_col="multiplier"
-            )
-            self.negators = pd.read_csv(os.path.join(self.dic_path, "negators.csv"))[
-                "phrase"
-            ].tolist()
-            self.adjectives = _load_dict_list(
-                os.path.join(self.dic_path, "adjectives.csv")
-            )
-            self.adverbs = _load_dict_list(os.path.join(self.dic_path, "adverbs.csv"))
-            self.sentiment_nouns = _load_dict_list(
-                os.path.join(self.dic_path, "sentiment_nouns.csv")
-            )
+                df = pd.read_csv(file_path).dropna(subset=["phrase", score_col])
+                grouped = df.groupby("phrase", sort=False)[score_col]
+                return {
+                    phrase: tuple(float(score) for score in scores)
+                    for phrase, scores in grouped
+                }
+
+            categories = {
+                name: _load_dict_list(self._csv_path(name), SCORE_COLUMNS.get(name, "score"))
+                for name in SCORED_CATEGORIES
+            }
+            negators = pd.read_csv(self._csv_path("negators"))["phrase"].dropna().tolist()
+            return CompiledLexicon(categories, negators)
 
         except FileNotFoundError as e:
             print(f"사전 파일 로드 오류: {e}. 빈 사전으로 시작합니다.")
-            self.idioms, self.amplifiers, self.downtoners, self.negators = (
-                {},
-                {},
-                {},
-                [],
-            )
-            self.adjectives, self.adverbs, self.sentiment_nouns = {}, {}, {}
+            return CompiledLexicon({}, [])
+
+    @property
+    def lexicon(self) -> CompiledLexicon:
+        """현재 사전 스냅샷. 한 번 가져간 스냅샷은 이후 학습으로 바뀌지 않습니다."""
+        return self._lexicon
+
+    @property
+    def version(self) -> int:
+        return self._lexicon.version
+
+    @property
+    def idioms(self):
+        return self._lexicon.idioms
+
+    @property
+    def amplifiers(self):
+        return self._lexicon.amplifiers
+
+    @property
+    def downtoners(self):
+        return self._lexicon.downtoners
+
+    @property
+    def negators(self):
+        return self._lexicon.negators
+
+    @property
+    def adjectives(self):
+        return self._lexicon.adjectives
+
+    @property
+    def adverbs(self):
+        return self._lexicon.adverbs
+
+    @property
+    def sentiment_nouns(self):
+        return self._lexicon.sentiment_nouns
+
+    def add_change_listener(self, on_change):
+        """학습으로 사전이 바뀔 때마다 on_change(바뀐 표현 집합, 새 버전)를 호출하도록 등록합니다."""
+        with self._update_lock:
+            self._listeners.append(on_change)
+
+    def add_learned_entries(self, entries):
+        """
+        학습된 (사전 파일명, 표현, 점수) 항목을 반영한 새 버전의 스냅샷으로 교체합니다.
+        읽는 쪽은 잠금 없이 항상 일관된 스냅샷을 봅니다. 같은 표현에 같은 점수가 이미 있으면 다시 추가하지 않습니다.
+        """
+        entries = [(file_name.split(".")[0], phrase, score) for file_name, phrase, score in entries]
+        with self._update_lock:
+            previous = self._lexicon
+            self._lexicon = previous.with_entries(entries)
+            if self._lexicon is previous:
+                return
+            # Notified under the lock so listeners see versions in order
+            words = {phrase for _, phrase, _ in entries}
+            for on_change in self._listeners:
+                on_change(words, self._lexicon.version)
 
     def is_known_word(self, word: str) -> bool:
-        return (
-            word in self.idioms
-            or word in self.amplifiers
-            or word in self.downtoners
-            or word in self.negators
-            or word in self.adjectives
-            or word in self.adverbs
-            or word in self.sentiment_nouns
-        )
+        return self._lexicon.is_known_word(word)
 
 # 싱글턴처럼 사용할 knowledge_base 인스턴스
 knowledge_base = KnowledgeBase()
@@ -0,0 +1,134 @@
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Tuple
+
+# 점수 목록을 가진 사전 카테고리 (사전 파일명과 같은 이름)
+SCORED_CATEGORIES = (
+    "idioms",
+    "amplifiers",
+    "downtoners",
+    "adjectives",
+    "adverbs",
+    "sentiment_nouns",
+)
+# 감성 점수로 쓰이는 카테고리 (뒤에 오는 카테고리가 같은 단어의 앞 카테고리를 덮어씀)
+SENTIMENT_CATEGORIES = ("adjectives", "adverbs", "sentiment_nouns", "idioms")
+
+Scores = Tuple[float, ...]
+
+
+class CompiledLexicon:
+    """
+    감성 사전을 조회용으로 미리 계산해 둔 불변 스냅샷.
+
+    - categories: 카테고리별 {표현: 점수 튜플}
+    - index: 모든 표현 → ((카테고리, 점수 튜플), ...) 를 담은 하나의 해시 테이블
+    - negators: 부정어 frozenset (negator_list는 파일 순서를 유지한 튜플)
+    - sentiment_scores / representative_scores: 감성 카테고리를 합친 점수와 대표 점수(절댓값이 가장 큰 값)
+
+    스냅샷은 수정하지 않습니다. 학습 결과는 with_entries()로 version이 하나 올라간 새 스냅샷을 만들어 반영하므로,
+    읽는 쪽은 잠금 없이 자신이 가져간 스냅샷을 끝까지 사용할 수 있습니다.
+    새 스냅샷은 바뀐 카테고리 테이블만 복사하고, 통합 조회 테이블은 학습된 표현의 항목만 다시 계산합니다.
+    """
+
+    def __init__(
+        self,
+        categories: Dict[str, Dict[str, Scores]],
+        negator_list: Iterable[str],
+        version: int = 1,
+    ):
+        self.version = version
+        # Tables are never mutated after construction, so unchanged ones can be shared between versions
+        self._tables = {name: categories.get(name, {}) for name in SCORED_CATEGORIES}
+        self.negator_list = tuple(negator_list)
+        self._build()
+
+    def _build(self):
+        self.negators = frozenset(self.negator_list)
+
+        index: Dict[str, Tuple[Tuple[str, Scores], ...]] = {}
+        for name in SCORED_CATEGORIES:
+            for word, scores in self._tables[name].items():
+                index[word] = index.get(word, ()) + ((name, scores),)
+        for word in self.negator_list:
+            index[word] = index.get(word, ()) + (("negators", ()),)
+
+        sentiment_scores: Dict[str, Scores] = {}
+        for name in SENTIMENT_CATEGORIES:
+            sentiment_scores.update(self._tables[name])
+        representative_scores = {
+            word: max(scores, key=abs) for word, scores in sentiment_scores.items() if scores
+        }
+        self._publish(index, sentiment_scores, representative_scores)
+
+    def _publish(self, index: dict, sentiment_scores: dict, representative_scores: dict):
+        self._index = index
+        self._sentiment_scores = sentiment_scores
+        self._representative_scores = representative_scores
+        self.index: Mapping[str, Tuple[Tuple[str, Scores], ...]] = MappingProxyType(index)
+        self.sentiment_scores: Mapping[str, Scores] = MappingProxyType(sentiment_scores)
+        self.representative_scores: Mapping[str, float] = MappingProxyType(representative_scores)
+        for name in SCORED_CATEGORIES:
+            setattr(self, name, MappingProxyType(self._tables[name]))
+
+    def _index_entry(self, word: str) -> Tuple[Tuple[str, Scores], ...]:
+        # Same order as _build(): scored categories, then negators
+        entry = tuple((name, self._tables[name][word]) for name in SCORED_CATEGORIES if word in self._tables[name])
+        if word in self.negators:
+            entry += (("negators", ()),)
+        return entry
+
+    def __getstate__(self):
+        return {"version": self.version, "tables": self._tables, "negator_list": self.negator_list}
+
+    def __setstate__(self, state):
+        self.version = state["version"]
+        self._tables = state["tables"]
+        self.negator_list = state["negator_list"]
+        self._build()
+
+    def is_known_word(self, word: str) -> bool:
+        return word in self.index
+
+    def with_entries(self, entries: Iterable[Tuple[str, str, float]]) -> "CompiledLexicon":
+        """
+        (카테고리, 표현, 점수) 항목을 더한 새 스냅샷을 반환합니다. 바뀐 것이 없으면 자기 자신을 반환합니다.
+        같은 표현에 같은 점수가 이미 있으면 다시 추가하지 않습니다.
+        """
+        tables = dict(self._tables)
+        changed = set()
+        words = set()
+        for category, phrase, score in entries:
+            if category not in tables:
+                continue
+            current = tables[category].get(phrase, ())
+            if score in current:
+                continue
+            if category not in changed:
+                # Copy only the tables that actually change; the rest are shared with this snapshot
+                tables[category] = dict(tables[category])
+                changed.add(category)
+            tables[category][phrase] = current + (score,)
+            words.add(phrase)
+        if not changed:
+            return self
+
+        snapshot = CompiledLexicon.__new__(CompiledLexicon)
+        snapshot.version = self.version + 1
+        snapshot._tables = tables
+        snapshot.negator_list = self.negator_list
+        snapshot.negators = self.negators
+
+        # Start from this snapshot's lookups and recompute only the learned words
+        index = dict(self._index)
+        sentiment_scores = dict(self._sentiment_scores)
+        representative_scores = dict(self._representative_scores)
+        for word in words:
+            index[word] = snapshot._index_entry(word)
+            sentiment = [tables[name][word] for name in SENTIMENT_CATEGORIES if word in tables[name]]
+            if sentiment:
+                # Later categories override earlier ones, as in _build()
+                sentiment_scores[word] = sentiment[-1]
+                if sentiment[-1]:
+                    representative_scores[word] = max(sentiment[-1], key=abs)
+        snapshot._publish(index, sentiment_scores, representative_scores)
+        return snapshot
@@ -0,0 +1,66 @@
+import hashlib
+import os
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from src.infrastructure.cache.disk_cache import DiskCache
+
+# 블로그 본문 캐시 설정 (환경 변수로 조정 가능)
+BLOG_CACHE_TTL_SECONDS = float(os.getenv("BLOG_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+BLOG_CACHE_MAX_ENTRIES = int(os.getenv("BLOG_CACHE_MAX_ENTRIES", "20000"))
+BLOG_CACHE_MAX_BYTES = int(os.getenv("BLOG_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+
+
+class BlogContentCache:
+    """
+    스크래핑한 블로그 본문을 URL 단위로 저장하는 디스크 캐시.
+    값에는 본문 텍스트, 이미지 URL 목록, 수집 시각, 본문 해시가 함께 저장됩니다.
+    """
+
+    def __init__(self):
+        self._cache = DiskCache(
+            "blog_content",
+            default_ttl=BLOG_CACHE_TTL_SECONDS,
+            max_entries=BLOG_CACHE_MAX_ENTRIES,
+            max_bytes=BLOG_CACHE_MAX_BYTES,
+        )
+
+    def get(self, url: str) -> Optional[Tuple[str, List[str]]]:
+        entry = self._cache.get(url)
+        if entry is None:
+            return None
+        return entry["text"], entry["image_urls"]
+
+    def get_entry(self, url: str) -> Optional[dict]:
+        """text, image_urls, fetched_at, content_hash, source(http/playwright)를 담은 원본 항목을 반환합니다."""
+        return self._cache.get(url)
+
+    def put(self, url: str, text: str, image_urls: List[str], source: Optional[str] = None):
+        self._cache.set(
+            url,
+            {
+                "text": text,
+                "image_urls": list(image_urls),
+                "fetched_at": time.time(),
+                "content_hash": hashlib.sha256(text.encode("utf-8")).hexdigest(),
+                "source": source,
+            },
+        )
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+_blog_content_cache: Optional[BlogContentCache] = None
+_blog_content_cache_lock = threading.Lock()
+
+
+def get_blog_content_cache() -> BlogContentCache:
+    """모든 스크래핑 호출자가 공유하는 블로그 본문 캐시를 반환합니다."""
+    global _blog_content_cache
+    if _blog_content_cache is None:
+        with _blog_content_cache_lock:
+            if _blog_content_cache is None:
+                _blog_content_cache = BlogContentCache()
+    return _blog_content_cache
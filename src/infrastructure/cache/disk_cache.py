@@ -0,0 +1,160 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Optional
+
+from src.infrastructure.config.settings import get_cache_dir
+
+# 조회 시각(last_access)을 다시 기록하기까지의 최소 간격. LRU 순서는 이 정도 오차를 허용합니다.
+DISK_CACHE_ACCESS_RESOLUTION_SECONDS = float(os.getenv("DISK_CACHE_ACCESS_RESOLUTION_SECONDS", "60"))
+# 메모리에 모아 둔 조회 시각이 이만큼 쌓이면 set()을 기다리지 않고 한 번에 기록합니다
+DISK_CACHE_ACCESS_FLUSH_SIZE = 256
+
+
+class DiskCache:
+    """
+    SQLite 파일 하나에 JSON 값을 저장하는 키-값 캐시.
+
+    - 항목마다 만료 시각(TTL)을 두고, 만료된 항목은 조회 시 삭제합니다.
+    - 항목 수(max_entries) 또는 총 크기(max_bytes)를 넘으면 가장 오래 조회되지 않은 항목부터 제거합니다 (LRU).
+    - 조회는 쓰기 잠금을 잡지 않습니다. 조회 시각은 메모리에 모았다가 다음 set()(제거 직전) 또는
+      일정 개수가 쌓였을 때 한 번에 기록하며, 기록된 시각이 충분히 최근이면 아예 다시 기록하지 않습니다.
+    - WAL 모드라서 여러 워커 프로세스가 같은 파일을 함께 읽고 쓸 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        default_ttl: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        self.path = os.path.join(get_cache_dir(), f"{name}.sqlite3")
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                expires_at REAL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entries_last_access ON entries(last_access)"
+        )
+        self._conn.commit()
+        # key -> last access time not yet written to the file
+        self._pending_access = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at, last_access FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            value, expires_at, last_access = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+                self.misses += 1
+                return None
+            if now - last_access >= DISK_CACHE_ACCESS_RESOLUTION_SECONDS:
+                self._pending_access[key] = now
+                if len(self._pending_access) >= DISK_CACHE_ACCESS_FLUSH_SIZE:
+                    self._flush_access()
+                    self._conn.commit()
+            self.hits += 1
+        return json.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None):
+        now = time.time()
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = now + ttl if ttl is not None else None
+        payload = json.dumps(value, ensure_ascii=False)
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO entries (key, value, size, created_at, expires_at, last_access)
+                VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                (key, payload, len(payload.encode("utf-8")), now, expires_at, now),
+            )
+            self._flush_access()
+            self._evict(now)
+            self._conn.commit()
+
+    def delete(self, key: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def _flush_access(self):
+        """모아 둔 조회 시각을 기록합니다 (호출자가 잠금을 잡고 커밋함)."""
+        if not self._pending_access:
+            return
+        pending, self._pending_access = self._pending_access, {}
+        # MAX: never move an entry back if another process (or set()) touched it more recently
+        self._conn.executemany(
+            "UPDATE entries SET last_access = MAX(last_access, ?) WHERE key = ?",
+            [(accessed, key) for key, accessed in pending.items()],
+        )
+
+    def _evict(self, now: float):
+        self._conn.execute(
+            "DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+        )
+        if self.max_entries is not None:
+            count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            if count > self.max_entries:
+                self._conn.execute(
+                    """
+                    DELETE FROM entries WHERE key IN (
+                        SELECT key FROM entries ORDER BY last_access ASC LIMIT ?
+                    )
+                    """,
+                    (count - self.max_entries,),
+                )
+        if self.max_bytes is not None:
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total > self.max_bytes:
+                excess = total - self.max_bytes
+                victims = []
+                for key, size in self._conn.execute(
+                    "SELECT key, size FROM entries ORDER BY last_access ASC"
+                ):
+                    victims.append((key,))
+                    excess -= size
+                    if excess <= 0:
+                        break
+                self._conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+
+    def stats(self) -> dict:
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "entries": count,
+            "bytes": total,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
@@ -0,0 +1,89 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+
+class SingleFlight:
+    """
+    같은 키로 동시에 들어온 요청을 하나의 실행으로 합칩니다.
+    먼저 들어온 호출만 실제로 실행하고, 나머지는 그 결과(또는 예외)를 함께 받습니다.
+    실행이 끝나면 키는 바로 비워지므로 결과를 보관하지는 않습니다 (캐시와 함께 사용).
+
+    - share(): 별도 태스크로 실행해 어느 호출자가 먼저 취소되어도 나머지는 계속 기다리고,
+      기다리는 호출자가 모두 떠나야 실행을 취소합니다. 먼저 온 호출자가 취소됐다고 해서
+      그 호출과 무관한 다른 호출자가 CancelledError를 받지 않습니다.
+    - do_sync(): 동기 호출용. 먼저 온 호출자의 스레드에서 실행합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._sync_calls: Dict[Any, Future] = {}
+        # Tasks are loop-bound, so calls are keyed by (loop id, key) -> [task, number of callers waiting on it]
+        self._shared_calls: Dict[Tuple[int, Any], list] = {}
+        self.coalesced = 0
+
+    async def share(self, key: Any, func: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+
+        async def run():
+            try:
+                return await func()
+            finally:
+                # Forget the key in the same step the work finishes, so no caller can join a finished flight
+                with self._lock:
+                    if self._shared_calls.get(flight_key) is entry:
+                        del self._shared_calls[flight_key]
+
+        with self._lock:
+            entry = self._shared_calls.get(flight_key)
+            if entry is None:
+                entry = [None, 0]
+                self._shared_calls[flight_key] = entry
+                entry[0] = loop.create_task(run())
+            else:
+                self.coalesced += 1
+            entry[1] += 1
+        task = entry[0]
+
+        try:
+            return await asyncio.shield(task)
+        finally:
+            with self._lock:
+                entry[1] -= 1
+                abandoned = entry[1] == 0 and not task.done()
+                if abandoned and self._shared_calls.get(flight_key) is entry:
+                    del self._shared_calls[flight_key]
+            if abandoned:
+                # Every caller is gone (e.g. all clients disconnected): stop the work
+                task.cancel()
+
+    def do_sync(self, key: Any, func: Callable[[], Any]) -> Any:
+        with self._lock:
+            future = self._sync_calls.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._sync_calls[key] = future
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._sync_calls.pop(key, None)
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._sync_calls) + len(self._shared_calls)
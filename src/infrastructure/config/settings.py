@@ -114,5 +114,18 @@ def get_google_maps_key():
 # --- [ 신규 함수 추가 끝 ] ---
 
 
+def get_cache_dir():
+    """
+    디스크 캐시(스크래핑 본문 등)를 저장할 디렉터리를 반환합니다.
+    CACHE_DIR 환경 변수가 없으면 프로젝트 루트의 cache/ 를 사용합니다.
+    """
+    project_root = os.path.dirname(
+        os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
+    cache_dir = os.getenv("CACHE_DIR", os.path.join(project_root, "cache"))
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
 # 초기 환경 설정 실행
 setup_environment()
@@ -1,15 +1,161 @@
+import asyncio
+import json
 import os
 import re
-from konlpy.tag import Okt
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional
 from src.domain.knowledge_base import knowledge_base
 from src.infrastructure.llm_client import get_llm_client
-
-okt = Okt()
+from src.infrastructure.persistence.lexicon_journal import LexiconJournal
+from src.infrastructure.okt_tagger import get_okt_tagger
+
+# 요약문에서 ****표현****(수식어구: 대상) 형태로 표시된 감성 표현
+MARKED_PHRASE_PATTERN = re.compile(r"\*\*\*\*([^*]+?)\*\*\*\*(?:\(수식어구:\s*([^)]+?)\))?")
+
+_lexicon_journal = None
+_lexicon_journal_lock = threading.Lock()
+
+
+def get_lexicon_journal() -> LexiconJournal:
+    """
+    학습된 사전 항목을 기록하는 공유 저널을 반환합니다.
+    처음 만들 때 저널에 남아 있는 항목(다른 프로세스가 학습한 것 포함)을 knowledge_base에 반영합니다.
+    """
+    global _lexicon_journal
+    if _lexicon_journal is None:
+        with _lexicon_journal_lock:
+            if _lexicon_journal is None:
+                journal = LexiconJournal(
+                    knowledge_base.dic_path, on_entries=knowledge_base.add_learned_entries
+                )
+                journal.sync()
+                _lexicon_journal = journal
+    return _lexicon_journal
+
+
+def close_lexicon_journal():
+    """남은 학습 항목을 기록하고 사전 파일에 반영합니다 (서버 종료 시)."""
+    global _lexicon_journal
+    with _lexicon_journal_lock:
+        journal, _lexicon_journal = _lexicon_journal, None
+    if journal is not None:
+        journal.close()
+
+# 표현 점수 메모 크기 (가장 오래 조회되지 않은 항목부터 밀려납니다)
+PHRASE_SCORE_MEMO_MAX_ENTRIES = int(os.getenv("PHRASE_SCORE_MEMO_MAX_ENTRIES", "50000"))
+
+
+def _polarity(is_positive_context: bool, is_negative_context: bool) -> str:
+    # Same precedence as the scorer: a positive context wins over a negative one
+    if is_positive_context:
+        return "positive"
+    if is_negative_context:
+        return "negative"
+    return "neutral"
+
+
+class PhraseScoreMemo:
+    """
+    (표현, 문맥 극성) → 표현 점수를 보관하는 스레드 안전 LRU 메모.
+    문장, 블로그, 요청, 재요약 루프를 가리지 않고 공유하므로 처음 보는 표현만 계산 비용이 듭니다.
+
+    항목마다 점수 계산에 쓰인 단어(표현 자체와 형태소 분석된 단어)를 함께 기록합니다.
+    사전에 새 항목이 학습되면 그 단어를 쓴 항목만 지우고(invalidate), 나머지 항목은 그대로 재사용합니다.
+    """
+
+    def __init__(self, max_entries: int = PHRASE_SCORE_MEMO_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # key -> (score, words the score depends on)
+        self._memo: "OrderedDict[tuple, tuple]" = OrderedDict()
+        # word -> keys whose score depends on it
+        self._dependents: Dict[str, set] = {}
+        # word -> lexicon version in which it was last learned
+        self._changed_at: Dict[str, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.invalidated = 0
+
+    def __contains__(self, key: tuple) -> bool:
+        with self._lock:
+            return key in self._memo
+
+    def get(self, key: tuple) -> Optional[float]:
+        with self._lock:
+            entry = self._memo.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._memo.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: tuple, score: float, words, version: int, resolved=()):
+        """
+        version 사전 스냅샷으로 계산한 점수를 저장합니다.
+        계산하는 동안 words 중 하나가 새로 학습됐다면(더 새 버전에서 바뀜) 이미 오래된 점수이므로 버립니다.
+        resolved는 이 계산에서 동적 점수로 추론해 직접 학습시킨 단어로, 그 학습은 점수에 이미 반영되어 있습니다.
+        """
+        words = frozenset(words)
+        with self._lock:
+            if any(self._changed_at.get(word, 0) > version for word in words if word not in resolved):
+                return
+            old = self._memo.pop(key, None)
+            if old is not None:
+                self._unlink(key, old[1])
+            self._memo[key] = (score, words)
+            for word in words:
+                self._dependents.setdefault(word, set()).add(key)
+            while len(self._memo) > self.max_entries:
+                evicted, (_, evicted_words) = self._memo.popitem(last=False)
+                self._unlink(evicted, evicted_words)
+
+    def _unlink(self, key: tuple, words):
+        for word in words:
+            keys = self._dependents.get(word)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._dependents[word]
+
+    def invalidate(self, words, version: int):
+        """사전에 words가 학습되어 version이 되었을 때, 그 단어로 계산한 점수만 지웁니다."""
+        with self._lock:
+            for word in words:
+                self._changed_at[word] = max(version, self._changed_at.get(word, 0))
+                for key in self._dependents.pop(word, ()):
+                    entry = self._memo.pop(key, None)
+                    if entry is not None:
+                        self._unlink(key, entry[1])
+                        self.invalidated += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._memo),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "invalidated": self.invalidated,
+            }
+
+
+_phrase_scores = PhraseScoreMemo()
+knowledge_base.add_change_listener(_phrase_scores.invalidate)
+
+
+def get_phrase_score_stats() -> dict:
+    return _phrase_scores.stats()
+
+# 한 번의 LLM 호출로 점수를 추론할 미등록 표현 수
+DYNAMIC_SCORE_BATCH_SIZE = int(os.getenv("DYNAMIC_SCORE_BATCH_SIZE", "40"))
 
 class SimpleScorer:
     def __init__(self):
         self.kb = knowledge_base
-        self.okt = okt
+        self.tagger = get_okt_tagger()
         # LLM 클라이언트를 필요할 때 생성하도록 변경
         self.llm = None
 
@@ -29,89 +175,271 @@ class SimpleScorer:
             return 0.0
 
         try:
-            tag_guidance = ""
-            if expected_tag:
-                tag_guidance = f"\n[참고] 이 표현은 형태소 분석 결과 '{expected_tag}' 품사로 분류되었습니다. 이 정보를 바탕으로 가장 적절한 카테고리 번호를 선택해주세요."
-
-            context_guidance = "중립"
-            if is_positive_context:
-                context_guidance = "긍정"
-            elif is_negative_context:
-                context_guidance = "부정"
-
-            prompt = f"""
-            당신은 한국어 신조어, 관용어, 그리고 감성적인 형용사/부사/명사에 능숙한 감성 분석 전문가입니다. 새로운 구절의 감성 점수를 추론해야 합니다.
-
-            [현재 감성 사전의 예시 및 점수 기준]
-            - 점수 범위: -2.0 (매우 부정) ~ 2.0 (매우 긍정) 사이의 실수 값으로 추론해주세요.
-            - 긍정적인 단어일수록 높은 양수 값, 부정적인 단어일수록 낮은 음수 값, 중립적인 단어는 0에 가까운 값을 부여해주세요.
-            - 강도가 강한 감성 표현일수록 절대값이 큰 점수를 부여해주세요.
-
-            1. 긍정/부정 관용어 (점수): {list(self.kb.idioms.items())[:5]}...
-            2. 강조 부사 (점수 배율): {list(self.kb.amplifiers.items())[:5]}...
-            3. 완화 부사 (점수 배율): {list(self.kb.downtoners.items())[:5]}...
-            4. 부정어: {self.kb.negators[:5]}...
-            5. 감성 형용사 (점수): {list(self.kb.adjectives.items())[:5]}...
-            6. 감성 부사 (점수): {list(self.kb.adverbs.items())[:5]}...
-            7. 감성 명사 (점수): {list(self.kb.sentiment_nouns.items())[:5]}...
-
-            분석할 문장: "{sentence_to_score}"
-
-            [문맥 정보]
-            이 표현은 전반적으로 '{context_guidance}'적인 문맥에서 나타났습니다. 이 문맥을 반드시 고려하여 점수를 추론해주세요.
-
-            [지시사항]
-            1. 위 문장에서, 기존 사전에 없는 새로운 '핵심 감성 표현' 구절(phrase)을 딱 하나만 찾아주세요.
-            2. '핵심 감성 표현'은 다른 문장에서도 재사용될 수 있는 일반적인 관용어, 신조어, 또는 감성적인 형용사/부사/명사여야 합니다.
-            3. 문장 전체가 아니라, 그 안의 핵심적인 구절만 정확히 추출해야 합니다.
-            4. 만약 문장에 재사용 가능한 특별한 감성 표현이 없다면, '없음'이라고 반환해야 합니다.
-            5. 추출한 '핵심 감성 표현'이 1~7 중 어떤 카테고리에 속하는지 결정해주세요.
-            6. **카테고리 2(강조어) 또는 3(완화어)으로 결정했다면, '점수' 부분에 긍정적인 '점수 배율'을 반환해주세요. (예: 강조어는 1.5, 완화어는 0.5)**
-            7. **나머지 카테고리(1, 5, 6, 7)로 결정했다면, 문맥에서 가지는 '최종적인 감성 점수'(-2.0 ~ 2.0)를 '점수' 부분에 반환해주세요.**
-            8. **[매우 중요] '{context_guidance}' 문맥에 따라 점수의 부호(+/-)가 결정되어야 합니다. 긍정적 문맥에서는 반드시 양수 점수를, 부정적 문맥에서는 반드시 음수 점수를 부여해야 합니다.**
-            9. 만약 추출한 표현이 없더라도, 문장 자체에 긍정 또는 부정 뉘앙스가 있다면, 문맥에 맞는 약간의 긍정/부정 값(예: 0.3 또는 -0.3)을 부여해야 합니다.
-            {tag_guidance}
-
-            [답변 형식]
-            '카테고리 번호,핵심 감성 표현,점수' 형식으로만 반환해주세요.
-            - 예시 1 (긍정 문맥의 새로운 명사): 7,꽉찬,1.2
-            - 예시 2 (부정 문맥의 새로운 명사): 7,꽉찬,-1.1
-            - 예시 3 (새로운 강조어): 2,훨씬,1.4
-            - 예시 4 (감성적이나 특별한 표현 없음): 0,없음,0.3
-            """
-
-            response = self.llm.invoke(prompt)
-            result = response.content.strip()
-
-            parts = result.split(",")
-            if len(parts) != 3:
-                return 0.0
-
-            category, phrase, score_str = (
-                parts[0].strip(),
-                parts[1].strip(),
-                parts[2].strip(),
+            prompt = self._build_dynamic_prompt(
+                sentence_to_score, expected_tag, is_positive_context, is_negative_context
             )
-            score = float(score_str)
+            response = self.llm.invoke(prompt, cache_if=self._is_dynamic_result)
+            return self._apply_dynamic_result(response.content.strip())
+        except Exception as e:
+            print(f"LLM 점수 추론 중 오류 발생: {e}")
+            return 0.0
 
-            # 학습 결과를 파일에 저장하는 로직
-            self._update_dictionary(category, phrase, score)
-            
-            # 점수 반환 로직
-            if category in ["1", "5", "6", "7"] and phrase != "없음":
-                return score
-            elif category == "0" and phrase == "없음" and score != 0.0:
-                return score
-            else: # 강조어, 완화어 등은 점수 기여분이 0
-                return 0.0
+    async def aget_dynamic_score(
+        self,
+        sentence_to_score: str,
+        expected_tag: str = None,
+        is_positive_context: bool = False,
+        is_negative_context: bool = False,
+    ) -> float:
+        """get_dynamic_score의 비동기 버전 (이벤트 루프를 막지 않습니다)."""
+        self._initialize_llm()
+        if not self.llm:
+            return 0.0
 
+        try:
+            prompt = self._build_dynamic_prompt(
+                sentence_to_score, expected_tag, is_positive_context, is_negative_context
+            )
+            response = await self.llm.ainvoke(prompt, cache_if=self._is_dynamic_result)
+            # 사전 파일 갱신은 디스크 I/O이므로 워커 스레드에서 처리
+            return await asyncio.to_thread(self._apply_dynamic_result, response.content.strip())
         except Exception as e:
             print(f"LLM 점수 추론 중 오류 발생: {e}")
             return 0.0
 
+    def _build_dynamic_prompt(
+        self,
+        sentence_to_score: str,
+        expected_tag: str = None,
+        is_positive_context: bool = False,
+        is_negative_context: bool = False,
+    ) -> str:
+        tag_guidance = ""
+        if expected_tag:
+            tag_guidance = f"\n[참고] 이 표현은 형태소 분석 결과 '{expected_tag}' 품사로 분류되었습니다. 이 정보를 바탕으로 가장 적절한 카테고리 번호를 선택해주세요."
+
+        context_guidance = "중립"
+        if is_positive_context:
+            context_guidance = "긍정"
+        elif is_negative_context:
+            context_guidance = "부정"
+
+        prompt = f"""
+        당신은 한국어 신조어, 관용어, 그리고 감성적인 형용사/부사/명사에 능숙한 감성 분석 전문가입니다. 새로운 구절의 감성 점수를 추론해야 합니다.
+
+        [현재 감성 사전의 예시 및 점수 기준]
+        - 점수 범위: -2.0 (매우 부정) ~ 2.0 (매우 긍정) 사이의 실수 값으로 추론해주세요.
+        - 긍정적인 단어일수록 높은 양수 값, 부정적인 단어일수록 낮은 음수 값, 중립적인 단어는 0에 가까운 값을 부여해주세요.
+        - 강도가 강한 감성 표현일수록 절대값이 큰 점수를 부여해주세요.
+
+        1. 긍정/부정 관용어 (점수): {list(self.kb.idioms.items())[:5]}...
+        2. 강조 부사 (점수 배율): {list(self.kb.amplifiers.items())[:5]}...
+        3. 완화 부사 (점수 배율): {list(self.kb.downtoners.items())[:5]}...
+        4. 부정어: {list(self.kb.lexicon.negator_list[:5])}...
+        5. 감성 형용사 (점수): {list(self.kb.adjectives.items())[:5]}...
+        6. 감성 부사 (점수): {list(self.kb.adverbs.items())[:5]}...
+        7. 감성 명사 (점수): {list(self.kb.sentiment_nouns.items())[:5]}...
+
+        분석할 문장: "{sentence_to_score}"
+
+        [문맥 정보]
+        이 표현은 전반적으로 '{context_guidance}'적인 문맥에서 나타났습니다. 이 문맥을 반드시 고려하여 점수를 추론해주세요.
+
+        [지시사항]
+        1. 위 문장에서, 기존 사전에 없는 새로운 '핵심 감성 표현' 구절(phrase)을 딱 하나만 찾아주세요.
+        2. '핵심 감성 표현'은 다른 문장에서도 재사용될 수 있는 일반적인 관용어, 신조어, 또는 감성적인 형용사/부사/명사여야 합니다.
+        3. 문장 전체가 아니라, 그 안의 핵심적인 구절만 정확히 추출해야 합니다.
+        4. 만약 문장에 재사용 가능한 특별한 감성 표현이 없다면, '없음'이라고 반환해야 합니다.
+        5. 추출한 '핵심 감성 표현'이 1~7 중 어떤 카테고리에 속하는지 결정해주세요.
+        6. **카테고리 2(강조어) 또는 3(완화어)으로 결정했다면, '점수' 부분에 긍정적인 '점수 배율'을 반환해주세요. (예: 강조어는 1.5, 완화어는 0.5)**
+        7. **나머지 카테고리(1, 5, 6, 7)로 결정했다면, 문맥에서 가지는 '최종적인 감성 점수'(-2.0 ~ 2.0)를 '점수' 부분에 반환해주세요.**
+        8. **[매우 중요] '{context_guidance}' 문맥에 따라 점수의 부호(+/-)가 결정되어야 합니다. 긍정적 문맥에서는 반드시 양수 점수를, 부정적 문맥에서는 반드시 음수 점수를 부여해야 합니다.**
+        9. 만약 추출한 표현이 없더라도, 문장 자체에 긍정 또는 부정 뉘앙스가 있다면, 문맥에 맞는 약간의 긍정/부정 값(예: 0.3 또는 -0.3)을 부여해야 합니다.
+        {tag_guidance}
+
+        [답변 형식]
+        '카테고리 번호,핵심 감성 표현,점수' 형식으로만 반환해주세요.
+        - 예시 1 (긍정 문맥의 새로운 명사): 7,꽉찬,1.2
+        - 예시 2 (부정 문맥의 새로운 명사): 7,꽉찬,-1.1
+        - 예시 3 (새로운 강조어): 2,훨씬,1.4
+        - 예시 4 (감성적이나 특별한 표현 없음): 0,없음,0.3
+        """
+        return prompt
+
+    @staticmethod
+    def _is_dynamic_result(result: str) -> bool:
+        """응답이 '카테고리,표현,점수' 형식인지 확인합니다 (형식이 깨진 응답은 캐시하지 않음)."""
+        parts = result.strip().split(",")
+        if len(parts) != 3:
+            return False
+        try:
+            float(parts[2].strip())
+        except ValueError:
+            return False
+        return True
+
+    def _apply_dynamic_result(self, result: str) -> float:
+        """LLM 응답('카테고리,표현,점수')을 해석해 사전에 학습시키고 점수를 반환합니다."""
+        parts = result.split(",")
+        if len(parts) != 3:
+            return 0.0
+
+        category, phrase, score_str = (
+            parts[0].strip(),
+            parts[1].strip(),
+            parts[2].strip(),
+        )
+        return self._learn_and_score(category, phrase, float(score_str))
+
+    def _learn_and_score(self, category: str, phrase: str, score: float, learned: Optional[list] = None) -> float:
+        """
+        추론 결과를 사전에 학습시키고, 문장 점수에 반영할 값을 반환합니다.
+        learned 리스트를 넘기면 바로 반영하지 않고 학습 항목을 모아 두기만 합니다 (호출자가 _learn()으로 한 번에 반영).
+        """
+        # 학습 결과를 파일에 저장하는 로직
+        if learned is None:
+            self._update_dictionary(category, phrase, score)
+        else:
+            entry = self._learned_entry(category, phrase, score)
+            if entry is not None:
+                learned.append(entry)
+        
+        # 점수 반환 로직
+        if category in ["1", "5", "6", "7"] and phrase != "없음":
+            return score
+        elif category == "0" and phrase == "없음" and score != 0.0:
+            return score
+        else: # 강조어, 완화어 등은 점수 기여분이 0
+            return 0.0
+
+    def _build_batch_prompt(self, requests: list) -> str:
+        items = []
+        for i, (term, tag, is_pos, is_neg) in enumerate(requests, start=1):
+            context = "긍정" if is_pos else "부정" if is_neg else "중립"
+            items.append(f'{i}. 표현: "{term}" | 품사: {tag or "알 수 없음"} | 문맥: {context}')
+        items_str = "\n".join(items)
+
+        return f"""
+        당신은 한국어 신조어, 관용어, 그리고 감성적인 형용사/부사/명사에 능숙한 감성 분석 전문가입니다. 감성 사전에 없는 여러 표현의 감성 점수를 한 번에 추론해야 합니다.
+
+        [현재 감성 사전의 예시 및 점수 기준]
+        - 점수 범위: -2.0 (매우 부정) ~ 2.0 (매우 긍정) 사이의 실수 값으로 추론해주세요.
+        - 긍정적인 단어일수록 높은 양수 값, 부정적인 단어일수록 낮은 음수 값, 중립적인 단어는 0에 가까운 값을 부여해주세요.
+        - 강도가 강한 감성 표현일수록 절대값이 큰 점수를 부여해주세요.
+
+        1. 긍정/부정 관용어 (점수): {list(self.kb.idioms.items())[:5]}...
+        2. 강조 부사 (점수 배율): {list(self.kb.amplifiers.items())[:5]}...
+        3. 완화 부사 (점수 배율): {list(self.kb.downtoners.items())[:5]}...
+        4. 부정어: {list(self.kb.lexicon.negator_list[:5])}...
+        5. 감성 형용사 (점수): {list(self.kb.adjectives.items())[:5]}...
+        6. 감성 부사 (점수): {list(self.kb.adverbs.items())[:5]}...
+        7. 감성 명사 (점수): {list(self.kb.sentiment_nouns.items())[:5]}...
+
+        [분석할 표현 목록]
+        {items_str}
+
+        [지시사항]
+        1. 각 표현마다, 다른 문장에서도 재사용될 수 있는 '핵심 감성 표현'(관용어, 신조어, 감성적인 형용사/부사/명사)인지 판단해주세요. 재사용할 만한 특별한 감성 표현이 아니라면 phrase를 '없음', category를 "0"으로 반환합니다.
+        2. 핵심 감성 표현이라면 1~7 중 어떤 카테고리에 속하는지 결정해주세요.
+        3. **카테고리 2(강조어) 또는 3(완화어)이라면 score에 긍정적인 '점수 배율'을 반환해주세요. (예: 강조어는 1.5, 완화어는 0.5)**
+        4. **나머지 카테고리(1, 5, 6, 7)라면 해당 문맥에서 가지는 '최종적인 감성 점수'(-2.0 ~ 2.0)를 score에 반환해주세요.**
+        5. **[매우 중요] 각 표현의 문맥에 따라 점수의 부호(+/-)가 결정되어야 합니다. 긍정 문맥에서는 반드시 양수 점수를, 부정 문맥에서는 반드시 음수 점수를 부여해야 합니다.**
+        6. 특별한 표현이 아니더라도 긍정 또는 부정 뉘앙스가 있다면, 문맥에 맞는 약간의 긍정/부정 값(예: 0.3 또는 -0.3)을 부여해야 합니다.
+        7. 품사 정보를 참고하여 가장 적절한 카테고리 번호를 선택해주세요.
+
+        [답변 형식]
+        모든 표현에 대해 아래와 같은 JSON 배열만 반환해주세요. 다른 설명은 절대 추가하지 마세요.
+        [{{"index": 1, "category": "7", "phrase": "꽉찬", "score": 1.2}}, {{"index": 2, "category": "0", "phrase": "없음", "score": 0.3}}]
+        """
+
+    @staticmethod
+    def _is_batch_result(raw: str) -> bool:
+        """응답에 JSON 배열이 들어 있는지 확인합니다 (파싱할 수 없는 응답은 캐시하지 않음)."""
+        match = re.search(r"\[.*\]", raw, re.DOTALL)
+        if not match:
+            return False
+        try:
+            return isinstance(json.loads(match.group(0)), list)
+        except json.JSONDecodeError:
+            return False
+
+    def _apply_batch_result(self, raw: str, count: int) -> list:
+        """일괄 추론 응답(JSON 배열)을 학습시키고, 요청 순서대로 점수를 반환합니다. 응답에 없는 항목은 None."""
+        scores = [None] * count
+        match = re.search(r"\[.*\]", raw, re.DOTALL)
+        if not match:
+            return scores
+        try:
+            items = json.loads(match.group(0))
+        except json.JSONDecodeError:
+            return scores
+
+        # Everything learned from one response goes into a single new lexicon snapshot
+        learned = []
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            index = item.get("index")
+            if not isinstance(index, int) or not 1 <= index <= count:
+                continue
+            try:
+                score = float(item.get("score"))
+            except (TypeError, ValueError):
+                continue
+            category = str(item.get("category", "0")).strip()
+            phrase = str(item.get("phrase", "없음")).strip() or "없음"
+            scores[index - 1] = self._learn_and_score(category, phrase, score, learned)
+        self._learn(learned)
+        return scores
+
+    async def _resolve_batch(self, requests: list) -> list:
+        try:
+            response = await self.llm.ainvoke(
+                self._build_batch_prompt(requests), cache_if=self._is_batch_result
+            )
+            return await asyncio.to_thread(
+                self._apply_batch_result, response.content.strip(), len(requests)
+            )
+        except Exception as e:
+            print(f"LLM 일괄 점수 추론 중 오류 발생: {e}")
+            return [None] * len(requests)
+
+    async def aresolve_dynamic_scores(self, requests: list) -> dict:
+        """
+        (표현, 품사, 긍정 문맥, 부정 문맥) 목록의 동적 점수를 DYNAMIC_SCORE_BATCH_SIZE 개씩 묶어 한 번에 추론합니다.
+        일괄 응답에서 빠진 표현만 개별 프롬프트(aget_dynamic_score)로 다시 추론합니다.
+        """
+        requests = list(dict.fromkeys(requests))
+        if not requests:
+            return {}
+        self._initialize_llm()
+        if not self.llm:
+            return {request: 0.0 for request in requests}
+
+        chunks = [
+            requests[i : i + DYNAMIC_SCORE_BATCH_SIZE]
+            for i in range(0, len(requests), DYNAMIC_SCORE_BATCH_SIZE)
+        ]
+        results = await asyncio.gather(*(self._resolve_batch(chunk) for chunk in chunks))
+        resolved = {}
+        for chunk, scores in zip(chunks, results):
+            resolved.update(zip(chunk, scores))
+
+        missing = [request for request, score in resolved.items() if score is None]
+        if missing:
+            retried = await asyncio.gather(*(self.aget_dynamic_score(*request) for request in missing))
+            resolved.update(zip(missing, retried))
+        return resolved
+
     def _update_dictionary(self, category: str, phrase: str, score: float):
+        entry = self._learned_entry(category, phrase, score)
+        if entry is not None:
+            self._learn([entry])
+
+    def _learned_entry(self, category: str, phrase: str, score: float):
+        """추론 결과를 사전에 추가할 (사전 파일명, 표현, 점수) 항목으로 바꿉니다. 추가할 것이 아니면 None."""
         if phrase == "없음":
-            return
+            return None
 
         category_map = {
             "1": ("idioms.csv", "관용어"),
@@ -123,27 +451,20 @@ class SimpleScorer:
         }
 
         if category not in category_map:
-            return
+            return None
 
         file_name, term = category_map[category]
-        score_col_name = "multiplier" if category in ["2", "3"] else "score"
-        print(f"[학습] 새로운 {term} 발견: {phrase} (값: {score}) -> {file_name}에 추가")
-
-        with open(
-            os.path.join(self.kb.dic_path, file_name),
-            "a",
-            newline="",
-            encoding="utf-8",
-        ) as f:
-            f.write(f"\n{phrase},{score}")
-        
-        # 메모리 상의 사전도 업데이트
-        dict_attr = file_name.split('.')[0]
-        if hasattr(self.kb, dict_attr):
-            dictionary = getattr(self.kb, dict_attr)
-            if phrase not in dictionary:
-                dictionary[phrase] = []
-            dictionary[phrase].append(score)
+        print(f"[학습] 새로운 {term} 발견: {phrase} (값: {score}) -> {file_name}에 추가 예정")
+        return file_name, phrase, score
+
+    def _learn(self, entries: list):
+        if not entries:
+            return
+        # 메모리 상의 사전은 바로 갱신(새 스냅샷으로 교체)하고, 파일 기록은 저널이 모아서 처리합니다.
+        self.kb.add_learned_entries(entries)
+        journal = get_lexicon_journal()
+        for file_name, phrase, score in entries:
+            journal.record(file_name, phrase, score)
 
     def score_sentence(
         self,
@@ -151,6 +472,161 @@ class SimpleScorer:
         is_positive_context: bool = False,
         is_negative_context: bool = False,
     ):
+        return self._score_sentence(
+            sentence, is_positive_context, is_negative_context, self.get_dynamic_score
+        )
+
+    async def ascore_sentence(
+        self,
+        sentence: str,
+        is_positive_context: bool = False,
+        is_negative_context: bool = False,
+    ):
+        """score_sentence의 비동기 버전."""
+        scores = await self.ascore_sentences([(sentence, is_positive_context, is_negative_context)])
+        return scores[0]
+
+    async def ascore_sentences(self, items: list) -> list:
+        """
+        (문장, 긍정 문맥, 부정 문맥) 목록을 두 단계로 채점합니다.
+        1. LLM 호출 없이 전체 문장을 훑어 사전에 없는 표현을 모두 모읍니다.
+        2. 모은 표현을 일괄 LLM 호출로 추론한 뒤, 그 점수로 모든 문장을 로컬에서 계산합니다.
+        """
+        pending = []
+
+        def record(term, tag, is_pos, is_neg):
+            pending.append((term, tag, is_pos, is_neg))
+            return 0.0
+
+        def score_all(dynamic_score, memoize_dynamic):
+            # Tag every phrase the scorer will split (and has not memoized) in one Okt call; the per-phrase lookups then hit the memo
+            lexicon = self.kb.lexicon
+            skip = (lexicon.idioms, lexicon.amplifiers, lexicon.downtoners, lexicon.negators)
+            self.tagger.pos_many(
+                [
+                    phrase.strip()
+                    for sentence, is_pos, is_neg in items
+                    for phrase, _ in MARKED_PHRASE_PATTERN.findall(sentence)
+                    if not any(phrase.strip() in table for table in skip)
+                    and (phrase.strip(), _polarity(is_pos, is_neg)) not in _phrase_scores
+                ],
+                norm=True,
+                stem=True,
+            )
+            return [
+                self._score_sentence(sentence, is_pos, is_neg, dynamic_score, memoize_dynamic)
+                for sentence, is_pos, is_neg in items
+            ]
+
+        # 1차: 동적 점수가 필요한 표현만 수집 (형태소 분석은 워커 스레드에서)
+        scores = await asyncio.to_thread(score_all, record, False)
+        if not pending:
+            return scores
+
+        resolved = await self.aresolve_dynamic_scores(pending)
+
+        # 2차: 추론된 점수로 계산 (학습 결과로 새로 필요해진 표현만 개별 추론)
+        def lookup(term, tag, is_pos, is_neg):
+            key = (term, tag, is_pos, is_neg)
+            if key in resolved:
+                return resolved[key]
+            return self.get_dynamic_score(term, tag, is_pos, is_neg)
+
+        return await asyncio.to_thread(score_all, lookup, True)
+
+    @staticmethod
+    def _contextual_score(scores, is_pos, is_neg):
+        if is_pos:
+            # 긍정 점수 중 가장 큰 값을 선택 (여러 개일 경우)
+            pos_scores = [s for s in scores if s > 0]
+            if pos_scores: return max(pos_scores), True
+        elif is_neg:
+            # 부정 점수 중 가장 작은 값을 선택
+            neg_scores = [s for s in scores if s < 0]
+            if neg_scores: return min(neg_scores), True
+        return None, False
+
+    def _phrase_score(
+        self,
+        lexicon,
+        phrase: str,
+        is_positive_context: bool,
+        is_negative_context: bool,
+        dynamic_score,
+        memoize_dynamic: bool = True,
+    ) -> float:
+        """
+        표시된 감성 표현 하나의 점수를 계산합니다.
+        (표현, 문맥 극성)이 같고 계산에 쓰인 단어가 새로 학습되지 않았다면 결과도 같으므로 공유 메모에서 먼저 찾습니다.
+        """
+        key = (phrase, _polarity(is_positive_context, is_negative_context))
+        memoized = _phrase_scores.get(key)
+        if memoized is not None:
+            return memoized
+
+        # Every word whose lexicon entry the score reads, and the ones scored (and learned) dynamically
+        words = {phrase}
+        resolved = set()
+
+        def resolve(term, tag):
+            resolved.add(term)
+            return dynamic_score(term, tag, is_positive_context, is_negative_context)
+
+        current_phrase_score = 0.0
+        if phrase in lexicon.idioms:
+            scores = lexicon.idioms[phrase]
+            score, found = self._contextual_score(
+                scores, is_positive_context, is_negative_context
+            )
+            if found:
+                current_phrase_score = score
+            else:
+                current_phrase_score = resolve(phrase, "Idiom")
+        else:
+            words_in_phrase = self.tagger.pos(phrase, norm=True, stem=True)
+            words.update(word for word, _ in words_in_phrase)
+            for word, tag in words_in_phrase:
+                word_score = 0.0
+                known_word = False
+                scores = []
+                if tag.startswith("Adjective") and word in lexicon.adjectives:
+                    scores = lexicon.adjectives[word]
+                    known_word = True
+                elif tag.startswith("Adverb") and word in lexicon.adverbs:
+                    scores = lexicon.adverbs[word]
+                    known_word = True
+                elif tag.startswith("Noun") and word in lexicon.sentiment_nouns:
+                    scores = lexicon.sentiment_nouns[word]
+                    known_word = True
+
+                if known_word:
+                    score, found = self._contextual_score(
+                        scores, is_positive_context, is_negative_context
+                    )
+                    if found:
+                        word_score = score
+                    else:
+                        word_score = resolve(word, tag)
+                elif not lexicon.is_known_word(word) and (tag.startswith("Adjective") or tag.startswith("Adverb") or tag.startswith("Noun")):
+                    word_score = resolve(word, tag)
+                current_phrase_score += word_score
+
+        # Lexicon-only scores are always safe to keep. Dynamic ones are kept unless they are
+        # placeholders (recording pass) or 0.0, which may also mean the inference failed.
+        if not resolved or (memoize_dynamic and current_phrase_score != 0.0):
+            _phrase_scores.put(key, current_phrase_score, words, lexicon.version, resolved)
+        return current_phrase_score
+
+    def _score_sentence(
+        self,
+        sentence: str,
+        is_positive_context: bool,
+        is_negative_context: bool,
+        dynamic_score,
+        memoize_dynamic: bool = True,
+    ):
+        # Read one lexicon version for the whole sentence, even if new entries are learned meanwhile
+        lexicon = self.kb.lexicon
         final_score = 0.0
 
         if is_positive_context:
@@ -158,79 +634,26 @@ class SimpleScorer:
         elif is_negative_context:
             final_score = -0.3
 
-        marked_phrases_with_modifiers = re.findall(
-            r"\*\*\*\*([^*]+?)\*\*\*\*(?:\(수식어구:\s*([^)]+?)\))?", sentence
-        )
+        marked_phrases_with_modifiers = MARKED_PHRASE_PATTERN.findall(sentence)
 
         positive_contribution = 0.0
         negative_contribution = 0.0
         modified_word_scores = {}
 
-        def get_contextual_score(scores: list, is_pos, is_neg):
-            if is_pos:
-                # 긍정 점수 중 가장 큰 값을 선택 (여러 개일 경우)
-                pos_scores = [s for s in scores if s > 0]
-                if pos_scores: return max(pos_scores), True
-            elif is_neg:
-                # 부정 점수 중 가장 작은 값을 선택
-                neg_scores = [s for s in scores if s < 0]
-                if neg_scores: return min(neg_scores), True
-            return None, False
-
         for phrase, modifier_target in marked_phrases_with_modifiers:
             phrase = phrase.strip()
             modifier_target = modifier_target.strip() if modifier_target else None
 
             if (
-                phrase in self.kb.amplifiers
-                or phrase in self.kb.downtoners
-                or phrase in self.kb.negators
+                phrase in lexicon.amplifiers
+                or phrase in lexicon.downtoners
+                or phrase in lexicon.negators
             ):
                 continue
 
-            current_phrase_score = 0.0
-            if phrase in self.kb.idioms:
-                scores = self.kb.idioms[phrase]
-                score, found = get_contextual_score(
-                    scores, is_positive_context, is_negative_context
-                )
-                if found:
-                    current_phrase_score = score
-                else:
-                    current_phrase_score = self.get_dynamic_score(
-                        phrase, "Idiom", is_positive_context, is_negative_context
-                    )
-            else:
-                words_in_phrase = self.okt.pos(phrase, norm=True, stem=True)
-                for word, tag in words_in_phrase:
-                    word_score = 0.0
-                    known_word = False
-                    scores = []
-                    if tag.startswith("Adjective") and word in self.kb.adjectives:
-                        scores = self.kb.adjectives[word]
-                        known_word = True
-                    elif tag.startswith("Adverb") and word in self.kb.adverbs:
-                        scores = self.kb.adverbs[word]
-                        known_word = True
-                    elif tag.startswith("Noun") and word in self.kb.sentiment_nouns:
-                        scores = self.kb.sentiment_nouns[word]
-                        known_word = True
-
-                    if known_word:
-                        score, found = get_contextual_score(
-                            scores, is_positive_context, is_negative_context
-                        )
-                        if found:
-                            word_score = score
-                        else:
-                            word_score = self.get_dynamic_score(
-                                word, tag, is_positive_context, is_negative_context
-                            )
-                    elif not self.kb.is_known_word(word) and (tag.startswith("Adjective") or tag.startswith("Adverb") or tag.startswith("Noun")):
-                        word_score = self.get_dynamic_score(
-                            word, tag, is_positive_context, is_negative_context
-                        )
-                    current_phrase_score += word_score
+            current_phrase_score = self._phrase_score(
+                lexicon, phrase, is_positive_context, is_negative_context, dynamic_score, memoize_dynamic
+            )
 
             if modifier_target:
                 modified_word_scores[modifier_target] = current_phrase_score
@@ -249,15 +672,15 @@ class SimpleScorer:
                     return dictionary[p][0]
                 return 1.0
 
-            if phrase in self.kb.amplifiers:
-                multiplier = get_multiplier(self.kb.amplifiers, phrase)
+            if phrase in lexicon.amplifiers:
+                multiplier = get_multiplier(lexicon.amplifiers, phrase)
                 if modifier_target and modifier_target in modified_word_scores:
                     modified_word_scores[modifier_target] *= multiplier
-            elif phrase in self.kb.downtoners:
-                multiplier = get_multiplier(self.kb.downtoners, phrase)
+            elif phrase in lexicon.downtoners:
+                multiplier = get_multiplier(lexicon.downtoners, phrase)
                 if modifier_target and modifier_target in modified_word_scores:
                     modified_word_scores[modifier_target] *= multiplier
-            elif phrase in self.kb.negators:
+            elif phrase in lexicon.negators:
                 if modifier_target and modifier_target in modified_word_scores:
                     modified_word_scores[modifier_target] *= -1
 
@@ -278,3 +701,17 @@ class SimpleScorer:
                 return -0.3
 
         return final_score
+
+
+_simple_scorer: Optional[SimpleScorer] = None
+_simple_scorer_lock = threading.Lock()
+
+
+def get_simple_scorer() -> SimpleScorer:
+    """그래프 단계마다 새로 만들지 않고 프로세스 전체에서 공유하는 채점기를 반환합니다."""
+    global _simple_scorer
+    if _simple_scorer is None:
+        with _simple_scorer_lock:
+            if _simple_scorer is None:
+                _simple_scorer = SimpleScorer()
+    return _simple_scorer
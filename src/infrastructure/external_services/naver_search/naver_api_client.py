@@ -0,0 +1,137 @@
+import asyncio
+import os
+import random
+import threading
+import time
+import weakref
+from typing import Dict, Optional
+
+import httpx
+
+# 재시도/속도 제한 설정 (환경 변수로 조정 가능)
+NAVER_API_MAX_RETRIES = int(os.getenv("NAVER_API_MAX_RETRIES", "3"))
+NAVER_API_BACKOFF_BASE = float(os.getenv("NAVER_API_BACKOFF_BASE", "0.5"))
+NAVER_API_BACKOFF_MAX = float(os.getenv("NAVER_API_BACKOFF_MAX", "8.0"))
+# 자격 증명(Client ID)별 초당 요청 수와 순간 허용량
+NAVER_API_RATE_PER_SEC = float(os.getenv("NAVER_API_RATE_PER_SEC", "8"))
+NAVER_API_BURST = int(os.getenv("NAVER_API_BURST", "8"))
+
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """
+    스레드/이벤트 루프에 상관없이 공유되는 토큰 버킷.
+    토큰을 미리 예약하고 필요한 만큼만 비동기로 기다리므로, 대기 중에도 루프를 막지 않습니다.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    async def acquire(self):
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+_buckets: Dict[str, TokenBucket] = {}
+_buckets_lock = threading.Lock()
+
+
+def get_token_bucket(client_id: str) -> TokenBucket:
+    """같은 자격 증명을 쓰는 모든 호출자가 공유하는 토큰 버킷을 반환합니다."""
+    with _buckets_lock:
+        bucket = _buckets.get(client_id)
+        if bucket is None:
+            bucket = TokenBucket(NAVER_API_RATE_PER_SEC, NAVER_API_BURST)
+            _buckets[client_id] = bucket
+        return bucket
+
+
+def _backoff_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    if retry_after:
+        try:
+            return min(float(retry_after), NAVER_API_BACKOFF_MAX)
+        except ValueError:
+            pass
+    # Exponential backoff with full jitter
+    return random.uniform(0, min(NAVER_API_BACKOFF_MAX, NAVER_API_BACKOFF_BASE * (2 ** attempt)))
+
+
+# httpx clients are bound to the event loop they were first used on, so keep one per loop
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_naver_http_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            base_url="https://openapi.naver.com",
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_naver_http_client():
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def naver_api_request(
+    method: str,
+    path: str,
+    client_id: str,
+    client_secret: str,
+    **kwargs,
+) -> httpx.Response:
+    """
+    네이버 Open API를 호출합니다.
+    - 연결은 이벤트 루프별 keep-alive 풀에서 재사용합니다.
+    - 같은 Client ID의 요청은 공유 토큰 버킷으로 속도를 제한합니다.
+    - 429/5xx 응답과 네트워크 오류는 지터가 있는 지수 백오프로 재시도합니다.
+    마지막 시도까지 실패하면 httpx 예외(HTTPStatusError 등)를 그대로 발생시킵니다.
+    """
+    headers = {
+        "X-Naver-Client-Id": client_id,
+        "X-Naver-Client-Secret": client_secret,
+        **kwargs.pop("headers", {}),
+    }
+    client = get_naver_http_client()
+    bucket = get_token_bucket(client_id)
+
+    for attempt in range(NAVER_API_MAX_RETRIES + 1):
+        await bucket.acquire()
+        try:
+            response = await client.request(method, path, headers=headers, **kwargs)
+        except httpx.TransportError:
+            if attempt >= NAVER_API_MAX_RETRIES:
+                raise
+            await asyncio.sleep(_backoff_delay(attempt))
+            continue
+
+        if response.status_code in RETRYABLE_STATUS_CODES and attempt < NAVER_API_MAX_RETRIES:
+            delay = _backoff_delay(attempt, response.headers.get("Retry-After"))
+            print(f"[NaverAPI] {response.status_code} from {path}, retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+            continue
+
+        response.raise_for_status()
+        return response
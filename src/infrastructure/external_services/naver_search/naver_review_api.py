@@ -1,9 +1,12 @@
-import requests
+import httpx
 import os
 import re
-import json
 from datetime import date, timedelta
 
+from src.infrastructure.external_services.naver_search.naver_api_client import (
+    naver_api_request,
+)
+
 # .env 파일에서 네이버 API 키 로드
 # 블로그 검색 API
 NAVER_BLOG_CLIENT_ID = os.getenv("NAVER_CLIENT_ID")
@@ -21,17 +24,12 @@ def clean_html(raw_html):
     cleantext = re.sub(cleanr, '', raw_html)
     return cleantext.strip()
 
-def search_naver_blog(query, display=5, start=1):
+async def search_naver_blog(query, display=5, start=1):
     """네이버 블로그 검색 API를 호출하고 결과를 반환합니다."""
     if not NAVER_BLOG_CLIENT_ID or not NAVER_BLOG_CLIENT_SECRET:
         print("네이버 블로그 API 인증 정보가 .env 파일에 설정되지 않았습니다.")
         return []
 
-    headers = {
-        "X-Naver-Client-Id": NAVER_BLOG_CLIENT_ID,
-        "X-Naver-Client-Secret": NAVER_BLOG_CLIENT_SECRET,
-    }
-    
     params = {
         "query": query,
         "display": display,
@@ -40,11 +38,16 @@ def search_naver_blog(query, display=5, start=1):
     }
 
     try:
-        response = requests.get("https://openapi.naver.com/v1/search/blog.json", headers=headers, params=params)
-        response.raise_for_status()  # 오류 발생 시 예외 처리
-        
+        response = await naver_api_request(
+            "GET",
+            "/v1/search/blog.json",
+            NAVER_BLOG_CLIENT_ID,
+            NAVER_BLOG_CLIENT_SECRET,
+            params=params,
+        )
+
         data = response.json()
-        
+
         results = []
         for item in data.get("items", []):
             results.append({
@@ -55,25 +58,19 @@ def search_naver_blog(query, display=5, start=1):
             })
         return results
 
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"네이버 블로그 API 호출 오류: {e}")
         return []
     except Exception as e:
         print(f"블로그 데이터 처리 중 오류: {e}")
         return []
 
-def get_naver_trend(keyword, start_date, end_date):
+async def get_naver_trend(keyword, start_date, end_date):
     """네이버 데이터랩 검색어 트렌드 API를 호출하고 결과를 반환합니다."""
     if not NAVER_TREND_CLIENT_ID or not NAVER_TREND_CLIENT_SECRET:
         print("네이버 트렌드 API 인증 정보가 .env 파일에 설정되지 않았습니다.")
         return None
 
-    headers = {
-        "X-Naver-Client-Id": NAVER_TREND_CLIENT_ID,
-        "X-Naver-Client-Secret": NAVER_TREND_CLIENT_SECRET,
-        "Content-Type": "application/json"
-    }
-
     body = {
         "startDate": start_date.strftime("%Y-%m-%d"),
         "endDate": end_date.strftime("%Y-%m-%d"),
@@ -82,20 +79,25 @@ def get_naver_trend(keyword, start_date, end_date):
     }
 
     try:
-        response = requests.post("https://openapi.naver.com/v1/datalab/search", headers=headers, data=json.dumps(body))
-        response.raise_for_status()
-        
+        response = await naver_api_request(
+            "POST",
+            "/v1/datalab/search",
+            NAVER_TREND_CLIENT_ID,
+            NAVER_TREND_CLIENT_SECRET,
+            json=body,
+        )
+
         data = response.json()
-        
+
         if not data.get('results') or not data['results'][0].get('data'):
             # print(f"'{keyword}'에 대한 트렌드 검색 결과가 없습니다.") # 로그가 너무 많이 찍히므로 주석 처리
             return None
-            
+
         return data['results'][0]['data']
 
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"네이버 트렌드 API 호출 오류: {e}")
         return None
     except Exception as e:
         print(f"트렌드 데이터 처리 중 오류: {e}")
-        return None
\ No newline at end of file
+        return None
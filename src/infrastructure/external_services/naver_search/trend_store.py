@@ -0,0 +1,130 @@
+import asyncio
+import os
+import threading
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from src.infrastructure.cache.disk_cache import DiskCache
+from src.infrastructure.external_services.naver_search.naver_review_api import (
+    get_naver_trend,
+)
+
+# 키워드마다 하루 한 번 가져오는 기본 구간 (최근 1년 그래프, 과거 3년의 축제 기간 그래프까지 포함)
+TREND_STORE_HISTORY_DAYS = int(os.getenv("TREND_STORE_HISTORY_DAYS", str(4 * 365 + 14)))
+TREND_STORE_MAX_ENTRIES = int(os.getenv("TREND_STORE_MAX_ENTRIES", "5000"))
+TREND_STORE_EMPTY_TTL_SECONDS = 600
+
+
+def _as_date(value) -> date:
+    if isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def _seconds_until_tomorrow() -> float:
+    now = datetime.now()
+    tomorrow = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return max((tomorrow - now).total_seconds(), 60.0)
+
+
+def slice_trend(series: List[dict], start: date, end: date) -> Optional[List[dict]]:
+    """
+    저장된 일별 트렌드에서 [start, end] 구간을 잘라냅니다.
+    데이터랩의 ratio는 조회 구간의 최댓값을 100으로 정규화한 값이므로,
+    잘라낸 구간도 그 구간의 최댓값 기준으로 다시 정규화해 직접 조회한 결과와 같은 척도로 맞춥니다.
+    """
+    start_str, end_str = start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+    points = [p for p in series if start_str <= p["period"] <= end_str]
+    if not points:
+        return None
+    peak = max(p["ratio"] for p in points)
+    if peak <= 0:
+        return [dict(p) for p in points]
+    return [{"period": p["period"], "ratio": p["ratio"] * 100.0 / peak} for p in points]
+
+
+class TrendStore:
+    """
+    키워드별 검색량 트렌드를 하루에 한 번만 넓은 구간으로 조회하고,
+    좁은 구간 요청은 저장된 시계열을 잘라서 응답하는 저장소.
+    결과는 디스크 캐시에 당일 자정까지 보관되므로 재시작 후에도 재사용됩니다.
+    """
+
+    def __init__(self, history_days: int = TREND_STORE_HISTORY_DAYS):
+        self.history_days = history_days
+        self._cache = DiskCache("trend_series", max_entries=TREND_STORE_MAX_ENTRIES)
+        # In-flight fetches per (event loop, cache key) so concurrent callers share one request
+        self._in_flight: Dict[Tuple[int, str], asyncio.Task] = {}
+        self.api_calls = 0
+
+    def _history_window(self, today: date) -> Tuple[date, date]:
+        return today - timedelta(days=self.history_days), today
+
+    async def _fetch_once(self, key: str, keyword: str, start: date, end: date) -> dict:
+        entry = await asyncio.to_thread(self._cache.get, key)
+        if entry is not None:
+            return entry
+
+        loop_key = (id(asyncio.get_running_loop()), key)
+        task = self._in_flight.get(loop_key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_store(key, keyword, start, end))
+            self._in_flight[loop_key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(loop_key, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(self, key: str, keyword: str, start: date, end: date) -> dict:
+        self.api_calls += 1
+        data = await get_naver_trend(keyword, start, end)
+        entry = {
+            "start": start.strftime("%Y-%m-%d"),
+            "end": end.strftime("%Y-%m-%d"),
+            "data": data or [],
+        }
+        # get_naver_trend returns None both for "no data" and for API errors,
+        # so empty answers are only remembered briefly
+        ttl = _seconds_until_tomorrow() if data else TREND_STORE_EMPTY_TTL_SECONDS
+        await asyncio.to_thread(self._cache.set, key, entry, ttl)
+        return entry
+
+    async def get_trend(self, keyword: str, start_date, end_date) -> Optional[List[dict]]:
+        """get_naver_trend와 같은 형식({'period', 'ratio'} 목록 또는 None)으로 구간 트렌드를 반환합니다."""
+        if not keyword:
+            return None
+        start, end = _as_date(start_date), _as_date(end_date)
+        today = date.today()
+        end = min(end, today)
+        if start > end:
+            return None
+
+        history_start, history_end = self._history_window(today)
+        if start >= history_start:
+            key = f"{keyword}|{today.isoformat()}"
+            entry = await self._fetch_once(key, keyword, history_start, history_end)
+        else:
+            # Older than the daily window: fetch this window on its own (still cached for the day)
+            key = f"{keyword}|{today.isoformat()}|{start.isoformat()}|{end.isoformat()}"
+            entry = await self._fetch_once(key, keyword, start, end)
+
+        return slice_trend(entry["data"], start, end)
+
+    def stats(self) -> dict:
+        return {"api_calls": self.api_calls, **self._cache.stats()}
+
+
+_trend_store: Optional[TrendStore] = None
+_trend_store_lock = threading.Lock()
+
+
+def get_trend_store() -> TrendStore:
+    global _trend_store
+    if _trend_store is None:
+        with _trend_store_lock:
+            if _trend_store is None:
+                _trend_store = TrendStore()
+    return _trend_store
+
+
+async def get_trend_series(keyword, start_date, end_date):
+    """공유 TrendStore를 통해 트렌드를 조회합니다 (get_naver_trend 대체)."""
+    return await get_trend_store().get_trend(keyword, start_date, end_date)
@@ -0,0 +1,218 @@
+import asyncio
+import os
+import time
+import weakref
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from playwright.async_api import async_playwright
+
+# 브라우저 풀 설정 (환경 변수로 조정 가능)
+SCRAPER_MAX_CONCURRENCY = int(os.getenv("SCRAPER_MAX_CONCURRENCY", str(min(8, (os.cpu_count() or 2) * 2))))
+SCRAPER_PER_HOST_CONCURRENCY = int(os.getenv("SCRAPER_PER_HOST_CONCURRENCY", "4"))
+SCRAPER_HOST_MIN_INTERVAL = float(os.getenv("SCRAPER_HOST_MIN_INTERVAL", "0.2"))
+SCRAPER_PAGE_MAX_USES = int(os.getenv("SCRAPER_PAGE_MAX_USES", "50"))
+SCRAPER_CONTEXT_COUNT = int(os.getenv("SCRAPER_CONTEXT_COUNT", "2"))
+
+# 본문 추출에는 필요 없는 리소스 (이미지 URL은 DOM 속성에서 읽으므로 실제 로드는 불필요)
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font", "stylesheet"}
+BLOCKED_HOST_KEYWORDS = (
+    "doubleclick.net",
+    "googlesyndication.com",
+    "google-analytics.com",
+    "googletagmanager.com",
+    "adservice",
+    "adcr.naver.com",
+    "veta.naver.com",
+    "siape.veta.naver.com",
+    "nlog.naver.com",
+    "wcs.naver.net",
+)
+
+
+async def _block_unneeded_resources(route):
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or any(
+        keyword in request.url for keyword in BLOCKED_HOST_KEYWORDS
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+class _PooledPage:
+    def __init__(self, page, context):
+        self.page = page
+        self.context = context
+        self.uses = 0
+
+
+class BrowserPool:
+    """
+    프로세스 전체에서 하나의 headless Chromium을 띄워두고, 컨텍스트와 페이지를 재사용하는 풀.
+
+    - 전체 동시 페이지 수(max_concurrency)와 호스트별 동시 요청 수/최소 간격을 제한합니다.
+    - 이미지, 폰트, CSS, 광고 요청은 차단해 본문 추출에 필요한 것만 로드합니다.
+    - 페이지는 max_page_uses 회 사용하거나 오류가 나면 닫고 새로 만듭니다.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = SCRAPER_MAX_CONCURRENCY,
+        per_host_concurrency: int = SCRAPER_PER_HOST_CONCURRENCY,
+        host_min_interval: float = SCRAPER_HOST_MIN_INTERVAL,
+        max_page_uses: int = SCRAPER_PAGE_MAX_USES,
+        context_count: int = SCRAPER_CONTEXT_COUNT,
+    ):
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.host_min_interval = host_min_interval
+        self.max_page_uses = max_page_uses
+        self.context_count = max(1, context_count)
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._host_next_start: Dict[str, float] = {}
+        self._host_lock = asyncio.Lock()
+        self._start_lock = asyncio.Lock()
+
+        self._playwright = None
+        self._browser = None
+        self._contexts: List = []
+        self._next_context = 0
+        self._idle_pages: List[_PooledPage] = []
+
+        self.launches = 0
+        self.pages_created = 0
+        self.pages_recycled = 0
+
+    async def _ensure_browser(self):
+        if self._browser is not None and self._browser.is_connected():
+            return
+        async with self._start_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return
+            await self._close_browser()
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            self._browser = await self._playwright.chromium.launch(headless=True)
+            self._contexts = []
+            for _ in range(self.context_count):
+                context = await self._browser.new_context()
+                await context.route("**/*", _block_unneeded_resources)
+                self._contexts.append(context)
+            self._idle_pages = []
+            self.launches += 1
+            print(f"[BrowserPool] Chromium launched ({self.context_count} contexts, max {self.max_concurrency} pages)")
+
+    async def _close_browser(self):
+        self._idle_pages = []
+        self._contexts = []
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+
+    async def _wait_for_host_slot(self, host: str):
+        # Space out request starts to the same host (politeness)
+        async with self._host_lock:
+            now = time.monotonic()
+            start_at = max(now, self._host_next_start.get(host, now))
+            self._host_next_start[host] = start_at + self.host_min_interval
+        delay = start_at - now
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        semaphore = self._host_semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.per_host_concurrency)
+            self._host_semaphores[host] = semaphore
+        return semaphore
+
+    async def _checkout_page(self) -> _PooledPage:
+        await self._ensure_browser()
+        while self._idle_pages:
+            pooled = self._idle_pages.pop()
+            if not pooled.page.is_closed():
+                return pooled
+        context = self._contexts[self._next_context % len(self._contexts)]
+        self._next_context += 1
+        page = await context.new_page()
+        self.pages_created += 1
+        return _PooledPage(page, context)
+
+    async def _release_page(self, pooled: _PooledPage, healthy: bool):
+        pooled.uses += 1
+        if (
+            healthy
+            and pooled.uses < self.max_page_uses
+            and pooled.context in self._contexts
+            and not pooled.page.is_closed()
+        ):
+            self._idle_pages.append(pooled)
+            return
+        self.pages_recycled += 1
+        try:
+            await pooled.page.close()
+        except Exception:
+            pass
+
+    @asynccontextmanager
+    async def page(self, url: str):
+        """
+        url을 열 준비가 된 페이지를 빌려줍니다. 블록을 벗어나면 페이지는 풀로 돌아갑니다.
+
+            async with get_browser_pool().page(url) as page:
+                await page.goto(url)
+        """
+        host = urlparse(url).netloc
+        async with self._semaphore:
+            async with self._host_semaphore(host):
+                await self._wait_for_host_slot(host)
+                pooled = await self._checkout_page()
+                healthy = False
+                try:
+                    yield pooled.page
+                    healthy = True
+                finally:
+                    await self._release_page(pooled, healthy)
+
+    async def close(self):
+        async with self._start_lock:
+            await self._close_browser()
+            if self._playwright is not None:
+                await self._playwright.stop()
+                self._playwright = None
+
+    def stats(self) -> dict:
+        return {
+            "launches": self.launches,
+            "pages_created": self.pages_created,
+            "pages_recycled": self.pages_recycled,
+            "idle_pages": len(self._idle_pages),
+        }
+
+
+# Playwright objects are bound to the event loop that created them, so keep one pool per loop
+_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, BrowserPool]" = weakref.WeakKeyDictionary()
+
+
+def get_browser_pool() -> BrowserPool:
+    """현재 이벤트 루프에서 공유하는 브라우저 풀을 반환합니다."""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None:
+        pool = BrowserPool()
+        _pools[loop] = pool
+    return pool
+
+
+async def close_browser_pool():
+    """현재 이벤트 루프의 브라우저 풀을 종료합니다 (서버 종료 시)."""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.close()
@@ -0,0 +1,157 @@
+import asyncio
+import re
+import weakref
+from typing import List, Optional, Tuple
+from urllib.parse import parse_qs, urljoin, urlparse
+
+import httpx
+from lxml import html as lxml_html
+
+# Playwright 스크래퍼와 같은 순서로 본문 컨테이너를 찾습니다.
+# (div.se-main-container, div.post-view, #postViewArea 에 해당하는 XPath)
+CONTENT_XPATHS = [
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' se-main-container ')]",
+    "//div[contains(concat(' ', normalize-space(@class), ' '), ' post-view ')]",
+    "//*[@id='postViewArea']",
+]
+
+BLOG_HOSTS = ("blog.naver.com", "m.blog.naver.com")
+POSTVIEW_URL = "https://blog.naver.com/PostView.naver?blogId={blog_id}&logNo={log_no}&redirect=Dlog&widgetTypeCall=true&directAccess=false"
+
+HTTP_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+    "Referer": "https://blog.naver.com/",
+}
+
+BLOCK_TAGS = ("p", "div", "li", "tr", "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "table")
+
+
+def is_content_image(src: Optional[str]) -> bool:
+    """본문 이미지로 쓸 수 있는 URL인지 확인합니다 (이모티콘/스티커, 지도 이미지는 제외)."""
+    if not src or not src.startswith("http"):
+        return False
+    # Filter out emoticons/stickers
+    if "storep-phinf.pstatic.net" in src and "ogq_" in src:
+        return False
+    # Filter out map images
+    if "simg.pstatic.net" in src and "static.map" in src:
+        return False
+    return True
+
+
+def to_postview_url(url: str) -> Optional[str]:
+    """
+    블로그 글 URL을 iframe#mainFrame 안에서 열리는 PostView URL로 변환합니다.
+    URL만으로 blogId/logNo를 알 수 없으면 None을 반환합니다.
+    """
+    parsed = urlparse(url)
+    if parsed.netloc not in BLOG_HOSTS:
+        return None
+    query = parse_qs(parsed.query)
+    if parsed.path.startswith("/PostView") and "blogId" in query and "logNo" in query:
+        return POSTVIEW_URL.format(blog_id=query["blogId"][0], log_no=query["logNo"][0])
+
+    parts = [part for part in parsed.path.split("/") if part]
+    if len(parts) >= 2 and parts[1].isdigit():
+        return POSTVIEW_URL.format(blog_id=parts[0], log_no=parts[1])
+    if len(parts) == 1 and "logNo" in query:
+        return POSTVIEW_URL.format(blog_id=parts[0], log_no=query["logNo"][0])
+    return None
+
+
+def _element_text(element) -> str:
+    """블록 요소 경계를 줄바꿈으로 바꿔 inner_text와 비슷한 본문 텍스트를 만듭니다."""
+    for node in element.xpath(".//script|.//style"):
+        node.drop_tree()
+    for node in element.iter("br"):
+        node.tail = "\n" + (node.tail or "")
+    for node in element.iter(*BLOCK_TAGS):
+        node.tail = "\n" + (node.tail or "")
+    text = element.text_content().replace("\u200b", "")
+    lines = [re.sub(r"[ \t\xa0]+", " ", line).strip() for line in text.splitlines()]
+    return "\n".join(line for line in lines if line)
+
+
+def _element_images(element) -> List[str]:
+    image_urls = []
+    for img in element.iter("img"):
+        # 네이버 블로그는 lazy loading을 사용하므로 data-lazy-src, data-src, src 순으로 확인
+        src = img.get("data-lazy-src") or img.get("data-src") or img.get("src")
+        if is_content_image(src) and src not in image_urls:
+            image_urls.append(src)
+    return image_urls
+
+
+def parse_blog_html(page_html: str) -> Optional[Tuple[str, List[str]]]:
+    """PostView HTML에서 (본문 텍스트, 이미지 URL 목록)을 추출합니다. 본문이 없으면 None."""
+    try:
+        tree = lxml_html.fromstring(page_html)
+    except Exception:
+        return None
+    for xpath in CONTENT_XPATHS:
+        elements = tree.xpath(xpath)
+        if not elements:
+            continue
+        element = elements[0]
+        image_urls = _element_images(element)
+        text_content = _element_text(element)
+        if text_content.strip():
+            return text_content, image_urls
+    return None
+
+
+# httpx clients are bound to the event loop they were first used on, so keep one per loop
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def get_http_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            headers=HTTP_HEADERS,
+            timeout=httpx.Timeout(10.0, connect=5.0),
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+        _clients[loop] = client
+    return client
+
+
+async def close_http_client():
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+async def fetch_blog_content(url: str) -> Optional[Tuple[str, List[str]]]:
+    """
+    브라우저 없이 HTTP 요청만으로 블로그 본문과 이미지 URL을 가져옵니다.
+    정적 HTML로 본문을 찾지 못하면 None을 반환하므로, 호출자는 Playwright로 폴백하면 됩니다.
+    """
+    client = get_http_client()
+    try:
+        postview_url = to_postview_url(url)
+        if postview_url is None:
+            response = await client.get(url)
+            if response.status_code != 200:
+                return None
+            # The blog shell page embeds the actual post in iframe#mainFrame
+            tree = lxml_html.fromstring(response.text)
+            frames = tree.xpath("//iframe[@id='mainFrame']")
+            if frames and frames[0].get("src"):
+                postview_url = urljoin(str(response.url), frames[0].get("src"))
+            else:
+                return parse_blog_html(response.text)
+
+        response = await client.get(postview_url)
+        if response.status_code != 200:
+            return None
+        return parse_blog_html(response.text)
+    except Exception as e:
+        print(f"[NaverBlogHTTP] Static fetch failed for {url}: {e}")
+        return None
@@ -1,13 +1,264 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
+from langchain_core.messages import AIMessage
 from langchain_google_genai import ChatGoogleGenerativeAI
 from src.infrastructure.config.settings import get_google_api_key
+from src.infrastructure.cache.disk_cache import DiskCache
+from src.infrastructure.cache.single_flight import SingleFlight
+
+# LLM 응답 캐시 설정 (환경 변수로 조정 가능)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() not in ("0", "false", "no")
+LLM_CACHE_TTL_SECONDS = float(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "50000"))
+LLM_CACHE_MAX_BYTES = int(os.getenv("LLM_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# 최근 호출 지연 시간을 몇 개까지 보관할지 (p50/p95 계산용)
+LLM_LATENCY_WINDOW = int(os.getenv("LLM_LATENCY_WINDOW", "512"))
+
+_response_cache: Optional[DiskCache] = None
+_response_cache_lock = threading.Lock()
+_in_flight = SingleFlight()
+
+
+def get_llm_response_cache() -> DiskCache:
+    global _response_cache
+    if _response_cache is None:
+        with _response_cache_lock:
+            if _response_cache is None:
+                _response_cache = DiskCache(
+                    "llm_responses",
+                    default_ttl=LLM_CACHE_TTL_SECONDS,
+                    max_entries=LLM_CACHE_MAX_ENTRIES,
+                    max_bytes=LLM_CACHE_MAX_BYTES,
+                )
+    return _response_cache
+
+
+class LLMClientStats:
+    """클라이언트 하나의 호출 수, 동시 진행 수, 오류 수, 지연 시간 통계."""
+
+    def __init__(self, model: str, temperature: float):
+        self.model = model
+        self.temperature = temperature
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.total_seconds = 0.0
+        self._recent: deque = deque(maxlen=LLM_LATENCY_WINDOW)
+
+    @contextmanager
+    def track(self):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        started = time.perf_counter()
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.in_flight -= 1
+                self.calls += 1
+                self.errors += failed
+                self.total_seconds += elapsed
+                self._recent.append(elapsed)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            recent = sorted(self._recent)
+            calls, total = self.calls, self.total_seconds
+            snapshot = {
+                "model": self.model,
+                "temperature": self.temperature,
+                "calls": calls,
+                "errors": self.errors,
+                "in_flight": self.in_flight,
+                "max_in_flight": self.max_in_flight,
+            }
+
+        def percentile(q: float) -> float:
+            if not recent:
+                return 0.0
+            return recent[min(len(recent) - 1, int(q * len(recent)))] * 1000
+
+        snapshot.update(
+            avg_ms=round(total / calls * 1000, 1) if calls else 0.0,
+            p50_ms=round(percentile(0.5), 1),
+            p95_ms=round(percentile(0.95), 1),
+            max_ms=round(recent[-1] * 1000, 1) if recent else 0.0,
+        )
+        return snapshot
+
+
+class InstrumentedLLMClient:
+    """실제 API 호출(invoke/ainvoke)의 동시 진행 수와 지연 시간을 기록하는 래퍼."""
+
+    def __init__(self, client: ChatGoogleGenerativeAI, stats: LLMClientStats):
+        self.client = client
+        self.stats = stats
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
+
+    # cache_if is accepted (and ignored) so callers can pass it whether or not the cache is enabled
+    def invoke(self, *args, cache_if=None, **kwargs):
+        with self.stats.track():
+            return self.client.invoke(*args, **kwargs)
+
+    async def ainvoke(self, *args, cache_if=None, **kwargs):
+        with self.stats.track():
+            return await self.client.ainvoke(*args, **kwargs)
+
+
+class CachedLLMClient:
+    """
+    LLM 클라이언트를 감싸 (model, temperature, prompt) 해시 기준으로 응답을 캐시합니다.
+    - 캐시에 있으면 API를 호출하지 않고 저장된 응답을 AIMessage로 돌려줍니다.
+    - 같은 프롬프트가 동시에 들어오면 하나의 호출로 합칩니다.
+    - cache_if(응답 문자열) -> bool 을 넘기면 True인 응답만 캐시하고, 기준에 맞지 않는 기존 캐시 항목은 버리고 다시 호출합니다.
+      응답 형식을 파싱해야 하는 호출자는 파싱 가능 여부를 cache_if로 넘겨, 잘못된 응답이 TTL 동안 재사용되지 않게 합니다.
+    문자열 프롬프트만 캐시하며, 그 외 입력(메시지 목록, 이미지 등)과 나머지 속성은 원래 클라이언트로 그대로 전달합니다.
+    """
+
+    def __init__(self, client: ChatGoogleGenerativeAI, model: str, temperature: float):
+        self.client = client
+        self.model = model
+        self.temperature = temperature
+
+    def __getattr__(self, name):
+        return getattr(self.client, name)
 
-def get_llm_client(temperature: float = 0.0, model: str = "gemini-2.5-pro") -> ChatGoogleGenerativeAI:
-    """Google Generative AI LLM 클라이언트를 반환합니다."""
+    def _cache_key(self, prompt: str) -> str:
+        payload = json.dumps([self.model, self.temperature, prompt], ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _to_message(content: str) -> AIMessage:
+        return AIMessage(content=content)
+
+    @staticmethod
+    def _lookup(cache: DiskCache, key: str, cache_if: Optional[Callable[[str], bool]]) -> Optional[str]:
+        cached = cache.get(key)
+        if cached is not None and cache_if is not None and not cache_if(cached):
+            cache.delete(key)
+            return None
+        return cached
+
+    @staticmethod
+    def _store(cache: DiskCache, key: str, content, cache_if: Optional[Callable[[str], bool]]):
+        if isinstance(content, str) and (cache_if is None or cache_if(content)):
+            cache.set(key, content)
+
+    def invalidate(self, prompt: str):
+        """프롬프트의 캐시된 응답을 지웁니다 (응답을 쓸 수 없다고 뒤늦게 판단한 경우)."""
+        get_llm_response_cache().delete(self._cache_key(prompt))
+
+    def invoke(self, prompt, *args, cache_if: Optional[Callable[[str], bool]] = None, **kwargs):
+        if not isinstance(prompt, str) or args or kwargs:
+            return self.client.invoke(prompt, *args, **kwargs)
+
+        cache = get_llm_response_cache()
+        key = self._cache_key(prompt)
+        cached = self._lookup(cache, key, cache_if)
+        if cached is not None:
+            return self._to_message(cached)
+
+        def call():
+            response = self.client.invoke(prompt)
+            self._store(cache, key, response.content, cache_if)
+            return response
+
+        return _in_flight.do_sync(key, call)
+
+    async def ainvoke(self, prompt, *args, cache_if: Optional[Callable[[str], bool]] = None, **kwargs):
+        if not isinstance(prompt, str) or args or kwargs:
+            return await self.client.ainvoke(prompt, *args, **kwargs)
+
+        cache = get_llm_response_cache()
+        key = self._cache_key(prompt)
+        cached = await asyncio.to_thread(self._lookup, cache, key, cache_if)
+        if cached is not None:
+            return self._to_message(cached)
+
+        async def call():
+            response = await self.client.ainvoke(prompt)
+            await asyncio.to_thread(self._store, cache, key, response.content, cache_if)
+            return response
+
+        # share(): a cancelled caller (e.g. an abandoned speculative page task) must not cancel
+        # the identical call another request is waiting on
+        return await _in_flight.share(key, call)
+
+
+# (model, temperature)별로 한 번만 만들어 계속 재사용하는 클라이언트 레지스트리
+_base_clients: Dict[Tuple[str, float], InstrumentedLLMClient] = {}
+_cached_clients: Dict[Tuple[str, float], CachedLLMClient] = {}
+_registry_lock = threading.Lock()
+
+
+def _get_base_client(model: str, temperature: float) -> InstrumentedLLMClient:
+    key = (model, temperature)
+    client = _base_clients.get(key)
+    if client is None:
+        with _registry_lock:
+            client = _base_clients.get(key)
+            if client is None:
+                api_key = get_google_api_key()
+                raw_client = ChatGoogleGenerativeAI(temperature=temperature, model=model, google_api_key=api_key)
+                client = InstrumentedLLMClient(raw_client, LLMClientStats(model, temperature))
+                _base_clients[key] = client
+                print(f"[LLM] 클라이언트 생성: model={model}, temperature={temperature}")
+    return client
+
+
+def get_llm_client(temperature: float = 0.0, model: str = "gemini-2.5-pro", cache: bool = True):
+    """
+    Google Generative AI LLM 클라이언트를 반환합니다.
+    같은 (model, temperature)에는 프로세스 전체에서 하나의 클라이언트를 재사용하므로
+    호출할 때마다 새로 만들지 않고 연결 풀을 계속 씁니다.
+    cache=True(기본값)이면 프롬프트 기준 응답 캐시가 적용된 클라이언트를 반환합니다.
+    """
     try:
-        api_key = get_google_api_key()
-        return ChatGoogleGenerativeAI(temperature=temperature, model=model, google_api_key=api_key)
+        temperature = float(temperature)
+        client = _get_base_client(model, temperature)
+        if not (cache and LLM_CACHE_ENABLED):
+            return client
+        key = (model, temperature)
+        cached_client = _cached_clients.get(key)
+        if cached_client is None:
+            with _registry_lock:
+                cached_client = _cached_clients.setdefault(key, CachedLLMClient(client, model, temperature))
+        return cached_client
     except Exception as e:
         print(f"LLM 초기화 오류: {e}. GOOGLE_API_KEY가 .env 파일에 설정되었는지 확인하세요.")
         # 여기서 None을 반환하거나, 예외를 다시 발생시킬 수 있습니다.
         # 예외를 다시 발생시키면 앱 시작 시 문제를 명확히 알 수 있습니다.
         raise e
+
+
+def get_llm_client_stats() -> List[dict]:
+    """레지스트리에 있는 클라이언트별 호출/지연 통계를 반환합니다."""
+    with _registry_lock:
+        clients = list(_base_clients.values())
+    return [client.stats.snapshot() for client in clients]
+
+
+def invalidate_llm_clients():
+    """레지스트리를 비웁니다 (API 키 변경 등). 이미 받아 간 클라이언트는 그대로 동작합니다."""
+    with _registry_lock:
+        _base_clients.clear()
+        _cached_clients.clear()
@@ -0,0 +1,164 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Sequence, Tuple
+
+from konlpy.tag import Okt
+
+# 형태소 분석 결과 메모 크기 (항목 수 / 저장된 토큰 수)
+OKT_CACHE_MAX_ENTRIES = int(os.getenv("OKT_CACHE_MAX_ENTRIES", "20000"))
+OKT_CACHE_MAX_TOKENS = int(os.getenv("OKT_CACHE_MAX_TOKENS", "2000000"))
+# 한 번의 JVM 호출로 묶어서 분석할 최대 글자 수
+OKT_BATCH_MAX_CHARS = int(os.getenv("OKT_BATCH_MAX_CHARS", "50000"))
+# 이보다 긴 텍스트는 원문 대신 해시를 메모 키로 사용
+OKT_KEY_MAX_CHARS = 256
+
+# 여러 텍스트를 한 문자열로 이어 붙일 때 쓰는 구분자 (Okt는 라틴 문자열을 하나의 Alpha 토큰으로 남김)
+_BATCH_SEPARATOR = "OKTBATCHSEPARATOR"
+
+Tags = Tuple[Tuple[str, str], ...]
+
+
+class OktTagger:
+    """
+    KoNLPy Okt 앞단의 형태소 분석 서비스.
+
+    - (텍스트, 옵션) → 분석 결과를 LRU로 메모해 같은 표현(맛있다, 친절하다, 최고 …)은 JVM을 다시 거치지 않습니다.
+    - pos_many()/nouns_many()는 메모에 없는 텍스트들을 구분자로 이어 붙여 한 번의 JVM 호출로 분석합니다.
+      구분자 기준으로 결과가 정확히 나뉘지 않으면 그 묶음만 텍스트별로 다시 분석합니다.
+    - JPype 호출은 잠금으로 한 번에 하나씩 처리합니다.
+    """
+
+    def __init__(self, max_entries: int = OKT_CACHE_MAX_ENTRIES, max_tokens: int = OKT_CACHE_MAX_TOKENS):
+        self.max_entries = max_entries
+        self.max_tokens = max_tokens
+        self._okt: Optional[Okt] = None
+        self._okt_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._memo: "OrderedDict[tuple, Tags]" = OrderedDict()
+        self._memo_tokens = 0
+        self.hits = 0
+        self.misses = 0
+        self.jvm_calls = 0
+
+    @staticmethod
+    def _key(text: str, norm: bool, stem: bool) -> tuple:
+        if len(text) > OKT_KEY_MAX_CHARS:
+            text = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        return (text, norm, stem)
+
+    def _get(self, key: tuple) -> Optional[Tags]:
+        with self._lock:
+            tags = self._memo.get(key)
+            if tags is None:
+                self.misses += 1
+                return None
+            self._memo.move_to_end(key)
+            self.hits += 1
+            return tags
+
+    def _put(self, key: tuple, tags: Tags):
+        with self._lock:
+            previous = self._memo.pop(key, None)
+            if previous is not None:
+                self._memo_tokens -= len(previous)
+            self._memo[key] = tags
+            self._memo_tokens += len(tags)
+            while self._memo and (
+                len(self._memo) > self.max_entries or self._memo_tokens > self.max_tokens
+            ):
+                _, evicted = self._memo.popitem(last=False)
+                self._memo_tokens -= len(evicted)
+
+    def _tag(self, text: str, norm: bool, stem: bool) -> List[Tuple[str, str]]:
+        with self._okt_lock:
+            if self._okt is None:
+                self._okt = Okt()
+            self.jvm_calls += 1
+            return self._okt.pos(text, norm=norm, stem=stem)
+
+    def _tag_batch(self, texts: Sequence[str], norm: bool, stem: bool) -> List[Tags]:
+        if len(texts) == 1:
+            return [tuple(self._tag(texts[0], norm, stem))]
+
+        joined = f"\n{_BATCH_SEPARATOR}\n".join(texts)
+        segments: List[List[Tuple[str, str]]] = [[]]
+        for word, tag in self._tag(joined, norm, stem):
+            if word.upper() == _BATCH_SEPARATOR:
+                segments.append([])
+            else:
+                segments[-1].append((word, tag))
+
+        if len(segments) != len(texts):
+            # The separator did not survive tokenization; tag this batch one text at a time
+            return [tuple(self._tag(text, norm, stem)) for text in texts]
+        return [tuple(segment) for segment in segments]
+
+    def pos(self, text: str, norm: bool = False, stem: bool = False) -> List[Tuple[str, str]]:
+        return self.pos_many([text], norm=norm, stem=stem)[0]
+
+    def pos_many(self, texts: Sequence[str], norm: bool = False, stem: bool = False) -> List[List[Tuple[str, str]]]:
+        """여러 텍스트의 품사 태깅 결과를 입력 순서대로 반환합니다 (메모에 없는 것만 묶어서 분석)."""
+        results: List[Optional[Tags]] = [None] * len(texts)
+        missing = {}
+        for i, text in enumerate(texts):
+            key = self._key(text, norm, stem)
+            tags = self._get(key)
+            if tags is not None:
+                results[i] = tags
+            else:
+                missing.setdefault(key, (text, []))[1].append(i)
+
+        batch: List[tuple] = []
+        batch_chars = 0
+
+        def run_batch():
+            tagged = self._tag_batch([text for _, text in batch], norm, stem)
+            for (key, _), tags in zip(batch, tagged):
+                self._put(key, tags)
+                for i in missing[key][1]:
+                    results[i] = tags
+
+        for key, (text, _) in missing.items():
+            if batch and batch_chars + len(text) > OKT_BATCH_MAX_CHARS:
+                run_batch()
+                batch, batch_chars = [], 0
+            batch.append((key, text))
+            batch_chars += len(text)
+        if batch:
+            run_batch()
+
+        return [list(tags) for tags in results]
+
+    def nouns(self, text: str) -> List[str]:
+        return self.nouns_many([text])[0]
+
+    def nouns_many(self, texts: Sequence[str]) -> List[List[str]]:
+        # Same as Okt.nouns(): plain pos() tags filtered to nouns
+        return [[word for word, tag in tags if tag == "Noun"] for tags in self.pos_many(texts)]
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._memo),
+                "tokens": self._memo_tokens,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "jvm_calls": self.jvm_calls,
+            }
+
+
+_okt_tagger: Optional[OktTagger] = None
+_okt_tagger_lock = threading.Lock()
+
+
+def get_okt_tagger() -> OktTagger:
+    global _okt_tagger
+    if _okt_tagger is None:
+        with _okt_tagger_lock:
+            if _okt_tagger is None:
+                _okt_tagger = OktTagger()
+    return _okt_tagger
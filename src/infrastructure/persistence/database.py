@@ -2,6 +2,10 @@ import pandas as pd
 import sqlite3
 import os
 import re # re 모듈 추가
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Get database path from environment variable or auto-detect sibling directory
 # This allows the project to work when cloned by others without hardcoded paths
@@ -58,59 +62,144 @@ TABLE_COLUMNS_MAP = {
     "courses": COURSES_COLUMNS
 }
 
+# upsert 시 같은 행으로 간주할 키 (courses는 코스 내 지점마다 한 행)
+TABLE_UPSERT_KEYS = {
+    "festivals": ("contentid",),
+    "facilities": ("contentid",),
+    "courses": ("contentid", "subnum"),
+}
+
+# 읽기 전용 커넥션 설정
+DB_READ_POOL_SIZE = int(os.getenv("DB_READ_POOL_SIZE", "8"))
+DB_MMAP_SIZE = int(os.getenv("DB_MMAP_SIZE", str(256 * 1024 * 1024)))
+DB_STATEMENT_CACHE_SIZE = 256
+# 메모리 인덱스가 tour.db의 데이터 버전(data_versions)을 다시 확인하는 최소 간격
+DATA_VERSION_CHECK_SECONDS = float(os.getenv("DATA_VERSION_CHECK_SECONDS", "5"))
+
 def get_db_connection():
     conn = sqlite3.connect(db_path)
     conn.row_factory = sqlite3.Row
     return conn
 
-def init_db():
-    print(f"Attempting to initialize database at: {db_path}")
-    # Remove the old database file if it exists to start fresh
-    if os.path.exists(db_path):
-        os.remove(db_path)
-        print(f"Removed old database file: {db_path}")
 
-    conn = sqlite3.connect(db_path)
-    cursor = conn.cursor()
-    print(f"Connected to database for table creation: {db_path}")
-
-    # Create tables
-    print("Creating festivals table...")
-    # FESTIVALS_COLUMNS를 사용하여 SQL 쿼리 생성
-    festivals_cols_sql = ", ".join([f"{col} TEXT" if col not in ['areacode', 'mapx', 'mapy', 'mlevel', 'sigungucode'] else f"{col} INTEGER" if col in ['areacode', 'mlevel', 'sigungucode'] else f"{col} REAL" for col in FESTIVALS_COLUMNS])
-    cursor.execute(f'''
-        CREATE TABLE IF NOT EXISTS festivals (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            {festivals_cols_sql}
-        )
-    ''')
-    print("Festivals table created.")
-
-    print("Creating facilities table...")
-    # FACILITIES_COLUMNS를 사용하여 SQL 쿼리 생성
-    facilities_cols_sql = ", ".join([f"{col} TEXT" if col not in ['areacode', 'mapx', 'mapy', 'mlevel', 'sigungucode'] else f"{col} INTEGER" if col in ['areacode', 'mlevel', 'sigungucode'] else f"{col} REAL" for col in FACILITIES_COLUMNS])
-    cursor.execute(f'''
-        CREATE TABLE IF NOT EXISTS facilities (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            {facilities_cols_sql}
-        )
-    ''')
-    print("Facilities table created.")
-
-    print("Creating courses table...")
-    # COURSES_COLUMNS를 사용하여 SQL 쿼리 생성
-    courses_cols_sql = ", ".join([f"{col} TEXT" if col not in ['areacode', 'mapx', 'mapy', 'mlevel', 'sigungucode'] else f"{col} INTEGER" if col in ['areacode', 'mlevel', 'sigungucode'] else f"{col} REAL" for col in COURSES_COLUMNS])
-    cursor.execute(f'''
-        CREATE TABLE IF NOT EXISTS courses (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            {courses_cols_sql}
-        )
-    ''')
-    print("Courses table created.")
+# --- Read path ---------------------------------------------------------------
+# Request handlers only read tour.db, so each worker thread keeps one read-only
+# connection open (mmap'd, with sqlite3's prepared-statement cache) instead of
+# opening the file per call. WAL mode lets these readers run alongside a loader.
+
+_read_local = threading.local()
+_read_executor = ThreadPoolExecutor(max_workers=DB_READ_POOL_SIZE, thread_name_prefix="db-read")
+
+
+def _open_read_connection():
+    conn = sqlite3.connect(
+        f"file:{db_path}?mode=ro",
+        uri=True,
+        cached_statements=DB_STATEMENT_CACHE_SIZE,
+        check_same_thread=False,
+    )
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA query_only = ON")
+    conn.execute(f"PRAGMA mmap_size = {DB_MMAP_SIZE}")
+    return conn
+
+
+def get_read_connection():
+    """
+    현재 스레드의 읽기 전용 커넥션을 반환합니다 (스레드마다 한 번만 열림).
+    호출자가 close()하지 않습니다.
+    """
+    conn = getattr(_read_local, "conn", None)
+    if conn is None:
+        conn = _open_read_connection()
+        _read_local.conn = conn
+    return conn
+
+
+def fetch_one(sql, params=()):
+    """쿼리 결과의 첫 행을 dict로 반환합니다 (없으면 None)."""
+    row = get_read_connection().execute(sql, params).fetchone()
+    return dict(row) if row else None
+
+
+def fetch_all(sql, params=()):
+    """쿼리 결과 전체를 dict 리스트로 반환합니다."""
+    return [dict(row) for row in get_read_connection().execute(sql, params).fetchall()]
+
+
+async def run_read(func, *args):
+    """DB를 읽는 동기 함수를 읽기 전용 스레드 풀에서 실행해 이벤트 루프를 막지 않습니다."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_read_executor, func, *args)
+
+
+def get_data_versions(tables) -> dict:
+    """
+    테이블별 데이터 버전을 반환합니다. 적재기가 행을 바꿀 때마다 올리므로 다른 프로세스의 적재도 보입니다.
+    아직 마이그레이션 v5 전인 DB에서는 빈 dict를 반환합니다.
+    """
+    try:
+        rows = fetch_all("SELECT table_name, version FROM data_versions")
+    except sqlite3.OperationalError:
+        return {}
+    versions = {row["table_name"]: row["version"] for row in rows}
+    return {table: versions.get(table, 0) for table in tables}
+
+
+class DataVersionWatch:
+    """
+    메모리 인덱스가 만든 시점의 데이터 버전과 현재 버전을 비교합니다.
+    요청마다 DB를 읽지 않도록 DATA_VERSION_CHECK_SECONDS에 한 번만 실제로 확인합니다.
+    """
+
+    def __init__(self, tables, interval: float = DATA_VERSION_CHECK_SECONDS):
+        self.tables = tuple(tables)
+        self.interval = interval
+        self._checked_at = time.monotonic()
+
+    def snapshot(self) -> dict:
+        return get_data_versions(self.tables)
 
-    conn.commit()
-    conn.close()
-    print(f"Database '{db_path}' initialized with necessary tables.")
+    def due(self) -> bool:
+        return time.monotonic() - self._checked_at >= self.interval
+
+    def changed_since(self, versions: dict) -> bool:
+        """확인할 때가 되었고 versions 이후 데이터가 바뀌었으면 True."""
+        if not self.due():
+            return False
+        self._checked_at = time.monotonic()
+        return self.snapshot() != versions
+
+
+async def fetch_one_async(sql, params=()):
+    return await run_read(fetch_one, sql, params)
+
+
+async def fetch_all_async(sql, params=()):
+    return await run_read(fetch_all, sql, params)
+
+def migrate_db():
+    """tour.db에 아직 적용되지 않은 스키마 마이그레이션(테이블, 인덱스, R*Tree)을 적용합니다."""
+    # Imported here because migrations.py reads TABLE_COLUMNS_MAP from this module
+    from src.infrastructure.persistence.migrations import migrate
+
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        # WAL is persistent in the file; readers no longer block on the loader's writes
+        conn.execute("PRAGMA journal_mode = WAL")
+        version = migrate(conn)
+    finally:
+        conn.close()
+    print(f"Database '{db_path}' schema is at version {version}.")
+    return version
+
+def init_db():
+    """
+    스키마를 최신 버전으로 맞춘 뒤 CSV 데이터를 upsert 방식으로 적재합니다.
+    기존 DB 파일을 지우지 않으므로, 갱신 중에도 다른 프로세스가 계속 읽을 수 있습니다.
+    """
+    print(f"Attempting to initialize database at: {db_path}")
+    migrate_db()
 
     # Load data after creating tables
     print("Calling load_data_to_db()...\n")
@@ -118,11 +207,108 @@ def init_db():
     print("\nload_data_to_db() finished.")
 
 
+def _normalize_key_value(value):
+    """CSV(float로 읽힌 정수 포함)와 DB 값이 같은 키로 비교되도록 문자열로 맞춥니다."""
+    if value is None:
+        return None
+    if isinstance(value, float):
+        if value != value:  # NaN
+            return None
+        if value.is_integer():
+            value = int(value)
+    text = str(value).strip()
+    if text.endswith(".0") and text[:-2].isdigit():
+        text = text[:-2]
+    return text
+
+
+def _upsert_dataframe(conn, table_name, df):
+    """
+    contentid(courses는 contentid+subnum) 기준으로 행을 upsert합니다.
+    이미 있는 행은 CSV의 modifiedtime이 더 최신일 때만 갱신합니다.
+    """
+    key_columns = TABLE_UPSERT_KEYS[table_name]
+    missing = [col for col in key_columns if col not in df.columns]
+    if missing:
+        print(f"Error: '{table_name}' data has no key column(s) {missing}; skipping.")
+        return 0
+
+    columns = list(df.columns)
+    has_modifiedtime = "modifiedtime" in columns
+
+    existing = {}
+    select_cols = ", ".join(key_columns) + (", modifiedtime" if has_modifiedtime else "")
+    for row in conn.execute(f"SELECT id, {select_cols} FROM {table_name}"):
+        key = tuple(_normalize_key_value(v) for v in row[1:1 + len(key_columns)])
+        modified = _normalize_key_value(row[-1]) if has_modifiedtime else None
+        existing[key] = (row[0], modified)
+
+    # NaN -> None so missing CSV cells are stored as NULL
+    records = df.astype(object).where(pd.notna(df), None).to_dict("records")
+
+    latest = {}
+    for record in records:
+        key = tuple(_normalize_key_value(record[col]) for col in key_columns)
+        if key[0] is None:
+            continue
+        latest[key] = record  # later rows in the CSV win
+
+    inserts, updates, unchanged = [], [], 0
+    for key, record in latest.items():
+        values = [record[col] for col in columns]
+        if key not in existing:
+            inserts.append(values)
+            continue
+        row_id, old_modified = existing[key]
+        new_modified = _normalize_key_value(record["modifiedtime"]) if has_modifiedtime else None
+        if has_modifiedtime and old_modified is not None and new_modified is not None and new_modified <= old_modified:
+            unchanged += 1
+            continue
+        updates.append(values + [row_id])
+
+    placeholders = ", ".join("?" for _ in columns)
+    assignments = ", ".join(f"{col} = ?" for col in columns)
+    with conn:
+        conn.executemany(
+            f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})", inserts
+        )
+        conn.executemany(f"UPDATE {table_name} SET {assignments} WHERE id = ?", updates)
+        if inserts or updates:
+            # Same transaction as the rows, so a reader never sees new rows under the old version
+            conn.execute(
+                "INSERT INTO data_versions (table_name, version, updated_at) VALUES (?, 1, ?) "
+                "ON CONFLICT(table_name) DO UPDATE SET version = version + 1, updated_at = excluded.updated_at",
+                (table_name, time.time()),
+            )
+    print(f"Upserted '{table_name}': {len(inserts)} inserted, {len(updates)} updated, {unchanged} unchanged.")
+    return len(inserts) + len(updates)
+
+
+def invalidate_indexes(changed_tables: set):
+    """
+    적재로 내용이 바뀐 테이블을 읽는 메모리 인덱스를 바로 비워, 다음 조회에서 새로 만들도록 합니다.
+    같은 프로세스 안의 적재용이며, 다른 프로세스의 적재는 인덱스가 data_versions로 알아챕니다.
+    """
+    # Imported here because the application-layer indexes import this module
+    if "festivals" in changed_tables:
+        from src.application.services.festival_catalog import invalidate_festival_catalog
+
+        invalidate_festival_catalog()
+        print("[Database] Festival catalog index invalidated.")
+    # The nearby-search index holds facilities, courses and festivals
+    if changed_tables & set(TABLE_COLUMNS_MAP):
+        from src.application.services.spatial_index import invalidate_spatial_index
+
+        invalidate_spatial_index()
+        print("[Database] Spatial index invalidated.")
+
+
 # Function to load excel data into sqlite
 def load_data_to_db():
     print(f"Attempting to load data into database at: {db_path}")
     conn = sqlite3.connect(db_path)
     print(f"Connected to database for data loading: {db_path}")
+    changed_tables = set()
 
     try:
         # Process each excel file
@@ -132,19 +318,15 @@ def load_data_to_db():
                 # Read csv file into a pandas DataFrame with specified encoding
                 df = pd.read_csv(file_path, encoding='cp949') # Added encoding
                 print(f"DataFrame for '{table_name}' has {len(df)} rows and {len(df.columns)} columns.")
-                
+
                 # 테이블 스키마에 정의된 컬럼만 선택
-                if table_name in TABLE_COLUMNS_MAP:
-                    schema_columns = TABLE_COLUMNS_MAP[table_name]
-                    # DataFrame에 실제로 존재하는 컬럼만 필터링
-                    df_filtered = df[[col for col in schema_columns if col in df.columns]]
-                    print(f"Filtered DataFrame for '{table_name}' has {len(df_filtered)} rows and {len(df_filtered.columns)} columns (after schema filtering).")
-                else:
-                    df_filtered = df # 스키마 정의가 없으면 필터링하지 않음
-
-                # Write the DataFrame to the sqlite database
-                df_filtered.to_sql(table_name, conn, if_exists='append', index=False) # Changed to 'append'
-                print(f"Successfully loaded {len(df_filtered)} rows into '{table_name}' table.")
+                schema_columns = TABLE_COLUMNS_MAP[table_name]
+                # DataFrame에 실제로 존재하는 컬럼만 필터링
+                df_filtered = df[[col for col in schema_columns if col in df.columns]]
+                print(f"Filtered DataFrame for '{table_name}' has {len(df_filtered)} rows and {len(df_filtered.columns)} columns (after schema filtering).")
+
+                if _upsert_dataframe(conn, table_name, df_filtered):
+                    changed_tables.add(table_name)
             else:
                 print(f"Error: File not found at {file_path}")
 
@@ -154,6 +336,7 @@ def load_data_to_db():
         # Close the database connection
         conn.close()
         print("Database connection closed after data loading.")
+        invalidate_indexes(changed_tables)
 
 if __name__ == "__main__":
     init_db() # Call init_db to create tables and load data
@@ -0,0 +1,167 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, List, Optional
+
+from src.infrastructure.config.settings import get_cache_dir
+
+# 끝난 작업(결과 포함)을 보관하는 기간
+JOB_RETENTION_SECONDS = float(os.getenv("JOB_RETENTION_SECONDS", str(24 * 3600)))
+
+JOB_STORE_FILE_NAME = "jobs.sqlite3"
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+FINISHED_STATUSES = (SUCCEEDED, FAILED)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class JobStore:
+    """
+    백그라운드 작업의 상태, 진행률, 결과를 캐시 폴더의 SQLite 파일(WAL)에 저장합니다.
+
+    - 작업을 제출한 워커 프로세스가 실행하고, 상태/결과는 어느 워커 프로세스에서나 조회할 수 있습니다.
+    - 결과는 JSON으로 저장하며, 끝난 작업은 JOB_RETENTION_SECONDS가 지나면 삭제합니다.
+    - 실행하던 프로세스가 사라진 작업은 recover_interrupted()로 실패 처리합니다.
+    """
+
+    def __init__(self, path: Optional[str] = None, retention_seconds: float = JOB_RETENTION_SECONDS):
+        self.path = path or os.path.join(get_cache_dir(), JOB_STORE_FILE_NAME)
+        self.retention_seconds = retention_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                status TEXT NOT NULL,
+                progress REAL NOT NULL DEFAULT 0,
+                message TEXT,
+                params TEXT NOT NULL,
+                result TEXT,
+                error TEXT,
+                owner_pid INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                started_at REAL,
+                finished_at REAL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, finished_at)")
+        self._conn.commit()
+
+    def create(self, kind: str, params: dict) -> str:
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, kind, status, params, owner_pid, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, kind, QUEUED, json.dumps(params, ensure_ascii=False, default=str), os.getpid(), now),
+            )
+            self._conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+                (*FINISHED_STATUSES, now - self.retention_seconds),
+            )
+            self._conn.commit()
+        return job_id
+
+    def mark_running(self, job_id: str):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, started_at = ? WHERE id = ?",
+                (RUNNING, time.time(), job_id),
+            )
+            self._conn.commit()
+
+    def update_progress(self, job_id: str, progress: float, message: Optional[str] = None):
+        # Only while running, so a late progress write never overwrites a finished job
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET progress = ?, message = COALESCE(?, message) WHERE id = ? AND status = ?",
+                (progress, message, job_id, RUNNING),
+            )
+            self._conn.commit()
+
+    def complete(self, job_id: str, result: Any):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, progress = 1.0, result = ?, finished_at = ? WHERE id = ?",
+                (SUCCEEDED, json.dumps(result, ensure_ascii=False, default=str), time.time(), job_id),
+            )
+            self._conn.commit()
+
+    def fail(self, job_id: str, error: str):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                (FAILED, error, time.time(), job_id),
+            )
+            self._conn.commit()
+
+    def get(self, job_id: str, include_result: bool = False) -> Optional[dict]:
+        """작업 상태를 dict로 반환합니다 (없으면 None). include_result=True면 result도 디코딩해 포함합니다."""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = {
+            "job_id": row["id"],
+            "kind": row["kind"],
+            "status": row["status"],
+            "progress": round(row["progress"], 4),
+            "message": row["message"],
+            "error": row["error"],
+            "params": json.loads(row["params"]),
+            "created_at": row["created_at"],
+            "started_at": row["started_at"],
+            "finished_at": row["finished_at"],
+        }
+        if include_result:
+            job["result"] = json.loads(row["result"]) if row["result"] is not None else None
+        return job
+
+    def recover_interrupted(self) -> List[str]:
+        """실행 중이던 프로세스가 더 이상 없는 대기/실행 작업을 실패로 표시하고, 그 작업 ID 목록을 반환합니다."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, owner_pid FROM jobs WHERE status IN (?, ?)", (QUEUED, RUNNING)
+            ).fetchall()
+            orphaned = [
+                row["id"]
+                for row in rows
+                if row["owner_pid"] != os.getpid() and not _pid_alive(row["owner_pid"])
+            ]
+            if orphaned:
+                self._conn.executemany(
+                    "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                    [(FAILED, "서버 재시작으로 작업이 중단되었습니다.", time.time(), job_id) for job_id in orphaned],
+                )
+                self._conn.commit()
+        return orphaned
+
+    def stats(self) -> dict:
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        return {status: count for status, count in rows}
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
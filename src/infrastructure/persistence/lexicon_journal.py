@@ -0,0 +1,217 @@
+import csv
+import io
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 학습 항목을 모아 한 번에 기록하는 기준 (개수 / 최대 대기 시간)
+LEXICON_FLUSH_BATCH = int(os.getenv("LEXICON_FLUSH_BATCH", "32"))
+LEXICON_FLUSH_INTERVAL_SECONDS = float(os.getenv("LEXICON_FLUSH_INTERVAL_SECONDS", "2"))
+# 저널 내용을 CSV 사전 파일에 합치는 주기
+LEXICON_COMPACT_INTERVAL_SECONDS = float(os.getenv("LEXICON_COMPACT_INTERVAL_SECONDS", "600"))
+# CSV에 반영된 저널 항목을 보관하는 기간 (재시작한 다른 프로세스가 따라잡을 수 있도록 잠시 남겨 둠)
+LEXICON_JOURNAL_RETENTION_SECONDS = float(os.getenv("LEXICON_JOURNAL_RETENTION_SECONDS", str(7 * 24 * 3600)))
+
+JOURNAL_FILE_NAME = "learned_journal.sqlite3"
+
+# (사전 파일명, 표현, 점수)
+LearnedEntry = Tuple[str, str, float]
+
+
+def _csv_line(phrase: str, score: float) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="").writerow([phrase, score])
+    return buffer.getvalue()
+
+
+class LexiconJournal:
+    """
+    LLM이 새로 학습한 사전 항목을 CSV에 바로 쓰지 않고, 사전 폴더의 SQLite 저널(append-only)에 모아 두는 write-behind 저장소.
+
+    - record()는 메모리 버퍼에만 추가하고, 이미 저널에 있는 (파일, 표현, 점수)의 반복 학습은 버립니다.
+    - 버퍼는 LEXICON_FLUSH_BATCH 개가 모이거나 LEXICON_FLUSH_INTERVAL_SECONDS가 지나면 한 트랜잭션으로 기록됩니다.
+    - 다른 워커 프로세스가 기록한 항목도 sync()로 읽어 와 on_entries 콜백으로 전달합니다.
+    - compact()는 아직 반영되지 않은 항목을 CSV 파일에 원자적으로(임시 파일 → 교체) 합칩니다.
+      SQLite 쓰기 잠금 안에서 처리하므로 여러 프로세스가 동시에 실행해도 CSV가 깨지지 않습니다.
+    """
+
+    def __init__(self, dic_path: str, on_entries: Optional[Callable[[List[LearnedEntry]], None]] = None):
+        self.dic_path = dic_path
+        self.path = os.path.join(dic_path, JOURNAL_FILE_NAME)
+        self.on_entries = on_entries
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self._pending: Dict[LearnedEntry, None] = {}
+        # Entries already in the journal (written here or synced from other processes)
+        self._seen: set = set()
+        self._last_seq = 0
+        self._last_compact = time.monotonic()
+        self._stop = threading.Event()
+
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS learned_entries (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                file_name TEXT NOT NULL,
+                phrase TEXT NOT NULL,
+                score REAL NOT NULL,
+                learned_at REAL NOT NULL,
+                compacted INTEGER NOT NULL DEFAULT 0
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_learned_entries_compacted ON learned_entries (compacted, seq)"
+        )
+
+        self._flusher = threading.Thread(target=self._run_flusher, name="lexicon-journal", daemon=True)
+        self._flusher.start()
+
+    def record(self, file_name: str, phrase: str, score: float):
+        """학습 항목을 버퍼에 추가합니다. 버퍼가 가득 차면 바로 기록합니다."""
+        entry = (file_name, phrase, float(score))
+        with self._lock:
+            if entry in self._seen:
+                return
+            self._pending[entry] = None
+            should_flush = len(self._pending) >= LEXICON_FLUSH_BATCH
+        if should_flush:
+            self.flush()
+
+    def flush(self):
+        """버퍼의 항목을 하나의 트랜잭션으로 저널에 기록합니다."""
+        with self._lock:
+            entries = list(self._pending)
+            self._pending.clear()
+            self._seen.update(entries)
+        if not entries:
+            return
+        now = time.time()
+        with self._db_lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                self._conn.executemany(
+                    "INSERT INTO learned_entries (file_name, phrase, score, learned_at) VALUES (?, ?, ?, ?)",
+                    [(file_name, phrase, score, now) for file_name, phrase, score in entries],
+                )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error as e:
+                if self._conn.in_transaction:
+                    self._conn.execute("ROLLBACK")
+                print(f"[LexiconJournal] 기록 실패, 다음 주기에 다시 시도합니다: {e}")
+                with self._lock:
+                    self._seen.difference_update(entries)
+                    for entry in entries:
+                        self._pending.setdefault(entry, None)
+
+    def sync(self) -> int:
+        """아직 반영하지 않은 저널 항목(다른 프로세스 기록 포함)을 읽어 on_entries로 전달합니다."""
+        with self._db_lock:
+            rows = self._conn.execute(
+                "SELECT seq, file_name, phrase, score FROM learned_entries WHERE seq > ? ORDER BY seq",
+                (self._last_seq,),
+            ).fetchall()
+            if rows:
+                self._last_seq = rows[-1][0]
+        with self._lock:
+            self._seen.update((file_name, phrase, score) for _, file_name, phrase, score in rows)
+        if rows and self.on_entries is not None:
+            self.on_entries([(file_name, phrase, score) for _, file_name, phrase, score in rows])
+        return len(rows)
+
+    def compact(self) -> int:
+        """CSV에 아직 합쳐지지 않은 저널 항목을 사전 파일에 반영하고, 반영한 항목 수를 반환합니다."""
+        with self._db_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                rows = self._conn.execute(
+                    "SELECT seq, file_name, phrase, score FROM learned_entries WHERE compacted = 0 ORDER BY seq"
+                ).fetchall()
+                by_file: Dict[str, List[Tuple[str, float]]] = {}
+                for _, file_name, phrase, score in rows:
+                    by_file.setdefault(file_name, []).append((phrase, score))
+                for file_name, entries in by_file.items():
+                    self._merge_into_csv(file_name, entries)
+                if rows:
+                    self._conn.execute(
+                        "UPDATE learned_entries SET compacted = 1 WHERE compacted = 0 AND seq <= ?",
+                        (rows[-1][0],),
+                    )
+                self._conn.execute(
+                    "DELETE FROM learned_entries WHERE compacted = 1 AND learned_at < ?",
+                    (time.time() - LEXICON_JOURNAL_RETENTION_SECONDS,),
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        if rows:
+            print(f"[LexiconJournal] {len(rows)}개 학습 항목을 사전 파일에 반영했습니다.")
+        return len(rows)
+
+    def _merge_into_csv(self, file_name: str, entries: List[Tuple[str, float]]):
+        csv_path = os.path.join(self.dic_path, file_name)
+        existing_text = ""
+        if os.path.exists(csv_path):
+            with open(csv_path, "r", encoding="utf-8") as f:
+                existing_text = f.read()
+
+        # A crash between the CSV swap and the journal update leaves rows to redo; skip pairs already present
+        existing = set()
+        for row in csv.reader(io.StringIO(existing_text)):
+            if len(row) >= 2:
+                try:
+                    existing.add((row[0], float(row[1])))
+                except ValueError:
+                    continue
+        new_lines = []
+        for phrase, score in entries:
+            if (phrase, score) not in existing:
+                existing.add((phrase, score))
+                new_lines.append(_csv_line(phrase, score))
+        if not new_lines:
+            return
+
+        tmp_path = f"{csv_path}.tmp{os.getpid()}"
+        with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+            f.write(existing_text.rstrip("\n"))
+            for line in new_lines:
+                f.write(f"\n{line}")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, csv_path)
+
+    def _run_flusher(self):
+        while not self._stop.wait(LEXICON_FLUSH_INTERVAL_SECONDS):
+            try:
+                self.flush()
+                self.sync()
+                if time.monotonic() - self._last_compact >= LEXICON_COMPACT_INTERVAL_SECONDS:
+                    self._last_compact = time.monotonic()
+                    self.compact()
+            except Exception as e:
+                print(f"[LexiconJournal] 백그라운드 처리 오류: {e}")
+
+    def close(self):
+        """버퍼를 비우고 CSV에 반영한 뒤 백그라운드 스레드를 멈춥니다."""
+        self._stop.set()
+        self._flusher.join(timeout=LEXICON_FLUSH_INTERVAL_SECONDS + 1)
+        self.flush()
+        try:
+            self.compact()
+        except sqlite3.Error as e:
+            print(f"[LexiconJournal] 종료 시 사전 반영 실패 (다음 실행 때 반영됩니다): {e}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            pending = len(self._pending)
+        with self._db_lock:
+            total, uncompacted = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(compacted = 0), 0) FROM learned_entries"
+            ).fetchone()
+        return {"pending": pending, "journal_entries": total, "uncompacted": uncompacted}
@@ -0,0 +1,246 @@
+import sqlite3
+
+# tour.db 스키마 마이그레이션.
+# PRAGMA user_version에 마지막으로 적용된 버전을 기록하고, 그보다 새로운 단계만 순서대로 적용합니다.
+# 기존 DB(버전 0)도 CREATE ... IF NOT EXISTS 덕분에 그대로 이어서 마이그레이션됩니다.
+
+INTEGER_COLUMNS = ['areacode', 'mlevel', 'sigungucode']
+REAL_COLUMNS = ['mapx', 'mapy']
+
+SPATIAL_TABLES = ["festivals", "facilities", "courses"]
+
+
+class MigrationSkipped(Exception):
+    """현재 SQLite 빌드가 지원하지 않아 건너뛴 마이그레이션. 기록해 두고 다음 migrate()에서 다시 시도합니다."""
+
+
+def _column_definitions(columns):
+    definitions = []
+    for col in columns:
+        if col in INTEGER_COLUMNS:
+            definitions.append(f"{col} INTEGER")
+        elif col in REAL_COLUMNS:
+            definitions.append(f"{col} REAL")
+        else:
+            definitions.append(f"{col} TEXT")
+    return ", ".join(definitions)
+
+
+def _create_base_tables(conn: sqlite3.Connection):
+    # Imported here because database.py imports this module to run migrations
+    from src.infrastructure.persistence.database import TABLE_COLUMNS_MAP
+
+    for table_name, columns in TABLE_COLUMNS_MAP.items():
+        conn.execute(f'''
+            CREATE TABLE IF NOT EXISTS {table_name} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                {_column_definitions(columns)}
+            )
+        ''')
+
+
+def _create_lookup_indexes(conn: sqlite3.Connection):
+    statements = [
+        # 상세 조회 (WHERE title = ?)
+        "CREATE INDEX IF NOT EXISTS idx_festivals_title ON festivals(title)",
+        "CREATE INDEX IF NOT EXISTS idx_facilities_title ON facilities(title)",
+        "CREATE INDEX IF NOT EXISTS idx_courses_title ON courses(title)",
+        # contentid 조회 및 upsert 키
+        "CREATE INDEX IF NOT EXISTS idx_festivals_contentid ON festivals(contentid)",
+        "CREATE INDEX IF NOT EXISTS idx_facilities_contentid ON facilities(contentid)",
+        "CREATE INDEX IF NOT EXISTS idx_courses_contentid_subnum ON courses(contentid, subnum)",
+        # 지역 필터
+        "CREATE INDEX IF NOT EXISTS idx_festivals_area ON festivals(areacode, sigungucode)",
+        "CREATE INDEX IF NOT EXISTS idx_facilities_area ON facilities(areacode, sigungucode)",
+        "CREATE INDEX IF NOT EXISTS idx_courses_area ON courses(areacode, sigungucode)",
+    ]
+    for statement in statements:
+        conn.execute(statement)
+
+
+def _normalized_lon_sql(prefix=""):
+    """mapx/mapy가 뒤바뀐 행을 교정한 경도 SQL 식 (nearby 검색과 같은 규칙)."""
+    x, y = f"{prefix}mapx", f"{prefix}mapy"
+    return (
+        f"CASE WHEN NOT ({x} > 124 AND {x} < 132 AND {y} > 33 AND {y} < 39) "
+        f"AND ({y} > 124 AND {y} < 132 AND {x} > 33 AND {x} < 39) THEN {y} ELSE {x} END"
+    )
+
+
+def _normalized_lat_sql(prefix=""):
+    x, y = f"{prefix}mapx", f"{prefix}mapy"
+    return (
+        f"CASE WHEN NOT ({x} > 124 AND {x} < 132 AND {y} > 33 AND {y} < 39) "
+        f"AND ({y} > 124 AND {y} < 132 AND {x} > 33 AND {x} < 39) THEN {x} ELSE {y} END"
+    )
+
+
+def _create_rtree_tables(conn: sqlite3.Connection):
+    """
+    각 테이블의 좌표를 R*Tree 가상 테이블({table}_rtree)로 색인하고,
+    트리거로 원본 테이블과 동기화합니다. rtree 모듈이 없는 SQLite 빌드에서는 건너뛰고,
+    rtree를 지원하는 SQLite로 실행될 때 다시 적용됩니다.
+    """
+    try:
+        for table in SPATIAL_TABLES:
+            rtree = f"{table}_rtree"
+            conn.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {rtree} USING rtree(id, min_lon, max_lon, min_lat, max_lat)"
+            )
+            conn.execute(f'''
+                INSERT OR REPLACE INTO {rtree} (id, min_lon, max_lon, min_lat, max_lat)
+                SELECT id, lon, lon, lat, lat FROM (
+                    SELECT id, {_normalized_lon_sql()} AS lon, {_normalized_lat_sql()} AS lat
+                    FROM {table} WHERE mapx IS NOT NULL AND mapy IS NOT NULL
+                )
+            ''')
+
+            lon, lat = _normalized_lon_sql("NEW."), _normalized_lat_sql("NEW.")
+            conn.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {rtree}_insert AFTER INSERT ON {table}
+                WHEN NEW.mapx IS NOT NULL AND NEW.mapy IS NOT NULL
+                BEGIN
+                    INSERT OR REPLACE INTO {rtree} VALUES (NEW.id, {lon}, {lon}, {lat}, {lat});
+                END
+            ''')
+            conn.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {rtree}_update AFTER UPDATE OF mapx, mapy ON {table}
+                BEGIN
+                    DELETE FROM {rtree} WHERE id = OLD.id;
+                    INSERT INTO {rtree}
+                    SELECT NEW.id, {lon}, {lon}, {lat}, {lat}
+                    WHERE NEW.mapx IS NOT NULL AND NEW.mapy IS NOT NULL;
+                END
+            ''')
+            conn.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {rtree}_delete AFTER DELETE ON {table}
+                BEGIN
+                    DELETE FROM {rtree} WHERE id = OLD.id;
+                END
+            ''')
+    except sqlite3.OperationalError as e:
+        if "rtree" not in str(e):
+            raise
+        raise MigrationSkipped(f"SQLite rtree module unavailable ({e})") from e
+
+
+def _create_precomputed_tables(conn: sqlite3.Connection):
+    """
+    오프라인 사전 계산 결과 테이블.
+    - precomputed_results: (종류, 축제, 파라미터)별 결과 JSON과 신선도 정보
+      (계산 시각, 만료 시각, 계산 당시 축제 데이터의 modifiedtime)
+    - precompute_runs: 사전 계산 실행 기록
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS precomputed_results (
+            kind TEXT NOT NULL,
+            festival_title TEXT NOT NULL,
+            params TEXT NOT NULL,
+            result TEXT NOT NULL,
+            festival_modifiedtime TEXT,
+            computed_at REAL NOT NULL,
+            expires_at REAL NOT NULL,
+            duration_seconds REAL,
+            PRIMARY KEY (kind, festival_title, params)
+        )
+    ''')
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_precomputed_results_expiry ON precomputed_results(kind, expires_at)"
+    )
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS precompute_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            kinds TEXT NOT NULL,
+            started_at REAL NOT NULL,
+            finished_at REAL,
+            festivals INTEGER NOT NULL DEFAULT 0,
+            computed INTEGER NOT NULL DEFAULT 0,
+            fresh INTEGER NOT NULL DEFAULT 0,
+            failed INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+
+
+def _create_data_versions_table(conn: sqlite3.Connection):
+    """
+    테이블별 데이터 버전. 적재기(load_data_to_db)가 행을 바꿀 때마다 같은 트랜잭션에서 1씩 올리므로,
+    다른 프로세스에서 적재해도 서버의 메모리 인덱스가 바뀐 것을 알아채고 다시 만듭니다.
+    """
+    from src.infrastructure.persistence.database import TABLE_COLUMNS_MAP
+
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS data_versions (
+            table_name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0,
+            updated_at REAL
+        )
+    ''')
+    conn.executemany(
+        "INSERT OR IGNORE INTO data_versions (table_name, version) VALUES (?, 0)",
+        [(table,) for table in TABLE_COLUMNS_MAP],
+    )
+
+
+MIGRATIONS = [
+    (1, "create base tables", _create_base_tables),
+    (2, "add lookup indexes", _create_lookup_indexes),
+    (3, "add R*Tree coordinate index", _create_rtree_tables),
+    (4, "add precomputed analysis result tables", _create_precomputed_tables),
+    (5, "add per-table data versions", _create_data_versions_table),
+]
+
+LATEST_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def get_skipped_versions(conn: sqlite3.Connection) -> set:
+    return {row[0] for row in conn.execute("SELECT version FROM schema_skipped_migrations")}
+
+
+def migrate(conn: sqlite3.Connection) -> int:
+    """
+    적용되지 않은 마이그레이션을 순서대로 실행하고, 최종 스키마 버전을 반환합니다.
+    MigrationSkipped로 건너뛴 단계는 schema_skipped_migrations에 기록해 두었다가 매번 다시 시도합니다.
+    """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS schema_skipped_migrations (
+            version INTEGER PRIMARY KEY,
+            reason TEXT NOT NULL,
+            skipped_at REAL NOT NULL
+        )
+    ''')
+    current = get_schema_version(conn)
+    skipped = get_skipped_versions(conn)
+    for version, description, apply in MIGRATIONS:
+        retry = version in skipped
+        if version <= current and not retry:
+            continue
+        print(f"[Migrations] {'Retrying skipped' if retry else 'Applying'} v{version}: {description}")
+        try:
+            conn.execute("BEGIN")
+            apply(conn)
+            conn.execute("DELETE FROM schema_skipped_migrations WHERE version = ?", (version,))
+            if version > current:
+                conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except MigrationSkipped as e:
+            conn.rollback()
+            print(f"[Migrations] Warning: skipping v{version} ({e}); it will be retried on the next migration run")
+            # Later steps do not depend on a skippable one, so the schema version still moves on
+            conn.execute("BEGIN")
+            conn.execute(
+                "INSERT OR REPLACE INTO schema_skipped_migrations (version, reason, skipped_at) "
+                "VALUES (?, ?, strftime('%s', 'now'))",
+                (version, str(e)),
+            )
+            if version > current:
+                conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        current = max(current, version)
+    return current
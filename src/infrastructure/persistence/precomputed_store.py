@@ -0,0 +1,129 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Optional
+
+from src.infrastructure.persistence.database import db_path, fetch_all, fetch_one
+
+
+def _json_default(value):
+    # numpy scalars (pandas means, np.float64 scores) -> plain Python numbers
+    if hasattr(value, "item"):
+        return value.item()
+    return str(value)
+
+
+def params_key(params: Optional[dict]) -> str:
+    """파라미터 dict를 결과 테이블의 키로 쓰는 정규화된 JSON 문자열로 바꿉니다."""
+    return json.dumps(params or {}, sort_keys=True, ensure_ascii=False, default=_json_default)
+
+
+class PrecomputedStore:
+    """
+    tour.db의 precomputed_results / precompute_runs 테이블(마이그레이션 v4)에 사전 계산 결과를 읽고 씁니다.
+
+    - 조회는 요청 처리용 읽기 전용 커넥션(fetch_one)을 그대로 사용합니다.
+    - 쓰기는 이 저장소의 커넥션 하나로만 하며, WAL 모드라서 읽기를 막지 않습니다.
+    """
+
+    def __init__(self, path: str = db_path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _write_connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute("PRAGMA synchronous = NORMAL")
+            self._conn = conn
+        return self._conn
+
+    def get(self, kind: str, festival_title: str, params: Optional[dict] = None) -> Optional[dict]:
+        """저장된 결과와 신선도 정보를 반환합니다 (없으면 None). 신선한지 판단은 호출자가 합니다."""
+        row = fetch_one(
+            "SELECT result, festival_modifiedtime, computed_at, expires_at, duration_seconds "
+            "FROM precomputed_results WHERE kind = ? AND festival_title = ? AND params = ?",
+            (kind, festival_title, params_key(params)),
+        )
+        if row is None:
+            return None
+        row["result"] = json.loads(row["result"])
+        return row
+
+    def freshness(self, kind: str, params: Optional[dict] = None) -> Dict[str, dict]:
+        """축제별 (계산 시각, 만료 시각, modifiedtime) - 일괄 사전 계산에서 신선한 항목을 건너뛰는 데 사용합니다."""
+        rows = fetch_all(
+            "SELECT festival_title, festival_modifiedtime, computed_at, expires_at "
+            "FROM precomputed_results WHERE kind = ? AND params = ?",
+            (kind, params_key(params)),
+        )
+        return {row.pop("festival_title"): row for row in rows}
+
+    def put(
+        self,
+        kind: str,
+        festival_title: str,
+        params: Optional[dict],
+        result: Any,
+        ttl_seconds: float,
+        festival_modifiedtime: Optional[str] = None,
+        duration_seconds: Optional[float] = None,
+    ):
+        now = time.time()
+        payload = json.dumps(result, ensure_ascii=False, default=_json_default)
+        with self._lock:
+            self._write_connection().execute(
+                "INSERT OR REPLACE INTO precomputed_results "
+                "(kind, festival_title, params, result, festival_modifiedtime, computed_at, expires_at, duration_seconds) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    kind,
+                    festival_title,
+                    params_key(params),
+                    payload,
+                    festival_modifiedtime,
+                    now,
+                    now + ttl_seconds,
+                    duration_seconds,
+                ),
+            )
+
+    def start_run(self, kinds: Iterable[str]) -> int:
+        with self._lock:
+            cursor = self._write_connection().execute(
+                "INSERT INTO precompute_runs (kinds, started_at) VALUES (?, ?)",
+                (",".join(kinds), time.time()),
+            )
+            return cursor.lastrowid
+
+    def finish_run(self, run_id: int, festivals: int, computed: int, fresh: int, failed: int):
+        with self._lock:
+            self._write_connection().execute(
+                "UPDATE precompute_runs SET finished_at = ?, festivals = ?, computed = ?, fresh = ?, failed = ? "
+                "WHERE id = ?",
+                (time.time(), festivals, computed, fresh, failed, run_id),
+            )
+
+    def stats(self) -> dict:
+        now = time.time()
+        by_kind = {
+            row["kind"]: {"entries": row["entries"], "expired": row["expired"]}
+            for row in fetch_all(
+                "SELECT kind, COUNT(*) AS entries, COALESCE(SUM(expires_at < ?), 0) AS expired "
+                "FROM precomputed_results GROUP BY kind",
+                (now,),
+            )
+        }
+        last_run = fetch_one(
+            "SELECT id, kinds, started_at, finished_at, festivals, computed, fresh, failed "
+            "FROM precompute_runs ORDER BY id DESC LIMIT 1"
+        )
+        return {"results": by_kind, "last_run": last_run}
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,259 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from typing import Optional, Tuple
+
+from matplotlib.figure import Figure
+
+from src.infrastructure.reporting.charts import (
+    create_absolute_score_line_chart,
+    create_donut_chart,
+    create_outlier_boxplot,
+    create_satisfaction_level_bar_chart,
+    create_sentence_score_bar_chart,
+    create_stacked_bar_chart,
+)
+from src.infrastructure.reporting.wordclouds import aspect_word_frequencies, render_wordcloud_png
+
+# 차트/워드클라우드를 그리는 프로세스 수 (0이면 프로세스 대신 스레드에서 그림)
+CHART_RENDER_WORKERS = int(os.getenv("CHART_RENDER_WORKERS", "2"))
+
+# 렌더링 가능한 차트 종류 -> charts.py의 Figure 생성 함수
+CHARTS = {
+    "donut": create_donut_chart,
+    "stacked_bar": create_stacked_bar_chart,
+    "sentence_scores": create_sentence_score_bar_chart,
+    "satisfaction": create_satisfaction_level_bar_chart,
+    "absolute_scores": create_absolute_score_line_chart,
+    "outliers": create_outlier_boxplot,
+}
+
+
+def figure_to_png(fig: Figure) -> bytes:
+    buf = BytesIO()
+    fig.savefig(buf, format="png", bbox_inches="tight")
+    # Drop the artists right away instead of waiting for the figure to be garbage collected
+    fig.clear()
+    return buf.getvalue()
+
+
+def render_chart_png(kind: str, *args) -> Optional[bytes]:
+    """차트를 그려 PNG 바이트로 반환합니다 (그릴 데이터가 없으면 None). 렌더링 프로세스에서 실행됩니다."""
+    fig = CHARTS[kind](*args)
+    if fig is None:
+        return None
+    return figure_to_png(fig)
+
+
+def _warm_up(_) -> int:
+    time.sleep(0.05)
+    return os.getpid()
+
+
+def _mp_context(allow_fork: bool = False):
+    methods = multiprocessing.get_all_start_methods()
+    # fork: workers inherit the already-imported matplotlib/wordcloud modules and font settings.
+    # Only safe while this process has a single thread; a child forked while another thread holds
+    # a lock (lexicon journal flusher, executor threads, the JVM, Playwright) can deadlock.
+    if allow_fork and "fork" in methods and threading.active_count() == 1:
+        return multiprocessing.get_context("fork")
+    if "forkserver" in methods:
+        context = multiprocessing.get_context("forkserver")
+        # The fork server (a fresh single-threaded process) imports __main__ and the chart modules once,
+        # so the workers forked from it do not re-import them each
+        context.set_forkserver_preload(["__main__", "src.infrastructure.reporting.chart_renderer"])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+class ChartRenderer:
+    """
+    차트와 워드클라우드를 이벤트 루프 밖(프로세스 풀)에서 그려 PNG 바이트로 돌려주는 렌더러.
+
+    - 요청 처리 코드는 Figure 객체를 받지 않고 PNG 바이트만 받으므로 닫지 않은 Figure가 남지 않습니다.
+    - matplotlib 렌더링은 GIL을 오래 잡는 CPU 작업이라, 별도 프로세스에서 그려 API 응답과 분석이 멈추지 않게 합니다.
+    - 워커 프로세스가 죽으면(BrokenProcessPool) 풀을 새로 만들어 한 번 다시 시도합니다.
+    - fork는 start()를 스레드가 하나뿐일 때(서버 시작 직후) 호출한 경우에만 씁니다.
+      그 밖에 만들어지는 풀(start() 없이 처음 렌더링할 때, 풀을 다시 만들 때)은 forkserver(없으면 spawn)로 띄웁니다.
+    """
+
+    def __init__(self, workers: int = CHART_RENDER_WORKERS):
+        self.workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.start_method: Optional[str] = None
+        self._lock = threading.Lock()
+        self.renders = 0
+        self.failures = 0
+        self.pool_restarts = 0
+        self.render_seconds = 0.0
+
+    def _get_executor(self, allow_fork: bool = False) -> Optional[ProcessPoolExecutor]:
+        if self.workers <= 0:
+            return None
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    context = _mp_context(allow_fork)
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=context)
+                    self.start_method = context.get_start_method()
+        return self._executor
+
+    def _reset_executor(self, broken: ProcessPoolExecutor):
+        with self._lock:
+            if self._executor is broken:
+                self._executor = None
+                self.pool_restarts += 1
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def start(self):
+        """
+        워커 프로세스를 미리 띄웁니다. 이벤트 루프 스레드에서 동기로, 다른 스레드가 생기기 전에
+        (서버 시작 시 가장 먼저) 호출해야 fork를 씁니다. 이미 스레드가 있으면 forkserver로 띄웁니다.
+        """
+        executor = self._get_executor(allow_fork=True)
+        if executor is None:
+            return
+        # With fork, the first submit starts every worker at once (before the executor's manager thread)
+        pids = set(executor.map(_warm_up, range(self.workers)))
+        print(f"[Charts] 차트 렌더링 프로세스 {len(pids)}개 시작 ({self.start_method})")
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        started = time.perf_counter()
+        try:
+            for attempt in range(2):
+                executor = self._get_executor()
+                try:
+                    result = await loop.run_in_executor(executor, func, *args)
+                    break
+                except BrokenProcessPool:
+                    if executor is None or attempt:
+                        raise
+                    print("[Charts] 렌더링 프로세스가 종료되어 풀을 다시 만듭니다.")
+                    self._reset_executor(executor)
+        except Exception:
+            self.failures += 1
+            raise
+        self.renders += 1
+        self.render_seconds += time.perf_counter() - started
+        return result
+
+    async def render_chart(self, kind: str, *args) -> Optional[bytes]:
+        """CHARTS의 차트 하나를 그려 PNG 바이트로 반환합니다 (그릴 데이터가 없으면 None)."""
+        if kind not in CHARTS:
+            raise ValueError(f"알 수 없는 차트 종류입니다: {kind}")
+        return await self._run(render_chart_png, kind, *args)
+
+    async def render_wordclouds(
+        self, aspect_sentiment_pairs: list, keyword: str, mask_path: Optional[str] = None
+    ) -> Tuple[Optional[bytes], Optional[bytes]]:
+        """긍정/부정 워드클라우드를 PNG 바이트로 반환합니다. 가중치 계산(사전 조회)은 이 프로세스에서 합니다."""
+        if not aspect_sentiment_pairs:
+            return None, None
+        positive_scores, negative_scores = aspect_word_frequencies(aspect_sentiment_pairs, keyword)
+        results = await asyncio.gather(
+            self._run(render_wordcloud_png, positive_scores, True, mask_path),
+            self._run(render_wordcloud_png, negative_scores, False, mask_path),
+            return_exceptions=True,
+        )
+        images = []
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"[WordCloud] Error during aspect-based WC generation: {result}")
+                result = None
+            images.append(result)
+        return images[0], images[1]
+
+    def stats(self) -> dict:
+        return {
+            "mode": "process" if self.workers > 0 else "thread",
+            "workers": max(self.workers, 0),
+            "start_method": self.start_method,
+            "renders": self.renders,
+            "failures": self.failures,
+            "pool_restarts": self.pool_restarts,
+            "avg_render_ms": round(self.render_seconds / self.renders * 1000, 1) if self.renders else 0.0,
+        }
+
+    def close(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+_chart_renderer: Optional[ChartRenderer] = None
+_chart_renderer_lock = threading.Lock()
+
+
+def get_chart_renderer() -> ChartRenderer:
+    global _chart_renderer
+    if _chart_renderer is None:
+        with _chart_renderer_lock:
+            if _chart_renderer is None:
+                _chart_renderer = ChartRenderer()
+    return _chart_renderer
+
+
+def close_chart_renderer():
+    global _chart_renderer
+    with _chart_renderer_lock:
+        renderer, _chart_renderer = _chart_renderer, None
+    if renderer is not None:
+        renderer.close()
+
+
+def _rss_mb() -> float:
+    # Current (not peak) resident set size; Linux only
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def run_memory_benchmark(renders: int = 3000, samples: int = 10):
+    """
+    모든 차트 종류를 번갈아 renders번 그리면서 이 프로세스의 RSS를 기록합니다.
+    Figure가 새면 RSS가 렌더링 횟수에 비례해 늘어나고, 새지 않으면 초기 워밍업 이후 평평하게 유지됩니다.
+    """
+    import random
+
+    rng = random.Random(0)
+    scores = [rng.uniform(-3, 3) for _ in range(200)]
+    judgments = [{"sentence": f"문장 {i} " * 5, "score": score} for i, score in enumerate(scores[:15])]
+    satisfaction = {"매우 불만족": 3, "불만족": 8, "보통": 20, "만족": 31, "매우 만족": 12}
+    specs = [
+        ("donut", 120, 40, "벤치마크"),
+        ("stacked_bar", 120, 40, "벤치마크"),
+        ("sentence_scores", judgments, "벤치마크"),
+        ("satisfaction", satisfaction, "벤치마크"),
+        ("absolute_scores", scores, "벤치마크"),
+        ("outliers", scores, "벤치마크"),
+    ]
+
+    interval = max(1, renders // samples)
+    baseline = None
+    print(f"{'renders':>8} {'rss_mb':>8} {'delta_mb':>9}")
+    for i in range(1, renders + 1):
+        kind, *args = specs[i % len(specs)]
+        render_chart_png(kind, *args)
+        if i == len(specs) * 5:
+            # Warm-up (font cache, glyph cache, allocator arenas) is done
+            baseline = _rss_mb()
+        if i % interval == 0 or i == renders:
+            rss = _rss_mb()
+            delta = rss - baseline if baseline is not None else 0.0
+            print(f"{i:>8} {rss:>8.1f} {delta:>+9.1f}")
+
+
+if __name__ == "__main__":
+    # python -m src.infrastructure.reporting.chart_renderer [renders]
+    import sys
+
+    run_memory_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 3000)
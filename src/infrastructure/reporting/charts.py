@@ -1,18 +1,22 @@
 import matplotlib
 matplotlib.use('Agg') # UI 백엔드가 없는 환경을 위한 설정
-import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.artist import setp
 from matplotlib.figure import Figure
 from matplotlib import font_manager, rc
 from matplotlib.ticker import MaxNLocator
 
+# 차트는 pyplot 없이 Figure 객체로만 만듭니다.
+# pyplot에 등록되지 않은 Figure는 참조가 사라지면 함께 해제되므로 닫는 것을 잊어도 새지 않고,
+# 전역 "현재 Figure" 상태를 쓰지 않아 여러 스레드/프로세스에서 동시에 그려도 서로 섞이지 않습니다.
+
 def setup_matplotlib_font():
     """한글 폰트를 설정합니다."""
     try:
         rc('font', family='Malgun Gothic')
     except:
         print("Malgun Gothic 폰트를 찾을 수 없습니다. 다른 한글 폰트로 설정해주세요.")
-    plt.rcParams['axes.unicode_minus'] = False # 마이너스 부호 깨짐 방지
+    matplotlib.rcParams['axes.unicode_minus'] = False # 마이너스 부호 깨짐 방지
 
 # 모듈 로드 시 폰트 설정
 setup_matplotlib_font()
@@ -25,7 +29,8 @@ def create_donut_chart(total_pos: int, total_neg: int, title: str) -> Figure | N
     pos_perc = (total_pos / total) * 100
     neg_perc = (total_neg / total) * 100
 
-    fig, ax = plt.subplots(figsize=(6, 4), subplot_kw=dict(aspect="equal"))
+    fig = Figure(figsize=(6, 4))
+    ax = fig.subplots(subplot_kw=dict(aspect="equal"))
 
     labels = ['긍정', '부정']
     sizes = [pos_perc, neg_perc]
@@ -42,10 +47,10 @@ def create_donut_chart(total_pos: int, total_neg: int, title: str) -> Figure | N
               loc="center left",
               bbox_to_anchor=(1, 0, 0.5, 1))
 
-    plt.setp(autotexts, size=10, weight="bold", color="white")
+    setp(autotexts, size=10, weight="bold", color="white")
     # 범례가 잘리지 않도록 오른쪽 여백을 조정합니다.
     fig.subplots_adjust(right=0.7)
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 def create_stacked_bar_chart(total_pos: int, total_neg: int, title: str, figsize=(6, 2.0)) -> Figure | None: # 높이를 약간 늘려 공간 확보
@@ -56,7 +61,8 @@ def create_stacked_bar_chart(total_pos: int, total_neg: int, title: str, figsize
     pos_perc = (total_pos / total) * 100
     neg_perc = (total_neg / total) * 100
 
-    fig, ax = plt.subplots(figsize=figsize)
+    fig = Figure(figsize=figsize)
+    ax = fig.subplots()
 
     labels = [title]
     pos_data = [pos_perc]
@@ -90,7 +96,8 @@ def create_sentence_score_bar_chart(judgments: list, title: str) -> Figure | Non
 
     # 차트의 높이를 동적으로 조절
     height = max(4, len(sentences) * 0.5)
-    fig, ax = plt.subplots(figsize=(8, height))
+    fig = Figure(figsize=(8, height))
+    ax = fig.subplots()
 
     y_pos = range(len(sentences))
     ax.barh(y_pos, scores, color=colors, align='center')
@@ -105,8 +112,8 @@ def create_sentence_score_bar_chart(judgments: list, title: str) -> Figure | Non
         ax.text(score + (0.01 if score >= 0 else -0.01), i, f'{score:.2f}', 
                 va='center', ha='left' if score >= 0 else 'right', fontsize=8)
 
-    plt.grid(axis='x', linestyle='--', alpha=0.6)
-    plt.tight_layout()
+    ax.grid(axis='x', linestyle='--', alpha=0.6)
+    fig.tight_layout()
 
     return fig
 
@@ -130,7 +137,8 @@ def create_satisfaction_level_bar_chart(satisfaction_counts: dict, title: str) -
     }
     bar_colors = [colors[label] for label in labels]
 
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
 
     bars = ax.bar(labels, counts, color=bar_colors)
 
@@ -147,7 +155,7 @@ def create_satisfaction_level_bar_chart(satisfaction_counts: dict, title: str) -
     # Y축을 정수 눈금으로 설정
     ax.yaxis.set_major_locator(MaxNLocator(integer=True))
 
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 def create_absolute_score_line_chart(scores: list, title: str) -> Figure | None:
@@ -164,7 +172,8 @@ def create_absolute_score_line_chart(scores: list, title: str) -> Figure | None:
     # 각 구간에 속하는 점수의 개수 계산
     hist, _ = np.histogram(scores, bins=bins)
     
-    fig, ax = plt.subplots(figsize=(10, 6))
+    fig = Figure(figsize=(10, 6))
+    ax = fig.subplots()
 
     # 꺾은선 그래프 생성
     ax.plot(labels, hist, marker='o', linestyle='-', color='dodgerblue')
@@ -181,14 +190,15 @@ def create_absolute_score_line_chart(scores: list, title: str) -> Figure | None:
     # Y축을 정수 눈금으로 설정
     ax.yaxis.set_major_locator(MaxNLocator(integer=True))
     
-    plt.tight_layout()
+    fig.tight_layout()
     return fig
 
 def create_outlier_boxplot(scores: list, title: str) -> Figure | None:
     if not scores:
         return None
 
-    fig, ax = plt.subplots(figsize=(10, 4))
+    fig = Figure(figsize=(10, 4))
+    ax = fig.subplots()
 
     # Box plot
     ax.boxplot(scores, vert=False, patch_artist=True,
@@ -216,6 +226,6 @@ def create_outlier_boxplot(scores: list, title: str) -> Figure | None:
             transform=ax.transAxes,
             color='red', fontsize=12)
 
-    plt.grid(axis='x', linestyle='--', alpha=0.7)
-    plt.tight_layout()
+    ax.grid(axis='x', linestyle='--', alpha=0.7)
+    fig.tight_layout()
     return fig
\ No newline at end of file
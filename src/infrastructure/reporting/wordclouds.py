@@ -7,6 +7,7 @@ import numpy as np
 from PIL import Image
 import traceback
 from collections import defaultdict
+from io import BytesIO
 
 # 감성 사전을 불러오기 위해 knowledge_base 임포트
 from src.domain.knowledge_base import knowledge_base
@@ -27,6 +28,9 @@ STOPWORDS = set([
     '우리', '다른', '모든', '여러', '각종', '다양한', '함께', '직접', '역시', '일단', '사실', '주차', '이용', '가능'
 ])
 
+# 워드클라우드에 표시할 최대 단어 수
+WORDCLOUD_MAX_WORDS = 100
+
 FONT_PATHS = [
     'C:/gemini_translation/폰트/maplestory_regular.ttf',
     'C:/gemini_translation/폰트/dunggeunmo.ttf',
@@ -47,6 +51,79 @@ def positive_color_func(word, font_size, position, orientation, random_state=Non
 def negative_color_func(word, font_size, position, orientation, random_state=None, **kwargs):
     return f"hsl(0, 100%, {random_state.randint(30, 60)}%)"
 
+def aspect_word_frequencies(aspect_sentiment_pairs: list, keyword: str) -> tuple[dict, dict]:
+    """(주체, 감성어) 쌍을 감성어의 대표 점수로 합산해 긍정/부정 워드클라우드용 {주체: 가중치}를 만듭니다."""
+    # 감성 점수를 합산할 딕셔너리
+    positive_scores = defaultdict(float)
+    negative_scores = defaultdict(float)
+
+    # 감성어별 대표 점수(절댓값이 가장 큰 점수)는 사전 스냅샷에 미리 계산되어 있음
+    representative_scores = knowledge_base.lexicon.representative_scores
+
+    # 입력받은 (주체, 감성) 쌍을 순회
+    for aspect, sentiment in aspect_sentiment_pairs:
+        # 주체가 유효한지 검사
+        if not aspect or len(aspect) < 2 or aspect in STOPWORDS or keyword in aspect:
+            continue
+
+        # 감성어의 점수를 사전에서 조회
+        if sentiment in representative_scores:
+            representative_score = representative_scores[sentiment]
+
+            if representative_score > 0:
+                positive_scores[aspect] += representative_score
+            elif representative_score < 0:
+                negative_scores[aspect] += abs(representative_score)
+
+    return dict(positive_scores), dict(negative_scores)
+
+def top_words(frequencies: dict, limit: int = WORDCLOUD_MAX_WORDS) -> dict:
+    """워드클라우드에 실제로 그려질 상위 limit개 단어의 {단어: 가중치} (프론트엔드 렌더링용)."""
+    ranked = sorted(frequencies.items(), key=lambda item: item[1], reverse=True)[:limit]
+    return {word: round(weight, 3) for word, weight in ranked}
+
+def load_mask_array(mask_path: str | None):
+    if not mask_path:
+        print(f"[WordCloud] No mask_path provided, using default square shape")
+        return None
+    print(f"[WordCloud] Attempting to load mask from: {mask_path}")
+    if not os.path.exists(mask_path):
+        print(f"[WordCloud] Mask file does not exist at: {mask_path}")
+        return None
+    try:
+        with Image.open(mask_path) as img:
+            mask_array = np.array(img.convert("L"), dtype=np.uint8)
+        print(f"[WordCloud] Mask loaded successfully! Shape: {mask_array.shape}")
+        return mask_array
+    except Exception as e:
+        print(f"[WordCloud] Error loading mask image: {e}")
+        return None
+
+def _build_wordcloud(frequencies: dict, positive: bool, font_path: str, mask_array) -> WordCloud:
+    wc = WordCloud(
+        font_path=font_path, width=800, height=800,
+        background_color='white', mask=mask_array,
+        max_words=WORDCLOUD_MAX_WORDS, contour_width=1,
+        color_func=positive_color_func if positive else negative_color_func,
+        contour_color='blue' if positive else 'red',
+    )
+    return wc.generate_from_frequencies(frequencies)
+
+def render_wordcloud_png(frequencies: dict, positive: bool, mask_path: str = None) -> bytes | None:
+    """
+    {단어: 가중치}로 워드클라우드를 그려 PNG 바이트로 반환합니다 (파일을 남기지 않음).
+    사전을 읽지 않으므로 차트 렌더링 프로세스에서 실행할 수 있습니다.
+    """
+    if not frequencies:
+        return None
+    font_path = find_font_path()
+    if not font_path:
+        return None
+    image = _build_wordcloud(frequencies, positive, font_path, load_mask_array(mask_path)).to_image()
+    buf = BytesIO()
+    image.save(buf, format="PNG")
+    return buf.getvalue()
+
 # 함수의 시그니처를 text 대신 aspect_sentiment_pairs를 받도록 변경
 def create_sentiment_wordclouds(aspect_sentiment_pairs: list, keyword: str, mask_path: str = None) -> tuple[str | None, str | None]:
     if not aspect_sentiment_pairs:
@@ -57,71 +134,23 @@ def create_sentiment_wordclouds(aspect_sentiment_pairs: list, keyword: str, mask
         if not font_path:
             return None, None
 
-        # 감성 점수를 합산할 딕셔너리
-        positive_scores = defaultdict(float)
-        negative_scores = defaultdict(float)
-
-        sentiment_dictionaries = {
-            **knowledge_base.adjectives,
-            **knowledge_base.adverbs,
-            **knowledge_base.sentiment_nouns,
-            **knowledge_base.idioms
-        }
-
-        # 입력받은 (주체, 감성) 쌍을 순회
-        for aspect, sentiment in aspect_sentiment_pairs:
-            # 주체가 유효한지 검사
-            if not aspect or len(aspect) < 2 or aspect in STOPWORDS or keyword in aspect:
-                continue
-            
-            # 감성어의 점수를 사전에서 조회
-            if sentiment in sentiment_dictionaries:
-                scores = sentiment_dictionaries[sentiment]
-                if not scores: continue
-                
-                representative_score = max(scores, key=abs)
-
-                if representative_score > 0:
-                    positive_scores[aspect] += representative_score
-                elif representative_score < 0:
-                    negative_scores[aspect] += abs(representative_score)
-        
-        mask_array = None
-        if mask_path:
-            print(f"[WordCloud] Attempting to load mask from: {mask_path}")
-            if os.path.exists(mask_path):
-                try:
-                    img = Image.open(mask_path).convert("L")
-                    mask_array = np.array(img, dtype=np.uint8)
-                    print(f"[WordCloud] Mask loaded successfully! Shape: {mask_array.shape}")
-                except Exception as e:
-                    print(f"[WordCloud] Error loading mask image: {e}")
-                    mask_array = None
-            else:
-                print(f"[WordCloud] Mask file does not exist at: {mask_path}")
-        else:
-            print(f"[WordCloud] No mask_path provided, using default square shape")
-
-        common_wc_args = {
-            "font_path": font_path, "width": 800, "height": 800,
-            "background_color": 'white', "mask": mask_array,
-            "max_words": 100, "contour_width": 1
-        }
-        
+        positive_scores, negative_scores = aspect_word_frequencies(aspect_sentiment_pairs, keyword)
+        mask_array = load_mask_array(mask_path)
+
         temp_dir = os.path.join(os.getcwd(), "temp_images")
         os.makedirs(temp_dir, exist_ok=True)
         sanitized_keyword = re.sub(r'[\\/:*?"<>|]', '_', keyword)
 
         positive_wc_path = None
         if positive_scores:
-            wc_pos = WordCloud(**common_wc_args, color_func=positive_color_func, contour_color='blue').generate_from_frequencies(positive_scores)
+            wc_pos = _build_wordcloud(positive_scores, True, font_path, mask_array)
             positive_wc_path = os.path.join(temp_dir, f"wc_pos_{sanitized_keyword}_{uuid.uuid4()}.png")
             wc_pos.to_file(positive_wc_path)
             print(f"[WordCloud] Positive Aspect WC generated: {positive_wc_path}")
 
         negative_wc_path = None
         if negative_scores:
-            wc_neg = WordCloud(**common_wc_args, color_func=negative_color_func, contour_color='red').generate_from_frequencies(negative_scores)
+            wc_neg = _build_wordcloud(negative_scores, False, font_path, mask_array)
             negative_wc_path = os.path.join(temp_dir, f"wc_neg_{sanitized_keyword}_{uuid.uuid4()}.png")
             wc_neg.to_file(negative_wc_path)
             print(f"[WordCloud] Negative Aspect WC generated: {negative_wc_path}")
@@ -131,4 +160,4 @@ def create_sentiment_wordclouds(aspect_sentiment_pairs: list, keyword: str, mask
     except Exception as e:
         print(f"[WordCloud] Error during aspect-based WC generation: {e}")
         traceback.print_exc()
-        return None, None
\ No newline at end of file
+        return None, None
@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from src.infrastructure.cache.single_flight import SingleFlight
+
+
+def test_cancelled_first_caller_does_not_cancel_other_callers():
+    # The first caller (e.g. a speculative page task) is cancelled while an
+    # unrelated request waits on the same key: that request must still get the result
+    async def scenario():
+        flight = SingleFlight()
+        calls = 0
+        release = asyncio.Event()
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return "result"
+
+        first = asyncio.create_task(flight.share("prompt", work))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(flight.share("prompt", work))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert await second == "result"
+        assert calls == 1
+        assert flight.coalesced == 1
+        assert flight.in_flight() == 0
+
+    asyncio.run(scenario())
+
+
+def test_call_is_cancelled_when_every_caller_leaves():
+    async def scenario():
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def work():
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        callers = [asyncio.create_task(flight.share("prompt", work)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for caller in callers:
+            caller.cancel()
+        await asyncio.gather(*callers, return_exceptions=True)
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+        assert flight.in_flight() == 0
+
+    asyncio.run(scenario())
+
+
+def test_failure_is_shared_and_key_is_released():
+    async def scenario():
+        flight = SingleFlight()
+        calls = 0
+
+        async def work():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            flight.share("prompt", work), flight.share("prompt", work), return_exceptions=True
+        )
+        assert [type(result) for result in results] == [ValueError, ValueError]
+        assert calls == 1
+        assert flight.in_flight() == 0
+
+    asyncio.run(scenario())